@@ -7,6 +7,9 @@ This module implements composite metrics derived from H, V, α parameters:
 - d_φ (Distance to Golden Ratio): Optimality metric
 - CHI (Constitutional Health Index): Diagnostic metric
 
+All metrics are returned at full precision; rounding (e.g. to 3 decimals
+as in the paper's tables) is left to the presentation layer.
+
 Based on:
 Lerer, I.A. (2025). "Darwinian Spaces and the Golden Ratio"
 
@@ -14,22 +17,244 @@ Author: Ignacio Adrian Lerer
 License: MIT
 """
 
+import math
 import numpy as np
-from typing import Optional, Tuple
+from numpy.typing import ArrayLike
+from collections import namedtuple
+from collections.abc import Mapping
+from dataclasses import dataclass, asdict, fields
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 import warnings
 
+from ._kernels import USE_NUMBA
+
+njit = None
+if USE_NUMBA:
+    try:
+        from numba import njit, guvectorize, float64
+        from numba.types import UniTuple
+    except ImportError:  # Optional dependency: fall back to pure Python
+        pass
+
+try:
+    import numexpr as ne
+except ImportError:  # Optional dependency: fall back to NumPy
+    ne = None
+
 
 # Golden Ratio constant
-PHI = (1 + np.sqrt(5)) / 2  # ≈ 1.618
+PHI = (1 + math.sqrt(5)) / 2  # ≈ 1.618
 
+# Goldilocks Score optima and inverse squared tolerances (σ_φ=0.5, σ_V=σ_α=0.2)
+_V_OPT = 0.6
+_ALPHA_OPT = 0.7
+_INV_SIGMA_PHI_SQ = (1 / 0.5) ** 2
+_INV_SIGMA_V_SQ = (1 / 0.2) ** 2
+_INV_SIGMA_ALPHA_SQ = (1 / 0.2) ** 2
 
-def calculate_LEI(
+
+def _validate_unit_interval(**params: np.ndarray) -> None:
+    """Raise ValueError if any parameter array has entries outside [0, 1]."""
+    for name, arr in params.items():
+        if not np.all((arr >= 0) & (arr <= 1)):
+            raise ValueError(f"{name} must be in [0, 1], got {arr}")
+
+
+def _check_unit_interval(H: float, V: float, alpha: float) -> None:
+    """Scalar validation: one chained comparison on the common (valid) path."""
+    if not (0 <= H <= 1 and 0 <= V <= 1 and 0 <= alpha <= 1):
+        # Slow path, only to name the offending parameter
+        for param, name in [(H, 'H'), (V, 'V'), (alpha, 'alpha')]:
+            if not 0 <= param <= 1:
+                raise ValueError(f"{name} must be in [0, 1], got {param}")
+
+
+def _as_output(arr: np.ndarray) -> Union[float, np.ndarray]:
+    """Return a Python float for 0-d results, the array otherwise."""
+    return arr.item() if arr.ndim == 0 else arr
+
+
+def _as_arrays(*params: ArrayLike) -> Tuple[np.ndarray, ...]:
+    """Convert parameters to float arrays (0-d for scalars)."""
+    return tuple(np.asarray(p, dtype=float) for p in params)
+
+
+def _is_scalar(*params) -> bool:
+    """True if every parameter is a plain (Python or NumPy) real number."""
+    return all(isinstance(p, (int, float, np.integer, np.floating))
+               for p in params)
+
+
+# Intermediate and composite values produced by one pass of _core()
+CoreMetrics = namedtuple('CoreMetrics', ['HV_ratio', 'd_phi', 'LEI', 'CHI'])
+
+# Below this many elements NumExpr's setup cost outweighs its cache tiling
+_NUMEXPR_MIN_SIZE = 10_000
+
+
+def _core(
+    H: np.ndarray,
+    V: np.ndarray,
+    alpha: np.ndarray,
+    phi: float = PHI,
+    epsilon: float = 0.1
+) -> CoreMetrics:
+    """
+    Fused kernel computing H/V, d_φ, LEI and CHI in a single pass.
+    
+    H/V and |H/V - φ| are evaluated once and shared by every composite
+    metric. Inputs must already be validated float arrays; entries with
+    V=0 get d_φ=10.0 and LEI=0.0, matching the public functions.
+    
+    Large inputs are evaluated with NumExpr when it is installed, which
+    streams the composite expressions through cache-sized blocks (on
+    several threads) instead of materializing a temporary per operation.
+    """
+    if ne is not None and np.broadcast(H, V, alpha).size >= _NUMEXPR_MIN_SIZE:
+        variables = {'H': H, 'V': V, 'alpha': alpha, 'phi': phi, 'eps': epsilon}
+        HV_ratio = ne.evaluate('H / V', local_dict=variables)
+        variables['HV_ratio'] = HV_ratio
+        d_phi = ne.evaluate('where(V == 0, 10.0, abs(HV_ratio - phi))',
+                            local_dict=variables)
+        LEI = ne.evaluate('where(V == 0, 0.0, (V * alpha) / (abs(HV_ratio - phi) + eps))',
+                          local_dict=variables)
+        variables['d_phi'] = d_phi
+        CHI = ne.evaluate('(H * V * alpha) / (1 + d_phi)', local_dict=variables)
+        return CoreMetrics(HV_ratio, d_phi, LEI, CHI)
+    
+    zero_V = V == 0
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        HV_ratio = H / V
+        distance_phi = np.abs(HV_ratio - phi)
+        LEI = np.where(zero_V, 0.0, (V * alpha) / (distance_phi + epsilon))
+    
+    d_phi = np.where(zero_V, 10.0, distance_phi)
+    CHI = (H * V * alpha) / (1 + d_phi)
+    
+    return CoreMetrics(HV_ratio, d_phi, LEI, CHI)
+
+
+def _core_scalar_py(
     H: float,
     V: float,
     alpha: float,
+    phi: float,
+    epsilon: float
+) -> Tuple[float, float, float, float]:
+    """
+    Scalar counterpart of _core() returning (H/V, d_φ, LEI, CHI).
+    
+    Used for one-country-at-a-time calls, where building 0-d arrays costs
+    far more than the arithmetic itself. Compiled with Numba when available.
+    """
+    if V == 0:
+        return math.inf, 10.0, 0.0, 0.0
+    
+    HV_ratio = H / V
+    distance_phi = math.fabs(HV_ratio - phi)
+    LEI = (V * alpha) / (distance_phi + epsilon)
+    CHI = (H * V * alpha) / (1 + distance_phi)
+    
+    return HV_ratio, distance_phi, LEI, CHI
+
+
+if njit is not None:
+    # Validation stays in the Python wrappers; the kernel is pure arithmetic.
+    # cache=True persists the compiled kernel so compilation happens once.
+    _core_scalar = njit(
+        UniTuple(float64, 4)(float64, float64, float64, float64, float64),
+        cache=True, fastmath=True
+    )(_core_scalar_py)
+else:
+    _core_scalar = _core_scalar_py
+
+
+# Below this many systems the threaded gufunc is slower than plain NumPy
+_GUFUNC_MIN_SIZE = 10_000
+
+if njit is not None:
+    @guvectorize(
+        [(float64[:], float64[:], float64[:],
+          float64[:], float64[:], float64[:], float64[:], float64[:])],
+        '(n),(n),(n)->(n),(n),(n),(n),(n)',
+        target='parallel', cache=True
+    )
+    def _metrics_gufunc(H, V, alpha, HV_ratio, d_phi, LEI, CHI, GS):
+        """
+        Fused, multithreaded batch kernel: H/V, d_φ, LEI, CHI and Goldilocks
+        Score for every system in one pass over the inputs.
+        """
+        for i in range(H.shape[0]):
+            HV_ratio[i], d_phi[i], LEI[i], CHI[i] = _core_scalar(
+                H[i], V[i], alpha[i], PHI, 0.1)
+            dv = V[i] - _V_OPT
+            da = alpha[i] - _ALPHA_OPT
+            GS[i] = math.exp(-(d_phi[i] * d_phi[i] * _INV_SIGMA_PHI_SQ +
+                               dv * dv * _INV_SIGMA_V_SQ +
+                               da * da * _INV_SIGMA_ALPHA_SQ))
+else:
+    _metrics_gufunc = None
+
+
+# Zone labels indexed by the integer codes of _zone_code() (Table 5.1)
+ZONE_NAMES = (
+    "Goldilocks Zone",                        # 0
+    "High Rigidity Zone (Terminal Lock-in)",  # 1
+    "High Rigidity Zone",                     # 2
+    "High Chaos Zone",                        # 3
+    "Low Selection Zone",                     # 4
+    "Low Variation Zone",                     # 5
+    "Transition Zone",                        # 6
+    "Low Variation Zone (Undefined H/V)",     # 7
+)
+_ZONE_NAMES_ARRAY = np.array(ZONE_NAMES)
+
+# Rigidity / chaos H/V thresholds for the default φ
+_PHI_UPPER = PHI + 1.5  # H/V > 3.1: High Rigidity
+_PHI_LOWER = PHI - 1.0  # H/V < 0.6: High Chaos
+
+
+def _zone_bounds(phi: float) -> Tuple[float, float]:
+    """(rigidity, chaos) H/V thresholds; precomputed for the default φ."""
+    if phi == PHI:
+        return _PHI_UPPER, _PHI_LOWER
+    return phi + 1.5, phi - 1.0
+
+
+def _zone_code(
+    HV_ratio: np.ndarray,
+    d_phi: np.ndarray,
+    V: np.ndarray,
+    alpha: np.ndarray,
+    phi: float = PHI
+) -> np.ndarray:
+    """
+    Vectorized zone classification returning integer codes into ZONE_NAMES.
+    
+    Predicates are applied in the same precedence as classify_zone():
+    V=0, Goldilocks, High Rigidity (split on α < 0.2), High Chaos,
+    Low Selection, Low Variation, otherwise Transition.
+    """
+    upper, lower = _zone_bounds(phi)
+    rigidity = np.where(alpha < 0.2, 1, 2)
+    code = np.where(
+        (d_phi < 0.5) & (alpha > 0.5) & (V > 0.4), 0,
+        np.where(HV_ratio > upper, rigidity,
+        np.where(HV_ratio < lower, 3,
+        np.where(alpha < 0.3, 4,
+        np.where(V < 0.3, 5, 6)))))
+    return np.where(V == 0, 7, code)
+
+
+def calculate_LEI(
+    H: ArrayLike,
+    V: ArrayLike,
+    alpha: ArrayLike,
     phi: float = PHI,
     epsilon: float = 0.1
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Calculate Legal Evolvability Index (LEI).
     
@@ -42,15 +267,17 @@ def calculate_LEI(
     - Proximity to optimal H/V ratio (distance from φ)
     
     Args:
-        H (float): Heredity parameter [0, 1]
-        V (float): Variation parameter [0, 1]
-        alpha (float): Differential fitness parameter [0, 1]
+        H (float or array): Heredity parameter [0, 1]
+        V (float or array): Variation parameter [0, 1]
+        alpha (float or array): Differential fitness parameter [0, 1]
         phi (float, optional): Target ratio (default: Golden Ratio ≈ 1.618)
         epsilon (float, optional): Smoothing constant to avoid division by zero
             Default: 0.1 (prevents infinite LEI when H/V = φ)
     
     Returns:
-        float: LEI value (typically [0, 2], viable systems > 0.1)
+        float or ndarray: LEI value (typically [0, 2], viable systems > 0.1).
+            A float for scalar inputs, an array (broadcast shape) otherwise.
+            Entries with V=0 are 0.0.
     
     Interpretation:
         LEI > 1.0:   High evolvability (Goldilocks Zone)
@@ -61,7 +288,7 @@ def calculate_LEI(
     Example:
         >>> # USA (viable system)
         >>> calculate_LEI(H=0.72, V=0.63, alpha=0.58)
-        0.642
+        0.635
         
         >>> # Argentina labor (locked-in)
         >>> calculate_LEI(H=0.92, V=0.18, alpha=0.09)
@@ -70,6 +297,12 @@ def calculate_LEI(
         >>> # France (optimal)
         >>> calculate_LEI(H=0.78, V=0.75, alpha=0.82)
         1.284
+        
+        >>> # Whole dataset in one call
+        >>> np.round(calculate_LEI(H=np.array([0.72, 0.92]),
+        ...                        V=np.array([0.63, 0.18]),
+        ...                        alpha=np.array([0.58, 0.09])), 3)
+        array([0.635, 0.005])
     
     Mathematical Justification:
         - Numerator (V × α): Effective variation under selection
@@ -80,32 +313,28 @@ def calculate_LEI(
         - Section IV.B: "LEI as Composite Metric"
         - Appendix D.1: "Lagrangian Derivation of φ Optimum"
     """
-    # Input validation
-    for param, name in [(H, 'H'), (V, 'V'), (alpha, 'alpha')]:
-        if not 0 <= param <= 1:
-            raise ValueError(f"{name} must be in [0, 1], got {param}")
+    if _is_scalar(H, V, alpha):
+        _check_unit_interval(H, V, alpha)
+        if V == 0:
+            warnings.warn("V=0 leads to undefined H/V ratio. Returning LEI=0.")
+        return _core_scalar(H, V, alpha, phi, epsilon)[2]
     
-    if V == 0:
-        warnings.warn("V=0 leads to undefined H/V ratio. Returning LEI=0.")
-        return 0.0
+    H, V, alpha = _as_arrays(H, V, alpha)
     
-    # Calculate H/V ratio
-    HV_ratio = H / V
-    
-    # Distance from golden ratio
-    distance_phi = abs(HV_ratio - phi)
+    # Input validation
+    _validate_unit_interval(H=H, V=V, alpha=alpha)
     
-    # LEI formula
-    LEI = (V * alpha) / (distance_phi + epsilon)
+    if np.any(V == 0):
+        warnings.warn("V=0 leads to undefined H/V ratio. Returning LEI=0.")
     
-    return round(LEI, 3)
+    return _as_output(_core(H, V, alpha, phi, epsilon).LEI)
 
 
 def calculate_d_phi(
-    H: float,
-    V: float,
+    H: ArrayLike,
+    V: ArrayLike,
     phi: float = PHI
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Calculate distance to Golden Ratio (d_φ).
     
@@ -115,12 +344,13 @@ def calculate_d_phi(
     Formula: d_φ = |H/V - φ|
     
     Args:
-        H (float): Heredity parameter [0, 1]
-        V (float): Variation parameter [0, 1]
+        H (float or array): Heredity parameter [0, 1]
+        V (float or array): Variation parameter [0, 1]
         phi (float, optional): Target ratio (default: Golden Ratio)
     
     Returns:
-        float: d_φ value (≥ 0, lower is better)
+        float or ndarray: d_φ value (≥ 0, lower is better). Entries with
+            V=0 are reported as 10.0.
     
     Interpretation:
         d_φ < 0.3:   Near-optimal (Goldilocks Zone)
@@ -131,7 +361,7 @@ def calculate_d_phi(
     Example:
         >>> # USA (close to optimal)
         >>> calculate_d_phi(H=0.72, V=0.63)
-        0.525  # (0.72/0.63 = 1.143, |1.143 - 1.618| = 0.475)
+        0.475  # (0.72/0.63 = 1.143, |1.143 - 1.618| = 0.475)
         
         >>> # Argentina labor (far from optimal)
         >>> calculate_d_phi(H=0.92, V=0.18)
@@ -150,22 +380,25 @@ def calculate_d_phi(
         - Section III.D: "The Golden Ratio as Optimum"
         - Section VIII.C: "Transplant Success Prediction"
     """
-    if V == 0:
-        warnings.warn("V=0 leads to infinite d_φ. Returning large value (10.0).")
-        return 10.0
+    if _is_scalar(H, V):
+        if V == 0:
+            warnings.warn("V=0 leads to infinite d_φ. Returning large value (10.0).")
+        return _core_scalar(H, V, 0.0, phi, 0.1)[1]
     
-    HV_ratio = H / V
-    d_phi_value = abs(HV_ratio - phi)
+    H, V = _as_arrays(H, V)
     
-    return round(d_phi_value, 3)
+    if np.any(V == 0):
+        warnings.warn("V=0 leads to infinite d_φ. Returning large value (10.0).")
+    
+    return _as_output(_core(H, V, 0.0, phi).d_phi)
 
 
 def calculate_CHI(
-    H: float,
-    V: float,
-    alpha: float,
+    H: ArrayLike,
+    V: ArrayLike,
+    alpha: ArrayLike,
     phi: float = PHI
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Calculate Constitutional Health Index (CHI).
     
@@ -180,11 +413,11 @@ def calculate_CHI(
         - Range: [0, 1], higher is healthier
     
     Args:
-        H, V, alpha: Darwinian parameters [0, 1]
+        H, V, alpha: Darwinian parameters [0, 1] (floats or arrays)
         phi: Target ratio (default: Golden Ratio)
     
     Returns:
-        float: CHI value [0, 1]
+        float or ndarray: CHI value [0, 1]
     
     Interpretation:
         CHI > 0.8:   Excellent health (top 20% globally)
@@ -200,7 +433,7 @@ def calculate_CHI(
         
         >>> # USA (good health, declining)
         >>> calculate_CHI(H=0.72, V=0.63, alpha=0.58)
-        0.651
+        0.178
         
         >>> # Argentina labor (critical)
         >>> calculate_CHI(H=0.92, V=0.18, alpha=0.09)
@@ -215,18 +448,21 @@ def calculate_CHI(
         - Section IX.A: "Constitutional Health Index"
         - Figure 9.1: "CHI Global Map"
     """
-    # Input validation
-    for param, name in [(H, 'H'), (V, 'V'), (alpha, 'alpha')]:
-        if not 0 <= param <= 1:
-            raise ValueError(f"{name} must be in [0, 1], got {param}")
+    if _is_scalar(H, V, alpha):
+        _check_unit_interval(H, V, alpha)
+        if V == 0:
+            warnings.warn("V=0 leads to infinite d_φ. Returning large value (10.0).")
+        return _core_scalar(H, V, alpha, phi, 0.1)[3]
     
-    # Calculate d_φ
-    d_phi_value = calculate_d_phi(H, V, phi)
+    H, V, alpha = _as_arrays(H, V, alpha)
     
-    # CHI formula
-    CHI = (H * V * alpha) / (1 + d_phi_value)
+    # Input validation
+    _validate_unit_interval(H=H, V=V, alpha=alpha)
+    
+    if np.any(V == 0):
+        warnings.warn("V=0 leads to infinite d_φ. Returning large value (10.0).")
     
-    return round(CHI, 3)
+    return _as_output(_core(H, V, alpha, phi).CHI)
 
 
 def classify_zone(
@@ -260,34 +496,39 @@ def classify_zone(
         'High Rigidity Zone (Terminal Lock-in)'
     """
     if V == 0:
-        return "Low Variation Zone (Undefined H/V)"
+        return ZONE_NAMES[7]
     
     HV_ratio = H / V
-    d_phi_value = abs(HV_ratio - phi)
-    
-    # Zone classification logic (Table 5.1)
-    if d_phi_value < 0.5 and alpha > 0.5 and V > 0.4:
-        return "Goldilocks Zone"
-    elif HV_ratio > (phi + 1.5):  # H/V > 3.1
-        if alpha < 0.2:
-            return "High Rigidity Zone (Terminal Lock-in)"
-        else:
-            return "High Rigidity Zone"
-    elif HV_ratio < (phi - 1.0):  # H/V < 0.6
-        return "High Chaos Zone"
-    elif alpha < 0.3:
-        return "Low Selection Zone"
-    elif V < 0.3:
-        return "Low Variation Zone"
-    else:
-        return "Transition Zone"
+    return _classify_from_ratio(HV_ratio, math.fabs(HV_ratio - phi), V, alpha, phi)
+
+
+def _classify_from_ratio(
+    HV_ratio: float,
+    d_phi: float,
+    V: float,
+    alpha: float,
+    phi: float = PHI
+) -> str:
+    """Scalar zone classification from an already computed H/V and d_φ (V > 0)."""
+    upper, lower = _zone_bounds(phi)
+    
+    # Zone classification logic (Table 5.1); codes index ZONE_NAMES and
+    # follow the same precedence as the vectorized _zone_code()
+    code = (0 if d_phi < 0.5 and alpha > 0.5 and V > 0.4 else
+            (1 if alpha < 0.2 else 2) if HV_ratio > upper else  # H/V > 3.1
+            3 if HV_ratio < lower else                          # H/V < 0.6
+            4 if alpha < 0.3 else
+            5 if V < 0.3 else
+            6)
+    return ZONE_NAMES[code]
 
 
 def goldilocks_score(
     H: float,
     V: float,
     alpha: float,
-    phi: float = PHI
+    phi: float = PHI,
+    d_phi: Optional[float] = None
 ) -> float:
     """
     Calculate proximity to Goldilocks Zone (0-1 score).
@@ -302,6 +543,8 @@ def goldilocks_score(
     Args:
         H, V, alpha: Darwinian parameters
         phi: Target ratio
+        d_phi: Precomputed distance to φ, if already available (skips
+            recomputing H/V)
     
     Returns:
         float: Goldilocks Score [0, 1], where 1.0 = perfect
@@ -313,29 +556,24 @@ def goldilocks_score(
         
         >>> # USA (good but declining)
         >>> goldilocks_score(H=0.72, V=0.63, alpha=0.58)
-        0.712
+        0.276
         
         >>> # Argentina labor (far from ideal)
         >>> goldilocks_score(H=0.92, V=0.18, alpha=0.09)
         0.042
     """
-    # Optimal values and tolerances
-    V_opt = 0.6
-    alpha_opt = 0.7
-    sigma_phi = 0.5
-    sigma_V = 0.2
-    sigma_alpha = 0.2
-    
     # Calculate deviations
-    d_phi_value = calculate_d_phi(H, V, phi)
-    dev_phi = (d_phi_value / sigma_phi) ** 2
-    dev_V = ((V - V_opt) / sigma_V) ** 2
-    dev_alpha = ((alpha - alpha_opt) / sigma_alpha) ** 2
+    d_phi_value = calculate_d_phi(H, V, phi) if d_phi is None else d_phi
+    dv = V - _V_OPT
+    da = alpha - _ALPHA_OPT
+    dev_phi = d_phi_value * d_phi_value * _INV_SIGMA_PHI_SQ
+    dev_V = dv * dv * _INV_SIGMA_V_SQ
+    dev_alpha = da * da * _INV_SIGMA_ALPHA_SQ
     
     # Gaussian-like score
-    GS = np.exp(-(dev_phi + dev_V + dev_alpha))
+    GS = math.exp(-(dev_phi + dev_V + dev_alpha))
     
-    return round(GS, 3)
+    return GS
 
 
 def predict_viability(
@@ -359,12 +597,19 @@ def predict_viability(
     
     Example:
         >>> predict_viability(H=0.72, V=0.63, alpha=0.58)
-        (True, "Viable: LEI=0.642 (well above threshold 0.1)")
+        (True, "Viable: LEI=0.635 (moderate evolvability)")
         
         >>> predict_viability(H=0.92, V=0.18, alpha=0.09)
         (False, "Terminal Lock-in: LEI=0.005 (far below threshold 0.1)")
     """
-    LEI_value = calculate_LEI(H, V, alpha)
+    return _diagnose_viability(calculate_LEI(H, V, alpha), threshold_LEI)
+
+
+def _diagnose_viability(
+    LEI_value: float,
+    threshold_LEI: float = 0.1
+) -> Tuple[bool, str]:
+    """Viability verdict and diagnosis from an already computed LEI."""
     is_viable = LEI_value > threshold_LEI
     
     if is_viable:
@@ -383,13 +628,83 @@ def predict_viability(
     return is_viable, diagnosis
 
 
+@dataclass(slots=True)
+class CountryMetrics(Mapping):
+    """
+    Container for the full metric report of one legal system.
+    
+    A read-only Mapping over its field names, so code written against the
+    former dict return value (keys(), items(), get(), `in`, **metrics,
+    pd.DataFrame([...])) keeps working.
+    """
+    country: str
+    H: float
+    V: float
+    alpha: float
+    LEI: float
+    d_phi: float
+    CHI: float
+    goldilocks_score: float
+    zone: str
+    viable: bool
+    viability_message: str
+    
+    def asdict(self) -> dict:
+        """Return the metrics as a plain dictionary."""
+        return asdict(self)
+    
+    def __getitem__(self, key: str):
+        """Dictionary-style access (metrics['LEI']) for backward compatibility."""
+        if key not in _COUNTRY_METRICS_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(_COUNTRY_METRICS_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(_COUNTRY_METRICS_FIELDS)
+
+
+# Mapping keys of CountryMetrics: exactly its data fields, in order
+_COUNTRY_METRICS_FIELDS = tuple(f.name for f in fields(CountryMetrics))
+_COUNTRY_METRICS_KEYS = frozenset(_COUNTRY_METRICS_FIELDS)
+
+
+@lru_cache(maxsize=4096)
+def _compute_metrics(
+    H: float,
+    V: float,
+    alpha: float
+) -> Tuple[float, float, float, float, str, bool, str]:
+    """
+    Pure, memoized part of comprehensive_metrics().
+    
+    Returns (LEI, d_φ, CHI, Goldilocks Score, zone, viable, viability message).
+    Keyed only on (H, V, α), so repeated evaluations of the same system -
+    e.g. grid searches over reform scenarios - are a single dict lookup, and
+    differently named systems with identical parameters share one entry.
+    Inputs must already be validated.
+    """
+    # H/V and d_φ are computed once here and shared by every downstream metric
+    HV_ratio, d_phi_value, LEI_value, CHI_value = _core_scalar(H, V, alpha, PHI, 0.1)
+    if V == 0:
+        zone = ZONE_NAMES[7]
+    else:
+        zone = _classify_from_ratio(HV_ratio, d_phi_value, V, alpha)
+    GS = goldilocks_score(H, V, alpha, d_phi=d_phi_value)
+    is_viable, viability_msg = _diagnose_viability(LEI_value)
+    
+    return LEI_value, d_phi_value, CHI_value, GS, zone, is_viable, viability_msg
+
+
 def comprehensive_metrics(
     H: float,
     V: float,
     alpha: float,
     country_name: str = "Unknown",
     verbose: bool = True
-) -> dict:
+) -> CountryMetrics:
     """
     Calculate all metrics for a legal system.
     
@@ -402,7 +717,10 @@ def comprehensive_metrics(
         verbose: If True, print formatted report
     
     Returns:
-        dict: All calculated metrics
+        CountryMetrics: All calculated metrics. Fields are available as
+            attributes or, as with the former dict, through the Mapping
+            interface (metrics['LEI'], .items(), **metrics); use .asdict()
+            for a mutable plain dictionary.
     
     Example:
         >>> metrics = comprehensive_metrics(H=0.72, V=0.63, alpha=0.58, 
@@ -415,54 +733,145 @@ def comprehensive_metrics(
           α (Diff. Fitness):       0.58
         
         Composite Metrics:
-          LEI (Evolvability):      0.642
-          d_φ (Distance to φ):     0.525
-          CHI (Health Index):      0.651
-          Goldilocks Score:        0.712
+          LEI (Evolvability):      0.635
+          d_φ (Distance to φ):     0.475
+          CHI (Health Index):      0.178
+          Goldilocks Score:        0.276
         
         Classification:
           Zone:                    Goldilocks Zone
-          Viability:               Viable: LEI=0.642 (well above threshold 0.1)
+          Viability:               Viable: LEI=0.635 (moderate evolvability)
         
-        >>> metrics['LEI']
-        0.642
+        >>> round(metrics['LEI'], 3)
+        0.635
     """
-    # Calculate all metrics
-    LEI_value = calculate_LEI(H, V, alpha)
-    d_phi_value = calculate_d_phi(H, V)
-    CHI_value = calculate_CHI(H, V, alpha)
-    zone = classify_zone(H, V, alpha)
-    GS = goldilocks_score(H, V, alpha)
-    is_viable, viability_msg = predict_viability(H, V, alpha)
-    
-    metrics = {
-        'country': country_name,
+    _check_unit_interval(H, V, alpha)
+    
+    if V == 0:
+        warnings.warn("V=0 leads to undefined H/V ratio. Returning LEI=0.")
+    
+    # Calculate all metrics (memoized on the parameter triple)
+    (LEI_value, d_phi_value, CHI_value, GS,
+     zone, is_viable, viability_msg) = _compute_metrics(H, V, alpha)
+    
+    metrics = CountryMetrics(
+        country=country_name,
+        H=H,
+        V=V,
+        alpha=alpha,
+        LEI=LEI_value,
+        d_phi=d_phi_value,
+        CHI=CHI_value,
+        goldilocks_score=GS,
+        zone=zone,
+        viable=is_viable,
+        viability_message=viability_msg
+    )
+    
+    if verbose:
+        print(format_report(metrics))
+    
+    return metrics
+
+
+def format_report(metrics: Union[CountryMetrics, dict]) -> str:
+    """
+    Format a comprehensive_metrics() result as a human-readable report.
+    
+    The report is built as one string so callers can print, log or write it
+    in a single call.
+    
+    Args:
+        metrics: Result of comprehensive_metrics() (or its .asdict())
+    
+    Returns:
+        str: Multi-line report (see comprehensive_metrics() example)
+    """
+    return "\n".join([
+        f"\n=== Legal System Metrics: {metrics['country']} ===",
+        "Parameters:",
+        f"  H (Heredity):            {metrics['H']:.2f}",
+        f"  V (Variation):           {metrics['V']:.2f}",
+        f"  α (Diff. Fitness):       {metrics['alpha']:.2f}",
+        "\nComposite Metrics:",
+        f"  LEI (Evolvability):      {metrics['LEI']:.3f}",
+        f"  d_φ (Distance to φ):     {metrics['d_phi']:.3f}",
+        f"  CHI (Health Index):      {metrics['CHI']:.3f}",
+        f"  Goldilocks Score:        {metrics['goldilocks_score']:.3f}",
+        "\nClassification:",
+        f"  Zone:                    {metrics['zone']}",
+        f"  Viability:               {metrics['viability_message']}",
+        "=" * 50,
+    ])
+
+
+def comprehensive_metrics_batch(
+    H: ArrayLike,
+    V: ArrayLike,
+    alpha: ArrayLike,
+    names: Optional[ArrayLike] = None,
+    threshold_LEI: float = 0.1
+) -> dict:
+    """
+    Calculate all metrics for many legal systems at once.
+    
+    Vectorized counterpart of comprehensive_metrics() for whole datasets
+    (e.g. the n=165 corpus of Section IX): every metric is computed with a
+    handful of NumPy operations over the full arrays instead of one Python
+    call chain per country. Nothing is printed.
+    
+    Args:
+        H, V, alpha: 1D arrays of Darwinian parameters [0, 1]
+        names: Optional country identifiers, one per entry
+        threshold_LEI: Viability threshold (default: 0.1)
+    
+    Returns:
+        dict: Column name -> ndarray, with keys 'country' (if names given),
+            'H', 'V', 'alpha', 'LEI', 'd_phi', 'CHI', 'goldilocks_score',
+            'zone', 'viable'. Pass to pd.DataFrame() for a tabular view.
+    
+    Example:
+        >>> import pandas as pd
+        >>> from lei_calculator.parameters import COUNTRY_PARAMETERS
+        >>> names = list(COUNTRY_PARAMETERS)
+        >>> batch = comprehensive_metrics_batch(
+        ...     [COUNTRY_PARAMETERS[c]['H'] for c in names],
+        ...     [COUNTRY_PARAMETERS[c]['V'] for c in names],
+        ...     [COUNTRY_PARAMETERS[c]['alpha'] for c in names],
+        ...     names=names
+        ... )
+        >>> df = pd.DataFrame(batch)
+    """
+    H, V, alpha = np.broadcast_arrays(*_as_arrays(H, V, alpha))
+    _validate_unit_interval(H=H, V=V, alpha=alpha)
+    
+    if _metrics_gufunc is not None and H.ndim >= 1 and H.size >= _GUFUNC_MIN_SIZE:
+        # Large ensembles (e.g. Monte-Carlo resamples): Numba parallel kernel
+        HV_ratio, d_phi, LEI, CHI, GS = _metrics_gufunc(H, V, alpha)
+    else:
+        HV_ratio, d_phi, LEI, CHI = _core(H, V, alpha)
+        
+        # Goldilocks Score (same optima and tolerances as goldilocks_score)
+        dv = V - _V_OPT
+        da = alpha - _ALPHA_OPT
+        GS = np.exp(-(d_phi * d_phi * _INV_SIGMA_PHI_SQ +
+                      dv * dv * _INV_SIGMA_V_SQ +
+                      da * da * _INV_SIGMA_ALPHA_SQ))
+    
+    # Zone classification (same precedence as classify_zone)
+    zone = _ZONE_NAMES_ARRAY[_zone_code(HV_ratio, d_phi, V, alpha)]
+    
+    batch = {} if names is None else {'country': np.asarray(names)}
+    batch.update({
         'H': H,
         'V': V,
         'alpha': alpha,
-        'LEI': LEI_value,
-        'd_phi': d_phi_value,
-        'CHI': CHI_value,
+        'LEI': LEI,
+        'd_phi': d_phi,
+        'CHI': CHI,
         'goldilocks_score': GS,
         'zone': zone,
-        'viable': is_viable,
-        'viability_message': viability_msg
-    }
-    
-    if verbose:
-        print(f"\n=== Legal System Metrics: {country_name} ===")
-        print(f"Parameters:")
-        print(f"  H (Heredity):            {H:.2f}")
-        print(f"  V (Variation):           {V:.2f}")
-        print(f"  α (Diff. Fitness):       {alpha:.2f}")
-        print(f"\nComposite Metrics:")
-        print(f"  LEI (Evolvability):      {LEI_value:.3f}")
-        print(f"  d_φ (Distance to φ):     {d_phi_value:.3f}")
-        print(f"  CHI (Health Index):      {CHI_value:.3f}")
-        print(f"  Goldilocks Score:        {GS:.3f}")
-        print(f"\nClassification:")
-        print(f"  Zone:                    {zone}")
-        print(f"  Viability:               {viability_msg}")
-        print("=" * 50)
+        'viable': LEI > threshold_LEI
+    })
     
-    return metrics
+    return batch
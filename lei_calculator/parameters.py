@@ -7,6 +7,9 @@ This module implements calculations for the three Darwinian parameters:
 - V (Variation): Diversity in institutional arrangements  
 - α (Differential Fitness): Selection pressure favoring high-fitness norms
 
+Parameters are returned at full precision; use format_parameter() (or
+round()) when displaying them.
+
 Based on:
 Lerer, I.A. (2025). "Darwinian Spaces and the Golden Ratio: A Quantitative 
 Framework for Measuring Legal Evolution." SSRN Working Paper.
@@ -15,14 +18,69 @@ Author: Ignacio Adrian Lerer
 License: MIT
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
+
+from ._kernels import lei_batch, score_batch
+from .metrics import PHI, _core
+
+
+class WeightVector(np.ndarray):
+    """
+    Read-only vector of four component weights, validated once.
+    
+    Construction checks the shape and that the weights sum to 1.0; the
+    calculators then accept a WeightVector without re-checking it, so a
+    sensitivity sweep reusing the same custom weights validates them once
+    instead of on every call.
+    
+    Example:
+        >>> w = WeightVector([0.25, 0.25, 0.25, 0.25])
+        >>> round(calculate_H(0.8, 0.7, 0.6, 0.5, weights=w), 3)
+        0.65
+    """
+    
+    def __new__(cls, data) -> 'WeightVector':
+        weights = np.array(data, dtype=np.float64).view(cls)
+        if weights.shape != (4,):
+            raise ValueError(f"Expected 4 weights, got shape {weights.shape}")
+        if not np.isclose(weights.sum(), 1.0):
+            raise ValueError(f"Weights must sum to 1.0, got {weights.sum()}")
+        weights.flags.writeable = False
+        return weights
+
+
+def _as_weights(weights) -> WeightVector:
+    """Pass a WeightVector through; validate anything else into one."""
+    if isinstance(weights, WeightVector):
+        return weights
+    return WeightVector(weights)
+
+
+# Default component weights as immutable tuples (used by the scalar
+# calculators) and as validated WeightVectors (used by the matrix paths)
+_DEFAULT_H_WEIGHTS = (0.35, 0.30, 0.25, 0.10)
+_DEFAULT_V_WEIGHTS = (0.40, 0.25, 0.20, 0.15)
+_DEFAULT_ALPHA_WEIGHTS = (0.35, 0.25, 0.25, 0.15)
+_H_W = WeightVector(_DEFAULT_H_WEIGHTS)
+_V_W = WeightVector(_DEFAULT_V_WEIGHTS)
+_A_W = WeightVector(_DEFAULT_ALPHA_WEIGHTS)
 
+# (3, 12) block-diagonal weight matrix mapping the 12 components (in
+# ParameterComponents field order) to (H, V, α) in one product
+_W_MATRIX = np.zeros((3, 12))
+_W_MATRIX[0, 0:4] = _H_W
+_W_MATRIX[1, 4:8] = _V_W
+_W_MATRIX[2, 8:12] = _A_W
 
-@dataclass
+# Batches at least this large go through the compiled score_batch kernel
+_BATCH_KERNEL_MIN_SIZE = 10_000
+
+
+@dataclass(frozen=True, slots=True)
 class ParameterComponents:
-    """Container for parameter sub-components"""
+    """Container for parameter sub-components (immutable, slotted)"""
     # Heredity components
     precedent_strength: float
     const_rigidity: float
@@ -40,6 +98,40 @@ class ParameterComponents:
     transparency_score: float
     enforcement_capacity: float
     legitimacy_index: float
+    
+    @classmethod
+    def from_array(cls, row: np.ndarray) -> 'ParameterComponents':
+        """Build a record from a length-12 row in field order"""
+        return cls(*np.asarray(row, dtype=np.float64).tolist())
+
+
+# Component names in ParameterComponents field order, per parameter block
+_COMPONENT_NAMES = tuple(ParameterComponents.__dataclass_fields__)
+_H_NAMES = _COMPONENT_NAMES[0:4]
+_V_NAMES = _COMPONENT_NAMES[4:8]
+_A_NAMES = _COMPONENT_NAMES[8:12]
+
+
+def _check_unit_interval(values: np.ndarray, names: Tuple[str, ...]) -> None:
+    """
+    Raise ValueError naming the first component outside [0, 1].
+    
+    values is a 1-D array in the order of names, or an (N, len(names))
+    array. One vectorized comparison covers the common (valid) case; NaN
+    entries are rejected as out of range.
+    """
+    outside = ~((values >= 0) & (values <= 1))
+    if outside.any():
+        idx = int(np.argmax(outside))
+        raise ValueError(f"{names[idx % len(names)]} must be in [0, 1], "
+                         f"got {values.flat[idx]}")
+
+
+def _raise_bounds(values: Tuple[float, ...], names: Tuple[str, ...]) -> None:
+    """Cold path of the scalar range checks: name the offending component."""
+    for value, name in zip(values, names):
+        if not 0 <= value <= 1:
+            raise ValueError(f"{name} must be in [0, 1], got {value}")
 
 
 def calculate_H(
@@ -73,7 +165,8 @@ def calculate_H(
             - (actual_tenure - min_tenure) / (max_tenure - min_tenure)
             - Lifetime appointment = 1.0
             
-        weights (list, optional): Component weights [prec, const, cod, tenure]
+        weights (list or WeightVector, optional): Component weights
+            [prec, const, cod, tenure]
             Default: [0.35, 0.30, 0.25, 0.10] based on empirical validation
     
     Returns:
@@ -81,47 +174,40 @@ def calculate_H(
     
     Example:
         >>> # USA example
-        >>> calculate_H(
+        >>> round(calculate_H(
         ...     precedent_strength=0.80,  # Strong stare decisis
         ...     const_rigidity=0.75,      # Difficult amendment
         ...     codification=0.55,        # Moderate codification
         ...     judicial_tenure=0.65      # Long tenure
-        ... )
-        0.72
+        ... ), 3)
+        0.707
         
         >>> # Argentina labor regime example
-        >>> calculate_H(
+        >>> round(calculate_H(
         ...     precedent_strength=0.95,  # Article 14bis + ultraactivity
         ...     const_rigidity=0.92,      # Nearly impossible to amend
         ...     codification=0.88,        # Highly codified
         ...     judicial_tenure=0.85      # Stable judiciary
-        ... )
-        0.92
+        ... ), 3)
+        0.913
     
     References:
         - Godfrey-Smith, P. (2009). "Darwinian Populations and Natural Selection"
         - Lutz, D. (1994). "Constitutional Amendment Difficulty"
     """
-    if weights is None:
-        weights = [0.35, 0.30, 0.25, 0.10]
-    
-    # Validate inputs
-    for param, name in [(precedent_strength, "precedent_strength"),
-                         (const_rigidity, "const_rigidity"),
-                         (codification, "codification"),
-                         (judicial_tenure, "judicial_tenure")]:
-        if not 0 <= param <= 1:
-            raise ValueError(f"{name} must be in [0, 1], got {param}")
-    
-    if not np.isclose(sum(weights), 1.0):
-        raise ValueError(f"Weights must sum to 1.0, got {sum(weights)}")
-    
-    H = (weights[0] * precedent_strength +
-         weights[1] * const_rigidity +
-         weights[2] * codification +
-         weights[3] * judicial_tenure)
-    
-    return round(H, 3)
+    if not (0 <= precedent_strength <= 1 and
+            0 <= const_rigidity <= 1 and
+            0 <= codification <= 1 and
+            0 <= judicial_tenure <= 1):
+        _raise_bounds((precedent_strength, const_rigidity,
+                       codification, judicial_tenure), _H_NAMES)
+    
+    # Four scalar multiply-adds are far cheaper than building an array
+    w = _DEFAULT_H_WEIGHTS if weights is None else _as_weights(weights).tolist()
+    return (w[0] * precedent_strength +
+            w[1] * const_rigidity +
+            w[2] * codification +
+            w[3] * judicial_tenure)
 
 
 def calculate_V(
@@ -156,7 +242,8 @@ def calculate_V(
             - (new_members / total_seats) per electoral cycle
             - Captures policy renewal capacity
             
-        weights (list, optional): Component weights [fed, amend, review, turnover]
+        weights (list or WeightVector, optional): Component weights
+            [fed, amend, review, turnover]
             Default: [0.40, 0.25, 0.20, 0.15]
     
     Returns:
@@ -164,47 +251,39 @@ def calculate_V(
     
     Example:
         >>> # USA example
-        >>> calculate_V(
+        >>> round(calculate_V(
         ...     federal_autonomy=0.85,    # Strong federalism
         ...     amendment_freq=0.45,      # Moderate amendment rate
         ...     judicial_review=0.70,     # Active Supreme Court
         ...     legislative_turnover=0.50 # Moderate turnover
-        ... )
-        0.63
+        ... ), 3)
+        0.667
         
         >>> # Argentina labor (low variation, locked-in)
-        >>> calculate_V(
+        >>> round(calculate_V(
         ...     federal_autonomy=0.15,    # Federal preemption of labor law
         ...     amendment_freq=0.05,      # Virtually frozen
         ...     judicial_review=0.30,     # Defensive of status quo
         ...     legislative_turnover=0.22 # Low effective turnover
-        ... )
-        0.18
+        ... ), 3)
+        0.166
     
     References:
         - Treisman, D. (2007). "The Architecture of Government"
         - Tsebelis, G. (2002). "Veto Players"
     """
-    if weights is None:
-        weights = [0.40, 0.25, 0.20, 0.15]
-    
-    # Validate inputs
-    for param, name in [(federal_autonomy, "federal_autonomy"),
-                         (amendment_freq, "amendment_freq"),
-                         (judicial_review, "judicial_review"),
-                         (legislative_turnover, "legislative_turnover")]:
-        if not 0 <= param <= 1:
-            raise ValueError(f"{name} must be in [0, 1], got {param}")
-    
-    if not np.isclose(sum(weights), 1.0):
-        raise ValueError(f"Weights must sum to 1.0, got {sum(weights)}")
-    
-    V = (weights[0] * federal_autonomy +
-         weights[1] * amendment_freq +
-         weights[2] * judicial_review +
-         weights[3] * legislative_turnover)
-    
-    return round(V, 3)
+    if not (0 <= federal_autonomy <= 1 and
+            0 <= amendment_freq <= 1 and
+            0 <= judicial_review <= 1 and
+            0 <= legislative_turnover <= 1):
+        _raise_bounds((federal_autonomy, amendment_freq,
+                       judicial_review, legislative_turnover), _V_NAMES)
+    
+    w = _DEFAULT_V_WEIGHTS if weights is None else _as_weights(weights).tolist()
+    return (w[0] * federal_autonomy +
+            w[1] * amendment_freq +
+            w[2] * judicial_review +
+            w[3] * legislative_turnover)
 
 
 def calculate_alpha(
@@ -237,7 +316,8 @@ def calculate_alpha(
             - Public trust in institutions, perceived fairness
             - World Values Survey + Latinobarometro
             
-        weights (list, optional): Component weights [comp, trans, enf, legit]
+        weights (list or WeightVector, optional): Component weights
+            [comp, trans, enf, legit]
             Default: [0.35, 0.25, 0.25, 0.15]
     
     Returns:
@@ -245,47 +325,66 @@ def calculate_alpha(
     
     Example:
         >>> # USA example  
-        >>> calculate_alpha(
+        >>> round(calculate_alpha(
         ...     compliance_rate=0.65,      # Moderate compliance
         ...     transparency_score=0.70,   # Strong transparency
         ...     enforcement_capacity=0.55, # Moderate enforcement
         ...     legitimacy_index=0.45      # Declining legitimacy
-        ... )
-        0.58
+        ... ), 3)
+        0.608
         
         >>> # Argentina labor (very low selection pressure)
-        >>> calculate_alpha(
+        >>> round(calculate_alpha(
         ...     compliance_rate=0.12,      # Widespread evasion
         ...     transparency_score=0.15,   # Opaque CGT negotiations
         ...     enforcement_capacity=0.08, # Weak enforcement
         ...     legitimacy_index=0.05      # Low legitimacy
-        ... )
-        0.09
+        ... ), 3)
+        0.107
     
     References:
         - World Justice Project (2023). Rule of Law Index
         - V-Dem Institute (2023). Democracy Dataset
     """
-    if weights is None:
-        weights = [0.35, 0.25, 0.25, 0.15]
-    
-    # Validate inputs
-    for param, name in [(compliance_rate, "compliance_rate"),
-                         (transparency_score, "transparency_score"),
-                         (enforcement_capacity, "enforcement_capacity"),
-                         (legitimacy_index, "legitimacy_index")]:
-        if not 0 <= param <= 1:
-            raise ValueError(f"{name} must be in [0, 1], got {param}")
-    
-    if not np.isclose(sum(weights), 1.0):
-        raise ValueError(f"Weights must sum to 1.0, got {sum(weights)}")
-    
-    alpha = (weights[0] * compliance_rate +
-             weights[1] * transparency_score +
-             weights[2] * enforcement_capacity +
-             weights[3] * legitimacy_index)
+    if not (0 <= compliance_rate <= 1 and
+            0 <= transparency_score <= 1 and
+            0 <= enforcement_capacity <= 1 and
+            0 <= legitimacy_index <= 1):
+        _raise_bounds((compliance_rate, transparency_score,
+                       enforcement_capacity, legitimacy_index), _A_NAMES)
+    
+    w = _DEFAULT_ALPHA_WEIGHTS if weights is None else _as_weights(weights).tolist()
+    return (w[0] * compliance_rate +
+            w[1] * transparency_score +
+            w[2] * enforcement_capacity +
+            w[3] * legitimacy_index)
+
+
+def components_to_array(components: ParameterComponents) -> np.ndarray:
+    """
+    Flatten a ParameterComponents record into a length-12 float array.
     
-    return round(alpha, 3)
+    Components are ordered as declared on the dataclass: the four heredity,
+    then the four variation, then the four differential fitness components.
+    """
+    return np.fromiter(astuple(components), dtype=np.float64, count=12)
+
+
+def _weight_matrix(
+    H_weights: Optional[List[float]] = None,
+    V_weights: Optional[List[float]] = None,
+    alpha_weights: Optional[List[float]] = None
+) -> np.ndarray:
+    """Return _W_MATRIX, or a validated copy with custom weight blocks."""
+    if H_weights is None and V_weights is None and alpha_weights is None:
+        return _W_MATRIX
+    
+    W = _W_MATRIX.copy()
+    for row, weights in enumerate((H_weights, V_weights, alpha_weights)):
+        if weights is None:
+            continue
+        W[row, 4 * row:4 * row + 4] = _as_weights(weights)
+    return W
 
 
 def calculate_all_parameters(
@@ -297,6 +396,9 @@ def calculate_all_parameters(
     """
     Calculate all three parameters (H, V, α) from component data.
     
+    The three weighted sums are evaluated as a single (3, 12) x (12,)
+    matrix-vector product.
+    
     Args:
         components: ParameterComponents object with all sub-components
         H_weights, V_weights, alpha_weights: Optional custom weights
@@ -315,93 +417,132 @@ def calculate_all_parameters(
         ...     enforcement_capacity=0.55, legitimacy_index=0.45
         ... )
         >>> H, V, alpha = calculate_all_parameters(usa_components)
-        >>> print(f"USA: H={H}, V={V}, α={alpha}")
-        USA: H=0.72, V=0.63, α=0.58
+        >>> print(f"USA: H={format_parameter(H)}, V={format_parameter(V)}, "
+        ...       f"α={format_parameter(alpha)}")
+        USA: H=0.708, V=0.667, α=0.607
+    """
+    values = components_to_array(components)
+    _check_unit_interval(values, _COMPONENT_NAMES)
+    
+    W = _weight_matrix(H_weights, V_weights, alpha_weights)
+    H, V, alpha = W @ values
+    
+    return float(H), float(V), float(alpha)
+
+
+def calculate_all_batch(
+    components_matrix: np.ndarray,
+    H_weights: Optional[List[float]] = None,
+    V_weights: Optional[List[float]] = None,
+    alpha_weights: Optional[List[float]] = None
+) -> np.ndarray:
+    """
+    Calculate (H, V, α) for many legal systems at once.
+    
+    Large batches are scored by a multithreaded Numba kernel when Numba is
+    installed; otherwise (and for small batches) by one matrix product.
+    
+    Args:
+        components_matrix: (N, 12) array, one row per system, columns in
+            ParameterComponents field order (see components_to_array)
+        H_weights, V_weights, alpha_weights: Optional custom weights
+    
+    Returns:
+        np.ndarray: (N, 3) array of (H, V, α) rows
+    
+    Raises:
+        ValueError: If the matrix is not (N, 12) or has entries outside [0, 1]
+    
+    Example:
+        >>> X = np.array([components_to_array(COUNTRY_PARAMETERS[c]['components'])
+        ...               for c in ('USA', 'Brazil')])
+        >>> calculate_all_batch(X).shape
+        (2, 3)
     """
-    H = calculate_H(
-        components.precedent_strength,
-        components.const_rigidity,
-        components.codification,
-        components.judicial_tenure,
-        H_weights
-    )
-    
-    V = calculate_V(
-        components.federal_autonomy,
-        components.amendment_freq,
-        components.judicial_review,
-        components.legislative_turnover,
-        V_weights
-    )
-    
-    alpha = calculate_alpha(
-        components.compliance_rate,
-        components.transparency_score,
-        components.enforcement_capacity,
-        components.legitimacy_index,
-        alpha_weights
-    )
-    
-    return H, V, alpha
+    X = np.asarray(components_matrix, dtype=np.float64)
+    if X.ndim != 2 or X.shape[1] != 12:
+        raise ValueError(f"components_matrix must have shape (N, 12), got {X.shape}")
+    _check_unit_interval(X, _COMPONENT_NAMES)
+    
+    W = _weight_matrix(H_weights, V_weights, alpha_weights)
+    if X.shape[0] >= _BATCH_KERNEL_MIN_SIZE:
+        return score_batch(np.ascontiguousarray(X), W)
+    return X @ W.T
 
 
+def calculate_lei_batch(
+    components_matrix: np.ndarray,
+    H_weights: Optional[List[float]] = None,
+    V_weights: Optional[List[float]] = None,
+    alpha_weights: Optional[List[float]] = None
+) -> np.ndarray:
+    """
+    Legal Evolvability Index straight from (N, 12) component rows.
+    
+    Equivalent to calculate_all_batch followed by metrics.calculate_LEI,
+    but large batches are scored by one fused Numba kernel that reads each
+    row once and writes one LEI value, with no intermediate (N, 3) array.
+    
+    Args:
+        components_matrix: (N, 12) array in ParameterComponents field order
+        H_weights, V_weights, alpha_weights: Optional custom weights
+    
+    Returns:
+        np.ndarray: (N,) LEI values (0.0 where V=0)
+    
+    Raises:
+        ValueError: If the matrix is not (N, 12) or has entries outside [0, 1]
+    """
+    X = np.asarray(components_matrix, dtype=np.float64)
+    if X.ndim != 2 or X.shape[1] != 12:
+        raise ValueError(f"components_matrix must have shape (N, 12), got {X.shape}")
+    _check_unit_interval(X, _COMPONENT_NAMES)
+    
+    W = _weight_matrix(H_weights, V_weights, alpha_weights)
+    if lei_batch is not None and X.shape[0] >= _BATCH_KERNEL_MIN_SIZE:
+        return lei_batch(np.ascontiguousarray(X), W, PHI, 0.1)
+    H, V, alpha = (X @ W.T).T
+    return _core(H, V, alpha).LEI
+
+
+def format_parameter(value: float, ndigits: int = 3) -> str:
+    """
+    Format a parameter value for display (3 decimals, as in the paper).
+    
+    Example:
+        >>> format_parameter(0.7075000000000001)
+        '0.708'
+    """
+    return f"{value:.{ndigits}f}"
+
+
+# Published sub-components, one row per country in ParameterComponents field
+# order: heredity (4) | variation (4) | differential fitness (4)
+_COUNTRY_COMPONENTS = {
+    'USA': (0.80, 0.75, 0.55, 0.65,
+            0.85, 0.45, 0.70, 0.50,
+            0.65, 0.70, 0.55, 0.45),
+    'Argentina_labor': (0.95, 0.92, 0.88, 0.85,
+                        0.15, 0.05, 0.30, 0.22,
+                        0.12, 0.15, 0.08, 0.05),
+    'Brazil': (0.60, 0.55, 0.70, 0.58,
+               0.75, 0.65, 0.72, 0.55,
+               0.50, 0.48, 0.55, 0.55),
+    'Chile': (0.65, 0.62, 0.72, 0.60,
+              0.42, 0.75, 0.68, 0.62,
+              0.45, 0.48, 0.42, 0.40),
+    'Germany': (0.75, 0.80, 0.75, 0.70,
+                0.78, 0.55, 0.75, 0.60,
+                0.70, 0.68, 0.62, 0.60),
+}
+
 # Predefined country parameters (validated from paper)
 COUNTRY_PARAMETERS = {
-    'USA': {
-        'H': 0.72, 'V': 0.63, 'alpha': 0.58,
-        'components': ParameterComponents(
-            precedent_strength=0.80, const_rigidity=0.75,
-            codification=0.55, judicial_tenure=0.65,
-            federal_autonomy=0.85, amendment_freq=0.45,
-            judicial_review=0.70, legislative_turnover=0.50,
-            compliance_rate=0.65, transparency_score=0.70,
-            enforcement_capacity=0.55, legitimacy_index=0.45
-        )
-    },
-    'Argentina_labor': {
-        'H': 0.92, 'V': 0.18, 'alpha': 0.09,
-        'components': ParameterComponents(
-            precedent_strength=0.95, const_rigidity=0.92,
-            codification=0.88, judicial_tenure=0.85,
-            federal_autonomy=0.15, amendment_freq=0.05,
-            judicial_review=0.30, legislative_turnover=0.22,
-            compliance_rate=0.12, transparency_score=0.15,
-            enforcement_capacity=0.08, legitimacy_index=0.05
-        )
-    },
-    'Brazil': {
-        'H': 0.61, 'V': 0.68, 'alpha': 0.52,
-        'components': ParameterComponents(
-            precedent_strength=0.60, const_rigidity=0.55,
-            codification=0.70, judicial_tenure=0.58,
-            federal_autonomy=0.75, amendment_freq=0.65,
-            judicial_review=0.72, legislative_turnover=0.55,
-            compliance_rate=0.50, transparency_score=0.48,
-            enforcement_capacity=0.55, legitimacy_index=0.55
-        )
-    },
-    'Chile': {
-        'H': 0.65, 'V': 0.61, 'alpha': 0.44,
-        'components': ParameterComponents(
-            precedent_strength=0.65, const_rigidity=0.62,
-            codification=0.72, judicial_tenure=0.60,
-            federal_autonomy=0.42, amendment_freq=0.75,
-            judicial_review=0.68, legislative_turnover=0.62,
-            compliance_rate=0.45, transparency_score=0.48,
-            enforcement_capacity=0.42, legitimacy_index=0.40
-        )
-    },
-    'Germany': {
-        'H': 0.75, 'V': 0.68, 'alpha': 0.65,
-        'components': ParameterComponents(
-            precedent_strength=0.75, const_rigidity=0.80,
-            codification=0.75, judicial_tenure=0.70,
-            federal_autonomy=0.78, amendment_freq=0.55,
-            judicial_review=0.75, legislative_turnover=0.60,
-            compliance_rate=0.70, transparency_score=0.68,
-            enforcement_capacity=0.62, legitimacy_index=0.60
-        )
-    },
+    'USA': {'H': 0.72, 'V': 0.63, 'alpha': 0.58},
+    'Argentina_labor': {'H': 0.92, 'V': 0.18, 'alpha': 0.09},
+    'Brazil': {'H': 0.61, 'V': 0.68, 'alpha': 0.52},
+    'Chile': {'H': 0.65, 'V': 0.61, 'alpha': 0.44},
+    'Germany': {'H': 0.75, 'V': 0.68, 'alpha': 0.65},
     
     # Goldilocks Zone countries (LEI > 1.0, d_φ < 0.5)
     'France': {'H': 0.70, 'V': 0.65, 'alpha': 0.60},
@@ -442,18 +583,86 @@ COUNTRY_PARAMETERS = {
     'Sweden': {'H': 0.76, 'V': 0.72, 'alpha': 0.64},
     'Norway': {'H': 0.75, 'V': 0.71, 'alpha': 0.63}
 }
+for _name, _row in _COUNTRY_COMPONENTS.items():
+    COUNTRY_PARAMETERS[_name]['components'] = ParameterComponents(*_row)
+del _name, _row
+
+
+# Struct-of-arrays view of COUNTRY_PARAMETERS for vectorized work across
+# countries: row i of each array belongs to COUNTRY_NAMES[i]. Countries
+# without published components have NaN rows in the component arrays.
+# _COMPONENT_HVA holds (H, V, α) recomputed from the components with the
+# default weights, evaluated once here in a single product.
+COUNTRY_NAMES = tuple(COUNTRY_PARAMETERS)
+_COUNTRY_INDEX = {name: i for i, name in enumerate(COUNTRY_NAMES)}
+# Every accepted spelling of a country name (as stored, with spaces for
+# underscores, and lower-cased) mapped to its entry, so lookups need no
+# normalization for the common spellings
+_COUNTRY_LOOKUP = {}
+for _name, _entry in COUNTRY_PARAMETERS.items():
+    for _key in (_name, _name.replace('_', ' ')):
+        _COUNTRY_LOOKUP[_key] = _COUNTRY_LOOKUP[_key.lower()] = _entry
+_COUNTRY_HVA = np.array([[p['H'], p['V'], p['alpha']]
+                         for p in COUNTRY_PARAMETERS.values()])
+_COMPONENT_MATRIX = np.full((len(COUNTRY_NAMES), 12), np.nan)
+for _name, _row in _COUNTRY_COMPONENTS.items():
+    _COMPONENT_MATRIX[_COUNTRY_INDEX[_name]] = _row
+_COMPONENT_HVA = _COMPONENT_MATRIX @ _W_MATRIX.T
+for _arr in (_COUNTRY_HVA, _COMPONENT_MATRIX, _COMPONENT_HVA):
+    _arr.flags.writeable = False
+del _name, _row, _arr
 
 
-def get_country_parameters(country: str) -> Dict:
+def get_country_array(
+    countries: Optional[List[str]] = None,
+    from_components: bool = False
+) -> np.ndarray:
+    """
+    Published (H, V, α) for several countries as one array.
+    
+    Args:
+        countries: Country names (spaces or underscores); default is every
+            country, in COUNTRY_NAMES order
+        from_components: Return (H, V, α) recomputed from the published
+            sub-components instead (NaN rows where none are published)
+    
+    Returns:
+        np.ndarray: (N, 3) read-only array of (H, V, α) rows
+    
+    Raises:
+        KeyError: If a country is not in the database
+    
+    Example:
+        >>> get_country_array(['USA', 'Argentina labor'])
+        array([[0.72, 0.63, 0.58],
+               [0.92, 0.18, 0.09]])
+    """
+    table = _COMPONENT_HVA if from_components else _COUNTRY_HVA
+    if countries is None:
+        return table
+    
+    rows = []
+    for country in countries:
+        country_key = country.replace(' ', '_')
+        if country_key not in _COUNTRY_INDEX:
+            available = ', '.join(COUNTRY_NAMES)
+            raise KeyError(f"Country '{country}' not found. Available: {available}")
+        rows.append(_COUNTRY_INDEX[country_key])
+    return table[rows]
+
+
+def get_country_parameters(country: str) -> dict:
     """
     Retrieve validated parameters for a country.
     
     Args:
-        country: Country name (case-insensitive)
-            Available: USA, Argentina_labor, Brazil, Chile, Germany
+        country: Country name (case-insensitive; spaces and underscores
+            are interchangeable). Available: COUNTRY_NAMES
     
     Returns:
-        dict: {'H': float, 'V': float, 'alpha': float, 'components': ParameterComponents}
+        dict: {'H': float, 'V': float, 'alpha': float,
+            'components': ParameterComponents}; a fresh copy on every call,
+            so callers may modify it without touching the database
     
     Raises:
         KeyError: If country not in database
@@ -463,9 +672,11 @@ def get_country_parameters(country: str) -> Dict:
         >>> print(f"H={params['H']}, V={params['V']}, α={params['alpha']}")
         H=0.72, V=0.63, α=0.58
     """
-    country_key = country.replace(' ', '_')
-    if country_key not in COUNTRY_PARAMETERS:
-        available = ', '.join(COUNTRY_PARAMETERS.keys())
+    entry = _COUNTRY_LOOKUP.get(country)
+    if entry is None:
+        # Unusual capitalization: normalize once and retry
+        entry = _COUNTRY_LOOKUP.get(country.replace(' ', '_').lower())
+    if entry is None:
+        available = ', '.join(COUNTRY_NAMES)
         raise KeyError(f"Country '{country}' not found. Available: {available}")
-    
-    return COUNTRY_PARAMETERS[country_key]
+    return dict(entry)
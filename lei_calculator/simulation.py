@@ -21,15 +21,53 @@ Author: Ignacio Adrian Lerer
 License: MIT
 """
 
-import numpy as np
-from scipy.integrate import odeint
-from typing import Tuple, Dict, Optional, List
+import math
+import os
 import warnings
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterator, Tuple, Dict, Optional, List, Union
+
+from ._kernels import USE_NUMBA
+from .metrics import _core
+
+njit = None
+prange = range
+if USE_NUMBA:
+    try:
+        from numba import njit, prange, get_num_threads, set_num_threads
+    except ImportError:  # Optional dependency: fall back to pure Python
+        pass
 
 # Golden Ratio
-PHI = (1 + np.sqrt(5)) / 2  # ≈ 1.618
+PHI = 1.618033988749895  # (1 + √5) / 2
+_PHI_PLUS_ONE = PHI + 1  # V* denominator for the default target ratio
+
+# Model parameter overrides per predict_future_trajectory() scenario;
+# explicit keyword arguments take precedence
+SCENARIOS = MappingProxyType({
+    'baseline': MappingProxyType({}),
+    'reform': MappingProxyType({
+        'gamma_V': 0.12,  # Faster V increase
+        'gamma_H': 0.04,  # Slower H increase
+    }),
+    'lock-in': MappingProxyType({
+        'gamma_V': 0.04,  # Slower V increase
+        'gamma_H': 0.07,  # Faster H increase
+        'sigma_V': 0.005,  # Less variation
+    }),
+    'crisis': MappingProxyType({
+        'sigma_H': 0.03,  # High noise
+        'sigma_V': 0.03,
+        'sigma_alpha': 0.015,
+    }),
+})
 
 
+@lru_cache(maxsize=1024)
 def calculate_equilibrium(
     H0: float,
     V0: float,
@@ -63,6 +101,9 @@ def calculate_equilibrium(
         From Lagrangian optimization (Appendix D.1), optimal evolvability
         occurs when H/V = φ. System converges toward this attractor regardless
         of initial conditions (barring extreme lock-in where V→0).
+    
+    Results are memoized, so repeated forecasts or scenario sweeps from
+    the same starting point reuse the equilibrium.
     """
     # Target sum (approximate conservation)
     total = H0 + V0
@@ -70,24 +111,484 @@ def calculate_equilibrium(
     # Solve: H*/V* = φ and H* + V* = total
     # => H* = φ × V* and φ×V* + V* = total
     # => V*(φ + 1) = total
-    V_eq = total / (target_ratio + 1)
+    V_eq = total / (_PHI_PLUS_ONE if target_ratio == PHI else target_ratio + 1)
     H_eq = target_ratio * V_eq
     
     # Selection pressure increases toward maximum
     alpha_eq = min(0.70, alpha0 + 0.15)  # Gradual increase, cap at 0.70
     
-    # Ensure bounds [0, 1]
-    H_eq = np.clip(H_eq, 0.0, 1.0)
-    V_eq = np.clip(V_eq, 0.0, 1.0)
-    alpha_eq = np.clip(alpha_eq, 0.0, 1.0)
+    # Ensure bounds [0, 1] (plain comparisons; np.clip on scalars allocates)
+    H_eq = 0.0 if H_eq < 0.0 else (1.0 if H_eq > 1.0 else H_eq)
+    V_eq = 0.0 if V_eq < 0.0 else (1.0 if V_eq > 1.0 else V_eq)
+    alpha_eq = 0.0 if alpha_eq < 0.0 else (1.0 if alpha_eq > 1.0 else alpha_eq)
     
     return H_eq, V_eq, alpha_eq
 
 
+def _equilibria_batch(
+    H0s: np.ndarray,
+    V0s: np.ndarray,
+    alpha0s: np.ndarray
+) -> np.ndarray:
+    """
+    calculate_equilibrium() for arrays of initial conditions at the default
+    target ratio. Returns an (N, 3) array of (H*, V*, α*) rows.
+    """
+    V_eqs = (H0s + V0s) / _PHI_PLUS_ONE
+    H_eqs = PHI * V_eqs
+    alpha_eqs = np.minimum(0.70, alpha0s + 0.15)
+    return np.clip(np.column_stack((H_eqs, V_eqs, alpha_eqs)), 0.0, 1.0)
+
+
+def _sample_noise(noise_seed: int, n_steps: int) -> np.ndarray:
+    """
+    Standard normal shocks for (H, V, α), one row per integration step.
+    
+    Drawn once per simulation from a seeded Generator instead of reseeding
+    the global RNG on every right-hand side call. Row k of a longer draw
+    equals row k of a shorter one, so trajectories of different lengths
+    with the same seed share their noise history.
+    """
+    return np.random.default_rng(noise_seed).standard_normal((max(n_steps, 1), 3))
+
+
+@lru_cache(maxsize=64)
+def _noise_table(noise_seed: int, n_rows: int) -> np.ndarray:
+    """
+    Read-only _sample_noise() draw, memoized for the public ode_system().
+    
+    ode_system() asks for lengths rounded up to a power of two, so a
+    custom integrator evaluating it over T years triggers O(log T) draws
+    in total rather than an O(t) draw on every call.
+    """
+    noise = _sample_noise(noise_seed, n_rows)
+    noise.flags.writeable = False
+    return noise
+
+
+def _ode_system_core_py(
+    state: np.ndarray,
+    t: float,
+    H_eq: float,
+    V_eq: float,
+    alpha_eq: float,
+    gamma_H: float,
+    gamma_V: float,
+    beta: float,
+    sigma_H: float,
+    sigma_V: float,
+    sigma_alpha: float,
+    noise: np.ndarray
+) -> Tuple[float, float, float]:
+    """
+    Right-hand side of ode_system() on plain scalars, returning a tuple.
+    
+    noise is the pre-sampled (n_steps, 3) standard normal buffer from
+    _sample_noise(); the shock for year t is row int(t), so every
+    evaluation within a step sees the same noise. Compiled with Numba when
+    available so the integrator's per-step callback runs without
+    interpreter overhead or dict lookups.
+    """
+    H = state[0]
+    V = state[1]
+    alpha = state[2]
+    
+    k = min(int(t), noise.shape[0] - 1)
+    noise_H = noise[k, 0]
+    noise_V = noise[k, 1]
+    noise_alpha = noise[k, 2]
+    
+    # Selection pressure function (depends on distance from φ)
+    if V > 0:
+        HV_ratio = H / V
+        distance_phi = math.fabs(HV_ratio - PHI)
+        selection_pressure = math.exp(-distance_phi)  # Higher when near φ
+    else:
+        selection_pressure = 0.0
+    
+    # ODE equations
+    dH_dt = gamma_H * (H_eq - H) + sigma_H * noise_H
+    dV_dt = gamma_V * (V_eq - V) + sigma_V * noise_V
+    dα_dt = beta * (alpha_eq - alpha) * selection_pressure + sigma_alpha * noise_alpha
+    
+    return dH_dt, dV_dt, dα_dt
+
+
+if njit is not None:
+    _ode_system_core = njit(cache=True, fastmath=True)(_ode_system_core_py)
+else:
+    _ode_system_core = _ode_system_core_py
+
+
+def _ode_jacobian_core_py(
+    state: np.ndarray,
+    t: float,
+    H_eq: float,
+    V_eq: float,
+    alpha_eq: float,
+    gamma_H: float,
+    gamma_V: float,
+    beta: float,
+    sigma_H: float,
+    sigma_V: float,
+    sigma_alpha: float,
+    noise: np.ndarray
+) -> np.ndarray:
+    """
+    Analytic Jacobian of _ode_system_core() with respect to (H, V, α).
+    
+    Takes the same arguments so it can serve as the LSODA Jacobian; the
+    noise terms do not depend on the state and drop out. With
+    s = exp(-|H/V - φ|) and g = β(α* - α):
+        ∂(dα/dt)/∂H = -g·s·sign(H/V - φ) / V
+        ∂(dα/dt)/∂V =  g·s·sign(H/V - φ)·H / V²
+        ∂(dα/dt)/∂α = -β·s
+    """
+    H = state[0]
+    V = state[1]
+    alpha = state[2]
+    
+    jac = np.zeros((3, 3))
+    jac[0, 0] = -gamma_H
+    jac[1, 1] = -gamma_V
+    
+    if V > 0:
+        deviation = H / V - PHI
+        s = math.exp(-math.fabs(deviation))
+        g_s_sign = beta * (alpha_eq - alpha) * s * np.sign(deviation)
+        jac[2, 0] = -g_s_sign / V
+        jac[2, 1] = g_s_sign * H / (V * V)
+        jac[2, 2] = -beta * s
+    
+    return jac
+
+
+if njit is not None:
+    _ode_jacobian_core = njit(cache=True, fastmath=True)(_ode_jacobian_core_py)
+else:
+    _ode_jacobian_core = _ode_jacobian_core_py
+
+
+def _integrate_rk4_py(
+    state0: np.ndarray,
+    t: np.ndarray,
+    H_eq: float,
+    V_eq: float,
+    alpha_eq: float,
+    gamma_H: float,
+    gamma_V: float,
+    beta: float,
+    sigma_H: float,
+    sigma_V: float,
+    sigma_alpha: float,
+    noise: np.ndarray
+) -> np.ndarray:
+    """
+    Classical fixed-step Runge-Kutta 4 over the time grid t.
+    
+    The system is small and non-stiff, so a fixed step on the output grid
+    is accurate and avoids an adaptive solver's per-call setup and callback
+    overhead.
+    All four stages of step k use noise row k. Returns a (len(t), 3) array
+    of (H, V, α) rows.
+    """
+    n = t.shape[0]
+    out = np.empty((n, 3))
+    out[0] = state0
+    y = state0.copy()
+    tmp = np.empty(3)
+    
+    for k in range(n - 1):
+        t0 = t[k]
+        dt = t[k + 1] - t0
+        half = 0.5 * dt
+        step_noise = noise[k:k + 1]  # one-row view: all stages share step k's shock
+        
+        k1 = _ode_system_core(y, t0, H_eq, V_eq, alpha_eq, gamma_H, gamma_V,
+                              beta, sigma_H, sigma_V, sigma_alpha, step_noise)
+        for j in range(3):
+            tmp[j] = y[j] + half * k1[j]
+        k2 = _ode_system_core(tmp, t0 + half, H_eq, V_eq, alpha_eq, gamma_H,
+                              gamma_V, beta, sigma_H, sigma_V, sigma_alpha,
+                              step_noise)
+        for j in range(3):
+            tmp[j] = y[j] + half * k2[j]
+        k3 = _ode_system_core(tmp, t0 + half, H_eq, V_eq, alpha_eq, gamma_H,
+                              gamma_V, beta, sigma_H, sigma_V, sigma_alpha,
+                              step_noise)
+        for j in range(3):
+            tmp[j] = y[j] + dt * k3[j]
+        k4 = _ode_system_core(tmp, t0 + dt, H_eq, V_eq, alpha_eq, gamma_H,
+                              gamma_V, beta, sigma_H, sigma_V, sigma_alpha,
+                              step_noise)
+        
+        for j in range(3):
+            y[j] += dt / 6.0 * (k1[j] + 2.0 * k2[j] + 2.0 * k3[j] + k4[j])
+            out[k + 1, j] = y[j]
+    
+    return out
+
+
+if njit is not None:
+    _integrate_rk4 = njit(cache=True, fastmath=True)(_integrate_rk4_py)
+else:
+    _integrate_rk4 = _integrate_rk4_py
+
+
+def _integrate_batch_rk4_py(
+    states0: np.ndarray,
+    t: np.ndarray,
+    H_eq: np.ndarray,
+    V_eq: np.ndarray,
+    alpha_eq: np.ndarray,
+    gamma_H: float,
+    gamma_V: float,
+    beta: float,
+    sigma_H: float,
+    sigma_V: float,
+    sigma_alpha: float,
+    noise: np.ndarray
+) -> np.ndarray:
+    """
+    RK4 for N independent trajectories sharing one time grid.
+    
+    states0 is (N, 3) and H_eq, V_eq, alpha_eq are (N,). noise is a
+    pre-sampled (N, len(t) - 1, 3) standard normal tensor, held constant
+    within each step, so the loop body is pure arithmetic. Trajectories are
+    distributed over threads when compiled with Numba. Returns a (3, N, T)
+    array of states0's dtype so that each parameter's (N, T) block is
+    contiguous.
+    """
+    N = states0.shape[0]
+    n = t.shape[0]
+    out = np.empty((3, N, n), dtype=states0.dtype)
+    
+    for i in prange(N):
+        H = states0[i, 0]
+        V = states0[i, 1]
+        alpha = states0[i, 2]
+        out[0, i, 0] = H
+        out[1, i, 0] = V
+        out[2, i, 0] = alpha
+        H_star = H_eq[i]
+        V_star = V_eq[i]
+        alpha_star = alpha_eq[i]
+        
+        for k in range(n - 1):
+            dt = t[k + 1] - t[k]
+            half = 0.5 * dt
+            nH = sigma_H * noise[i, k, 0]
+            nV = sigma_V * noise[i, k, 1]
+            na = sigma_alpha * noise[i, k, 2]
+            
+            # Four stages; H and V drifts are linear, α couples through SP(H, V)
+            h = H
+            v = V
+            a = alpha
+            dH1 = gamma_H * (H_star - h) + nH
+            dV1 = gamma_V * (V_star - v) + nV
+            sp = math.exp(-math.fabs(h / v - PHI)) if v > 0 else 0.0
+            da1 = beta * (alpha_star - a) * sp + na
+            
+            h = H + half * dH1
+            v = V + half * dV1
+            a = alpha + half * da1
+            dH2 = gamma_H * (H_star - h) + nH
+            dV2 = gamma_V * (V_star - v) + nV
+            sp = math.exp(-math.fabs(h / v - PHI)) if v > 0 else 0.0
+            da2 = beta * (alpha_star - a) * sp + na
+            
+            h = H + half * dH2
+            v = V + half * dV2
+            a = alpha + half * da2
+            dH3 = gamma_H * (H_star - h) + nH
+            dV3 = gamma_V * (V_star - v) + nV
+            sp = math.exp(-math.fabs(h / v - PHI)) if v > 0 else 0.0
+            da3 = beta * (alpha_star - a) * sp + na
+            
+            h = H + dt * dH3
+            v = V + dt * dV3
+            a = alpha + dt * da3
+            dH4 = gamma_H * (H_star - h) + nH
+            dV4 = gamma_V * (V_star - v) + nV
+            sp = math.exp(-math.fabs(h / v - PHI)) if v > 0 else 0.0
+            da4 = beta * (alpha_star - a) * sp + na
+            
+            H += dt / 6.0 * (dH1 + 2.0 * dH2 + 2.0 * dH3 + dH4)
+            V += dt / 6.0 * (dV1 + 2.0 * dV2 + 2.0 * dV3 + dV4)
+            alpha += dt / 6.0 * (da1 + 2.0 * da2 + 2.0 * da3 + da4)
+            out[0, i, k + 1] = H
+            out[1, i, k + 1] = V
+            out[2, i, k + 1] = alpha
+    
+    return out
+
+
+if njit is not None:
+    _integrate_batch_rk4 = njit(cache=True, fastmath=True, parallel=True)(
+        _integrate_batch_rk4_py)
+else:
+    _integrate_batch_rk4 = _integrate_batch_rk4_py
+
+
+def _integrate_lsoda(
+    state0: np.ndarray,
+    t: np.ndarray,
+    args: Tuple
+) -> np.ndarray:
+    """
+    Adaptive LSODA integration (SciPy solve_ivp) for stiff parameterizations.
+    
+    Tolerances match odeint's defaults. SciPy is imported here so the
+    default RK4 path does not pay for it.
+    """
+    if len(t) == 1:
+        return state0[np.newaxis, :]
+    
+    from scipy.integrate import solve_ivp
+    
+    # LSODA copies the derivative into its own workspace, so one buffer
+    # can be refilled on every callback
+    rhs = np.empty(3)
+    
+    def fun(time, y):
+        rhs[0], rhs[1], rhs[2] = _ode_system_core(y, time, *args)
+        return rhs
+    
+    sol = solve_ivp(
+        fun, (t[0], t[-1]), state0, method='LSODA', t_eval=t,
+        jac=lambda time, y: _ode_jacobian_core(y, time, *args),
+        rtol=1.49012e-8, atol=1.49012e-8
+    )
+    if not sol.success:
+        raise RuntimeError(f"LSODA integration failed: {sol.message}")
+    return sol.y.T
+
+
+def _integrate_julia(
+    state0: np.ndarray,
+    t: np.ndarray,
+    args: Tuple
+) -> np.ndarray:
+    """
+    Adaptive Tsit5 integration with Julia's DifferentialEquations.jl.
+    
+    Optional backend through diffeqpy, imported here so that neither it
+    nor the Julia runtime is needed unless requested. The right-hand side
+    is still the compiled _ode_system_core(), called back from Julia.
+    """
+    if len(t) == 1:
+        return state0[np.newaxis, :]
+    
+    try:
+        from diffeqpy import de
+    except ImportError as err:
+        raise ImportError(
+            "solver='julia' requires diffeqpy and a Julia installation "
+            "(pip install diffeqpy)"
+        ) from err
+    
+    def fun(u, p, time):
+        return list(_ode_system_core(np.asarray(u, dtype=np.float64), time, *args))
+    
+    prob = de.ODEProblem(fun, list(state0), (float(t[0]), float(t[-1])))
+    sol = de.solve(prob, de.Tsit5(), saveat=list(t),
+                   reltol=1.49012e-8, abstol=1.49012e-8)
+    solution = np.array([np.asarray(u, dtype=np.float64) for u in sol.u])
+    if solution.shape != (len(t), 3):
+        raise RuntimeError(f"Julia integration failed: {sol.retcode}")
+    return solution
+
+
+def _run_batch(
+    states0: np.ndarray,
+    t: np.ndarray,
+    H_eq: np.ndarray,
+    V_eq: np.ndarray,
+    alpha_eq: np.ndarray,
+    model_params: Tuple[float, ...],
+    noise: np.ndarray,
+    n_jobs: Optional[int] = None
+) -> np.ndarray:
+    """
+    Run _integrate_batch_rk4 on up to n_jobs cores.
+    
+    With Numba the kernel is already threaded over trajectories and n_jobs
+    only caps the thread count (None or -1: all threads). Without Numba the
+    trajectories are split into n_jobs chunks integrated in worker
+    processes (None or 1: serial, -1: one per CPU).
+    """
+    if njit is not None:
+        if n_jobs is None or n_jobs < 1:
+            return _integrate_batch_rk4(states0, t, H_eq, V_eq, alpha_eq,
+                                        *model_params, noise)
+        previous = get_num_threads()
+        set_num_threads(min(n_jobs, previous))
+        try:
+            return _integrate_batch_rk4(states0, t, H_eq, V_eq, alpha_eq,
+                                        *model_params, noise)
+        finally:
+            set_num_threads(previous)
+    
+    workers = os.cpu_count() if n_jobs == -1 else (n_jobs or 1)
+    workers = min(workers, len(states0))
+    if workers <= 1:
+        return _integrate_batch_rk4(states0, t, H_eq, V_eq, alpha_eq,
+                                    *model_params, noise)
+    
+    chunks = np.array_split(np.arange(len(states0)), workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(
+            _integrate_batch_rk4,
+            *zip(*[(states0[c], t, H_eq[c], V_eq[c], alpha_eq[c], *model_params,
+                    noise[c]) for c in chunks])
+        )
+        return np.concatenate(list(parts), axis=1)
+
+
+def _outside_unit_interval(**params: np.ndarray) -> Dict[str, np.ndarray]:
+    """Boolean masks of the entries of each parameter array outside [0, 1]."""
+    return {name: ~((arr >= 0) & (arr <= 1)) for name, arr in params.items()}
+
+
+def _check_trajectory(**params: np.ndarray) -> None:
+    """
+    Raise ValueError if a simulated trajectory leaves [0, 1].
+    
+    The metrics are evaluated with the unchecked _core(), so the range check
+    calculate_LEI() used to make point by point is done here in one
+    vectorized pass; as before, the error names the first time step and
+    parameter that is out of range.
+    """
+    outside = _outside_unit_interval(**params)
+    any_outside = np.logical_or.reduce(list(outside.values()))
+    if any_outside.any():
+        k = np.argmax(any_outside)
+        for name, mask in outside.items():
+            if mask[k]:
+                raise ValueError(f"{name} must be in [0, 1], got {params[name][k]}")
+
+
+def _model_args(params: Dict) -> Tuple[float, ...]:
+    """
+    Unpack an ode_system() params dict into the kernels' positional
+    arguments (H_eq, V_eq, alpha_eq, gamma_H, gamma_V, beta, sigma_H,
+    sigma_V, sigma_alpha), applying simulate_evolution()'s defaults.
+    """
+    return (
+        params['H_eq'], params['V_eq'], params['alpha_eq'],
+        params.get('gamma_H', 0.05), params.get('gamma_V', 0.08),
+        params.get('beta', 0.015),
+        params.get('sigma_H', 0.01), params.get('sigma_V', 0.01),
+        params.get('sigma_alpha', 0.005)
+    )
+
+
 def ode_system(
     state: np.ndarray,
     t: float,
-    params: Dict
+    params: Dict,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     ODE system for (H, V, α) evolution.
@@ -112,44 +613,41 @@ def ode_system(
             - H_eq, V_eq, alpha_eq: Equilibrium targets
             - gamma_H, gamma_V, beta: Convergence rates
             - sigma_H, sigma_V, sigma_alpha: Noise magnitudes
-            - noise_seed: Random seed for reproducibility
+            - noise_seed: Random seed for reproducibility (noise for year t
+              is row int(t) of _sample_noise(noise_seed, ...))
+        out: Optional length-3 array to write the derivatives into, e.g. a
+            buffer reused across calls by a custom integrator
     
     Returns:
-        array: [dH/dt, dV/dt, dα/dt]
-    """
-    H, V, alpha = state
-    
-    # Extract parameters
-    H_eq = params['H_eq']
-    V_eq = params['V_eq']
-    alpha_eq = params['alpha_eq']
-    gamma_H = params.get('gamma_H', 0.05)
-    gamma_V = params.get('gamma_V', 0.08)
-    beta = params.get('beta', 0.015)
-    sigma_H = params.get('sigma_H', 0.01)
-    sigma_V = params.get('sigma_V', 0.01)
-    sigma_alpha = params.get('sigma_alpha', 0.005)
-    
-    # Generate reproducible noise
-    np.random.seed(params.get('noise_seed', 42) + int(t * 1000))
-    noise_H = np.random.normal(0, 1)
-    noise_V = np.random.normal(0, 1)
-    noise_alpha = np.random.normal(0, 1)
-    
-    # Selection pressure function (depends on distance from φ)
-    if V > 0:
-        HV_ratio = H / V
-        distance_phi = abs(HV_ratio - PHI)
-        selection_pressure = np.exp(-distance_phi)  # Higher when near φ
-    else:
-        selection_pressure = 0.0
+        array: [dH/dt, dV/dt, dα/dt] (out itself when given)
+    """
+    if out is None:
+        out = np.empty(3)
+    out[0], out[1], out[2] = _ode_system_core(
+        state, t, *_model_args(params),
+        _noise_table(params.get('noise_seed', 42), 1 << max(int(t), 0).bit_length())
+    )
+    return out
+
+
+def ode_jacobian(
+    state: np.ndarray,
+    t: float,
+    params: Dict
+) -> np.ndarray:
+    """
+    Analytic Jacobian of ode_system() with respect to [H, V, α].
     
-    # ODE equations
-    dH_dt = gamma_H * (H_eq - H) + sigma_H * noise_H
-    dV_dt = gamma_V * (V_eq - V) + sigma_V * noise_V
-    dα_dt = beta * (alpha_eq - alpha) * selection_pressure + sigma_alpha * noise_alpha
+    Args:
+        state, t, params: As for ode_system()
     
-    return np.array([dH_dt, dV_dt, dα_dt])
+    Returns:
+        array: 3×3 matrix J[i, j] = ∂(d state_i/dt)/∂ state_j
+    """
+    return _ode_jacobian_core(
+        np.asarray(state, dtype=np.float64), t, *_model_args(params),
+        np.zeros((1, 3))
+    )
 
 
 def simulate_evolution(
@@ -163,7 +661,8 @@ def simulate_evolution(
     sigma_H: float = 0.01,
     sigma_V: float = 0.01,
     sigma_alpha: float = 0.005,
-    noise_seed: int = 42
+    noise_seed: int = 42,
+    solver: str = 'rk4'
 ) -> Dict:
     """
     Simulate temporal evolution of a legal system in Darwinian Space.
@@ -181,6 +680,19 @@ def simulate_evolution(
         sigma_H, sigma_V, sigma_alpha: Noise magnitudes (default: 0.01, 0.01, 0.005)
             - Represents institutional shocks
         noise_seed: Random seed for reproducibility
+        solver: 'rk4' (default), 'lsoda' or 'julia'
+            - 'rk4': compiled fixed-step Runge-Kutta 4 on the yearly grid.
+              Fast, and accurate for the default and scenario parameters,
+              which are non-stiff (rates well below 1/year).
+            - 'lsoda': SciPy solve_ivp(method='LSODA') with the analytic
+              Jacobian. Switches to an implicit method with a wider
+              stability region; use it when custom rates make the system
+              stiff (e.g. gamma_H or gamma_V of order 1 or more).
+            - 'julia': adaptive Tsit5 from DifferentialEquations.jl via the
+              optional diffeqpy package (requires a Julia installation).
+              For cross-checking against the SciPy/Julia ecosystem; the
+              right-hand side is a Python callback, so it is not faster
+              than 'rk4'.
     
     Returns:
         dict: {
@@ -213,6 +725,8 @@ def simulate_evolution(
         Final H/V = 1.625 ≈ φ = 1.618
     """
     # Input validation
+    if solver not in ('rk4', 'lsoda', 'julia'):
+        raise ValueError(f"Unknown solver: {solver}. Use 'rk4', 'lsoda' or 'julia'")
     for param, name in [(H0, 'H0'), (V0, 'V0'), (alpha0, 'alpha0')]:
         if not 0 <= param <= 1:
             raise ValueError(f"{name} must be in [0, 1], got {param}")
@@ -220,42 +734,33 @@ def simulate_evolution(
     # Calculate equilibrium
     H_eq, V_eq, alpha_eq = calculate_equilibrium(H0, V0, alpha0)
     
-    # Setup ODE parameters
-    params = {
-        'H_eq': H_eq,
-        'V_eq': V_eq,
-        'alpha_eq': alpha_eq,
-        'gamma_H': gamma_H,
-        'gamma_V': gamma_V,
-        'beta': beta,
-        'sigma_H': sigma_H,
-        'sigma_V': sigma_V,
-        'sigma_alpha': sigma_alpha,
-        'noise_seed': noise_seed
-    }
-    
     # Time grid
     t = np.linspace(0, years, years + 1)
     
     # Initial state
-    state0 = np.array([H0, V0, alpha0])
+    state0 = np.array([H0, V0, alpha0], dtype=np.float64)
     
-    # Solve ODE
-    solution = odeint(ode_system, state0, t, args=(params,))
+    # Solve ODE (compiled right-hand side, parameters passed positionally)
+    noise = _sample_noise(noise_seed, len(t) - 1)
+    args = (H_eq, V_eq, alpha_eq, gamma_H, gamma_V, beta,
+            sigma_H, sigma_V, sigma_alpha, noise)
+    if solver == 'rk4':
+        solution = _integrate_rk4(state0, t, *args)
+    elif solver == 'lsoda':
+        solution = _integrate_lsoda(state0, t, args)
+    else:
+        solution = _integrate_julia(state0, t, args)
     
     # Extract trajectories
     H_traj = solution[:, 0]
     V_traj = solution[:, 1]
     alpha_traj = solution[:, 2]
     
-    # Calculate derived metrics
-    from lei_calculator.metrics import calculate_LEI, calculate_d_phi
-    
-    LEI_traj = np.array([calculate_LEI(H, V, alpha) 
-                         for H, V, alpha in zip(H_traj, V_traj, alpha_traj)])
-    
-    d_phi_traj = np.array([calculate_d_phi(H, V) 
-                           for H, V in zip(H_traj, V_traj)])
+    # Calculate derived metrics over the whole trajectory in one pass
+    _check_trajectory(H=H_traj, V=V_traj, alpha=alpha_traj)
+    metrics = _core(H_traj, V_traj, alpha_traj)
+    LEI_traj = metrics.LEI
+    d_phi_traj = metrics.d_phi
     
     return {
         'time': t,
@@ -270,28 +775,94 @@ def simulate_evolution(
     }
 
 
+@dataclass(slots=True)
+class BatchResult:
+    """
+    Ensemble of trajectories stored as contiguous (N, T) arrays.
+    
+    Row i of every *_all array and entry i of every per-trajectory vector
+    belong to the same simulation. Indexing or iterating yields the
+    per-trajectory dicts returned by earlier versions, so
+    ``for traj in result: traj['d_phi']`` keeps working.
+    """
+    time: np.ndarray
+    H_all: np.ndarray
+    V_all: np.ndarray
+    alpha_all: np.ndarray
+    LEI_all: np.ndarray
+    d_phi_all: np.ndarray
+    H0s: np.ndarray
+    V0s: np.ndarray
+    alpha0s: np.ndarray
+    H_eqs: np.ndarray
+    V_eqs: np.ndarray
+    alpha_eqs: np.ndarray
+    simulation_ids: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.simulation_ids)
+    
+    def __getitem__(self, i: int) -> Dict:
+        return {
+            'time': self.time,
+            'H': self.H_all[i],
+            'V': self.V_all[i],
+            'alpha': self.alpha_all[i],
+            'LEI': self.LEI_all[i],
+            'd_phi': self.d_phi_all[i],
+            'H_eq': self.H_eqs[i],
+            'V_eq': self.V_eqs[i],
+            'alpha_eq': self.alpha_eqs[i],
+            'simulation_id': int(self.simulation_ids[i]),
+            'H0': self.H0s[i],
+            'V0': self.V0s[i],
+            'alpha0': self.alpha0s[i]
+        }
+    
+    def __iter__(self) -> Iterator[Dict]:
+        return (self[i] for i in range(len(self)))
+
+
 def simulate_multiple_trajectories(
     n_simulations: int = 100,
     years: int = 200,
     H_range: Tuple[float, float] = (0.3, 0.95),
     V_range: Tuple[float, float] = (0.1, 0.85),
     alpha_range: Tuple[float, float] = (0.1, 0.80),
+    n_jobs: Optional[int] = None,
+    dtype: type = np.float64,
     **kwargs
-) -> List[Dict]:
+) -> BatchResult:
     """
     Simulate multiple trajectories from random initial conditions.
     
     Reproduces Section V.D: "Convergence Analysis" showing that systems
     converge to φ equilibrium from diverse starting points.
     
+    All trajectories are integrated together by one batched RK4 kernel
+    (multithreaded across trajectories when Numba is available) rather
+    than by n_simulations separate simulate_evolution() calls.
+    
     Args:
         n_simulations: Number of trajectories (default: 100)
         years: Duration per simulation
         H_range, V_range, alpha_range: Bounds for random initial conditions
-        **kwargs: Additional parameters passed to simulate_evolution()
+        n_jobs: Cores to use; None uses all Numba threads, or runs serially
+            when Numba is unavailable; -1 uses every core
+        dtype: Storage precision of the state and noise arrays, np.float64
+            (default) or np.float32. float32 halves the memory traffic of
+            large ensembles; the σ ≈ 0.01 noise is far above its rounding
+            error, but results are no longer bit-identical to
+            simulate_evolution()
+        **kwargs: Model parameters as in simulate_evolution() (gamma_H,
+            gamma_V, beta, sigma_H, sigma_V, sigma_alpha, noise_seed)
     
     Returns:
-        list: List of n_simulations result dictionaries
+        BatchResult: (N, T) arrays for the N = n_simulations trajectories
+            iterating it yields one result dict per trajectory
+    
+    Raises:
+        ValueError: If a range extends outside [0, 1]
     
     Example:
         >>> # Reproduce Section V.D convergence analysis
@@ -312,41 +883,93 @@ def simulate_multiple_trajectories(
         >>> print(f"Average final H/V = {avg_ratio:.3f} ≈ φ = {PHI:.3f}")
         Average final H/V = 1.622 ≈ φ = 1.618
     """
-    np.random.seed(kwargs.get('noise_seed', 42))
+    noise_seed = kwargs.pop('noise_seed', 42)
+    gamma_H = kwargs.pop('gamma_H', 0.05)
+    gamma_V = kwargs.pop('gamma_V', 0.08)
+    beta = kwargs.pop('beta', 0.015)
+    sigma_H = kwargs.pop('sigma_H', 0.01)
+    sigma_V = kwargs.pop('sigma_V', 0.01)
+    sigma_alpha = kwargs.pop('sigma_alpha', 0.005)
+    if kwargs:
+        raise TypeError(f"Unexpected keyword arguments: {', '.join(kwargs)}")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+    # Validate the sampling ranges once; every draw then lies in [0, 1]
+    for (low, high), name in [(H_range, 'H_range'), (V_range, 'V_range'),
+                              (alpha_range, 'alpha_range')]:
+        if not 0 <= low <= high <= 1:
+            raise ValueError(f"{name} must satisfy 0 <= low <= high <= 1, "
+                             f"got {(low, high)}")
+    
+    # Random initial conditions, one (H0, V0, α0) row per trajectory, drawn
+    # from a local Generator so the global NumPy random state is untouched.
+    # The stream is a spawned child of noise_seed, independent of the
+    # default_rng(noise_seed) shocks that trajectory 0 integrates with
+    rng = np.random.default_rng(np.random.SeedSequence(noise_seed).spawn(1)[0])
+    initial = np.column_stack((
+        rng.uniform(*H_range, n_simulations),
+        rng.uniform(*V_range, n_simulations),
+        rng.uniform(*alpha_range, n_simulations)
+    ))
     
-    trajectories = []
+    ids = np.arange(n_simulations)
     
+    equilibria = _equilibria_batch(initial[:, 0], initial[:, 1], initial[:, 2])
+    
+    t = np.linspace(0, years, years + 1)
+    # One seeded draw per trajectory rather than a single (N, T, 3) block:
+    # trajectory i then reproduces simulate_evolution(..., noise_seed=
+    # noise_seed + i) exactly, and the draws are cheap next to the RK4 pass
+    noise = np.empty((n_simulations, len(t) - 1, 3), dtype=dtype)
     for i in range(n_simulations):
-        # Random initial conditions
-        H0 = np.random.uniform(*H_range)
-        V0 = np.random.uniform(*V_range)
-        alpha0 = np.random.uniform(*alpha_range)
-        
-        # Unique seed per trajectory
-        kwargs_copy = kwargs.copy()
-        kwargs_copy['noise_seed'] = kwargs.get('noise_seed', 42) + i
-        
-        # Simulate
-        try:
-            result = simulate_evolution(H0, V0, alpha0, years, **kwargs_copy)
-            result['simulation_id'] = i
-            result['H0'] = H0
-            result['V0'] = V0
-            result['alpha0'] = alpha0
-            trajectories.append(result)
-        except Exception as e:
-            warnings.warn(f"Simulation {i} failed: {e}")
-            continue
+        noise[i] = _sample_noise(noise_seed + i, len(t) - 1)[:len(t) - 1]
     
-    return trajectories
+    states = _run_batch(
+        np.ascontiguousarray(initial, dtype=dtype), t,
+        np.ascontiguousarray(equilibria[:, 0], dtype=dtype),
+        np.ascontiguousarray(equilibria[:, 1], dtype=dtype),
+        np.ascontiguousarray(equilibria[:, 2], dtype=dtype),
+        (gamma_H, gamma_V, beta, sigma_H, sigma_V, sigma_alpha),
+        noise, n_jobs
+    )
+    
+    # One diverging trajectory should not abort a Monte Carlo run, so the
+    # range check that simulate_evolution() enforces is reported instead
+    outside = _outside_unit_interval(H=states[0], V=states[1], alpha=states[2])
+    n_outside = np.logical_or.reduce(list(outside.values())).any(axis=1).sum()
+    if n_outside:
+        warnings.warn(f"{n_outside} of {n_simulations} trajectories leave [0, 1]; "
+                      "their LEI and d_φ values lie outside the model's domain")
+    metrics = _core(states[0], states[1], states[2])
+    
+    return BatchResult(
+        time=t,
+        H_all=states[0],
+        V_all=states[1],
+        alpha_all=states[2],
+        LEI_all=metrics.LEI,
+        d_phi_all=metrics.d_phi,
+        H0s=initial[:, 0],
+        V0s=initial[:, 1],
+        alpha0s=initial[:, 2],
+        H_eqs=equilibria[:, 0],
+        V_eqs=equilibria[:, 1],
+        alpha_eqs=equilibria[:, 2],
+        simulation_ids=ids
+    )
 
 
-def analyze_convergence(trajectories: List[Dict], threshold_dphi: float = 0.5) -> Dict:
+def analyze_convergence(
+    trajectories: Union[BatchResult, List[Dict]],
+    threshold_dphi: float = 0.5
+) -> Dict:
     """
     Analyze convergence properties of multiple trajectories.
     
     Args:
-        trajectories: List of simulation results
+        trajectories: BatchResult from simulate_multiple_trajectories(), or
+            a list of simulate_evolution() results of equal length
         threshold_dphi: Convergence threshold (default: 0.5)
     
     Returns:
@@ -359,42 +982,46 @@ def analyze_convergence(trajectories: List[Dict], threshold_dphi: float = 0.5) -
         >>> print(f"Mean convergence time: {stats['mean_convergence_time']:.1f} years")
         >>> print(f"Final mean d_φ: {stats['final_mean_dphi']:.3f}")
     """
-    n_total = len(trajectories)
+    if isinstance(trajectories, BatchResult):
+        time = trajectories.time
+        H_all = trajectories.H_all
+        V_all = trajectories.V_all
+        d_phi_all = trajectories.d_phi_all
+    else:
+        time = trajectories[0]['time']
+        H_all = np.array([traj['H'] for traj in trajectories])
+        V_all = np.array([traj['V'] for traj in trajectories])
+        d_phi_all = np.array([traj['d_phi'] for traj in trajectories])
+    
+    n_total = len(d_phi_all)
     
     # Count convergence
-    converged = []
-    convergence_times = []
-    final_dphis = []
-    final_ratios = []
-    
-    for traj in trajectories:
-        d_phi_traj = traj['d_phi']
-        final_dphi = d_phi_traj[-1]
-        final_dphis.append(final_dphi)
-        
-        if final_dphi < threshold_dphi:
-            converged.append(traj)
-            
-            # Find convergence time (first time d_φ < threshold)
-            conv_idx = np.where(d_phi_traj < threshold_dphi)[0]
-            if len(conv_idx) > 0:
-                convergence_times.append(traj['time'][conv_idx[0]])
-        
-        # Final H/V ratio
-        if traj['V'][-1] > 0.1:
-            final_ratios.append(traj['H'][-1] / traj['V'][-1])
+    final_dphis = d_phi_all[:, -1]
+    converged_mask = final_dphis < threshold_dphi
+    n_converged = int(converged_mask.sum())
+    
+    # Convergence time: first step with d_φ < threshold. Every converged
+    # trajectory ends below it, so argmax always finds a True on those rows
+    first_below = (d_phi_all < threshold_dphi).argmax(axis=1)
+    convergence_times = time[first_below[converged_mask]]
+    
+    # Final H/V ratio
+    H_final = H_all[:, -1]
+    V_final = V_all[:, -1]
+    defined = V_final > 0.1
+    final_ratios = H_final[defined] / V_final[defined]
     
     return {
         'n_total': n_total,
-        'n_converged': len(converged),
-        'convergence_rate': len(converged) / n_total,
-        'mean_convergence_time': np.mean(convergence_times) if convergence_times else np.nan,
-        'std_convergence_time': np.std(convergence_times) if convergence_times else np.nan,
-        'final_mean_dphi': np.mean(final_dphis),
-        'final_std_dphi': np.std(final_dphis),
-        'final_mean_HV_ratio': np.mean(final_ratios) if final_ratios else np.nan,
-        'final_std_HV_ratio': np.std(final_ratios) if final_ratios else np.nan,
-        'distance_to_phi': abs(np.mean(final_ratios) - PHI) if final_ratios else np.nan
+        'n_converged': n_converged,
+        'convergence_rate': n_converged / n_total,
+        'mean_convergence_time': convergence_times.mean() if convergence_times.size else np.nan,
+        'std_convergence_time': convergence_times.std() if convergence_times.size else np.nan,
+        'final_mean_dphi': final_dphis.mean(),
+        'final_std_dphi': final_dphis.std(),
+        'final_mean_HV_ratio': final_ratios.mean() if final_ratios.size else np.nan,
+        'final_std_HV_ratio': final_ratios.std() if final_ratios.size else np.nan,
+        'distance_to_phi': abs(final_ratios.mean() - PHI) if final_ratios.size else np.nan
     }
 
 
@@ -418,7 +1045,8 @@ def predict_future_trajectory(
     Args:
         H_current, V_current, alpha_current: Current parameters
         years_ahead: Forecast horizon
-        scenario: One of ['baseline', 'reform', 'lock-in', 'crisis']
+        scenario: A key of SCENARIOS: 'baseline', 'reform', 'lock-in' or
+            'crisis'
         **kwargs: Override convergence rates, noise
     
     Returns:
@@ -440,19 +1068,12 @@ def predict_future_trajectory(
         >>> print(f"Reform scenario 2074: LEI={reform['LEI'][-1]:.3f}")
     """
     # Scenario-specific parameters
-    if scenario == 'reform':
-        kwargs.setdefault('gamma_V', 0.12)  # Faster V increase
-        kwargs.setdefault('gamma_H', 0.04)  # Slower H increase
-    elif scenario == 'lock-in':
-        kwargs.setdefault('gamma_V', 0.04)  # Slower V increase
-        kwargs.setdefault('gamma_H', 0.07)  # Faster H increase
-        kwargs.setdefault('sigma_V', 0.005)  # Less variation
-    elif scenario == 'crisis':
-        kwargs.setdefault('sigma_H', 0.03)  # High noise
-        kwargs.setdefault('sigma_V', 0.03)
-        kwargs.setdefault('sigma_alpha', 0.015)
-    elif scenario != 'baseline':
-        raise ValueError(f"Unknown scenario: {scenario}. Use 'baseline', 'reform', 'lock-in', or 'crisis'")
+    try:
+        overrides = SCENARIOS[scenario]
+    except KeyError:
+        raise ValueError(f"Unknown scenario: {scenario}. Use 'baseline', 'reform', 'lock-in', or 'crisis'") from None
+    for name, value in overrides.items():
+        kwargs.setdefault(name, value)
     
     result = simulate_evolution(
         H_current, V_current, alpha_current,
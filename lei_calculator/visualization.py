@@ -6,6 +6,7 @@ Publication-ready plotting functions for paper figures.
 
 Key functions:
 - plot_darwinian_space_3D(): Figure 5.1 - 3D scatter in (H, V, α) space
+- build_darwinian_scene(): Figure 5.1 geometry, reusable across renders
 - plot_transplant_success(): Figure 8.1 - Success vs d_φ with logistic curve
 - plot_chi_map(): Figure 9.1 - Global choropleth map
 
@@ -16,19 +17,37 @@ Author: Ignacio Adrian Lerer
 License: MIT
 """
 
+import os
+import warnings
 import numpy as np
 import pandas as pd
+from collections import namedtuple
+from functools import lru_cache
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import plotly.graph_objects as go
 import plotly.express as px
 
-from lei_calculator.metrics import calculate_LEI, calculate_d_phi, calculate_CHI
+from lei_calculator.metrics import (
+    calculate_LEI, calculate_d_phi, calculate_CHI, ZONE_NAMES,
+    _core, _zone_code, _ZONE_NAMES_ARRAY
+)
 
 # Golden Ratio
 PHI = (1 + np.sqrt(5)) / 2
 
+# Natural Earth 1:110m country boundaries for the static CHI map
+_NATURAL_EARTH_URL = (
+    'https://naciscdn.org/naturalearth/110m/cultural/ne_110m_admin_0_countries.zip'
+)
+
+# Optional CHI map columns shown on hover (formatted to 3 decimals)
+_HOVER_COLS = ('H', 'V', 'alpha', 'LEI', 'd_phi')
+
+# Case count above which plot_transplant_success rasterizes its scatter
+_DATASHADER_MIN_SIZE = 5000
+
 # Colorblind-friendly palette
 COLORS = {
     'goldilocks': '#2ecc71',  # Green
@@ -39,12 +58,338 @@ COLORS = {
 }
 
 
-def plot_darwinian_space_3D(
+def _zone_color(zone_name: str) -> str:
+    """Marker color for a zone label, by keyword."""
+    if 'Goldilocks' in zone_name:
+        return COLORS['goldilocks']
+    elif 'Rigidity' in zone_name or 'Lock-in' in zone_name:
+        return COLORS['red_zone']
+    elif 'Chaos' in zone_name:
+        return COLORS['yellow_zone']
+    else:
+        return COLORS['blue_zone']
+
+
+# Marker color for every zone classify_zone() can return
+ZONE_TO_COLOR = {zone: _zone_color(zone) for zone in ZONE_NAMES}
+
+# Figure 9.1 CHI color scale and colorbar (constant across renders)
+CHI_COLORSCALE = (
+    (0.0, COLORS['red_zone']),      # CHI < 0.2: Critical
+    (0.2, '#e67e22'),               # CHI 0.2-0.4: Poor
+    (0.4, COLORS['yellow_zone']),   # CHI 0.4-0.6: Fair
+    (0.6, COLORS['blue_zone']),     # CHI 0.6-0.8: Good
+    (0.8, COLORS['goldilocks'])     # CHI > 0.8: Excellent
+)
+CHI_COLORBAR = dict(
+    title="CHI",
+    tickvals=(0.2, 0.4, 0.6, 0.8),
+    ticktext=('Poor', 'Fair', 'Good', 'Excellent')
+)
+
+
+def _cache_dir() -> str:
+    """Per-user cache directory for downloaded map data ($XDG_CACHE_HOME)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'lei_calculator')
+
+
+@lru_cache(maxsize=1)
+def _load_world():
+    """
+    Natural Earth country boundaries as a GeoDataFrame.
+    
+    The archive is downloaded on first use and kept in _cache_dir(), so
+    later renders work offline; within a process the parsed frame is
+    memoized. Callers must not modify the returned frame in place.
+    """
+    import geopandas as gpd
+    from urllib.request import urlretrieve
+    
+    path = os.path.join(_cache_dir(), os.path.basename(_NATURAL_EARTH_URL))
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = path + '.part'
+        urlretrieve(_NATURAL_EARTH_URL, partial)
+        os.replace(partial, path)  # never leave a truncated archive behind
+    return gpd.read_file(path)
+
+
+def _save_plotly(fig: go.Figure, save_path: str, width: int, height: int) -> None:
+    """
+    Save a Plotly figure as HTML or, for any other extension, a static image.
+    
+    HTML loads plotly.js from the CDN instead of inlining the ~3 MB bundle,
+    so files stay small and are written quickly (viewing needs a network
+    connection). Plotly serializes with orjson automatically when installed.
+    """
+    if save_path.endswith('.html'):
+        fig.write_html(save_path, include_plotlyjs='cdn', include_mathjax=False,
+                       full_html=True, config={'displaylogo': False})
+    else:
+        fig.write_image(save_path, width=width, height=height)
+
+
+def _has_datashader() -> bool:
+    """True if the optional datashader package can be imported."""
+    try:
+        import datashader  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _rasterize_points(ax: plt.Axes, x: np.ndarray, y: np.ndarray) -> None:
+    """
+    Draw a point cloud as one datashader density image on ax.
+    
+    Rendering cost depends on the canvas size rather than the number of
+    points; curves and annotations drawn afterwards stay vector.
+    """
+    try:
+        import datashader as ds
+        import datashader.transfer_functions as tf
+    except ImportError:
+        raise ImportError("datashader required for rasterized scatter. Install with: pip install datashader")
+    
+    x_range = (float(x.min()), float(x.max()))
+    y_range = (-0.1, 1.1)
+    canvas = ds.Canvas(plot_width=800, plot_height=600,
+                       x_range=x_range, y_range=y_range)
+    agg = canvas.points(pd.DataFrame({'x': x, 'y': y}), 'x', 'y')
+    image = tf.shade(agg, cmap=['lightblue', COLORS['blue_zone']], how='log')
+    
+    # Packed uint32 RGBA -> (rows, cols, 4); row 0 is the lowest y
+    rgba = image.data.view(np.uint8).reshape(image.shape + (4,))
+    ax.imshow(rgba, extent=(*x_range, *y_range), origin='lower',
+              aspect='auto', interpolation='nearest')
+
+
+def _is_iso3(countries: pd.Series) -> bool:
+    """True if every country identifier is an upper-case ISO-3 code."""
+    return bool(countries.astype(str).str.fullmatch(r'[A-Z]{3}').all())
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """
+    Pearson r and two-sided p-value (t-test with n - 2 degrees of freedom,
+    as scipy.stats.pearsonr and spearmanr report).
+    """
+    from scipy.special import stdtr
+    
+    n = len(x)
+    dx = x - x.mean()
+    dy = y - y.mean()
+    r = float((dx * dy).sum() / np.sqrt((dx * dx).sum() * (dy * dy).sum()))
+    r = max(-1.0, min(1.0, r))
+    if abs(r) == 1.0:
+        return r, 0.0
+    t = abs(r) * np.sqrt((n - 2) / (1.0 - r * r))
+    return r, float(2 * stdtr(n - 2, -t))
+
+
+# Angles for the Goldilocks Zone cylinder outline
+_THETA = np.linspace(0, 2*np.pi, 30)
+_THETA.setflags(write=False)
+
+
+@lru_cache(maxsize=4)
+def _phi_surface(n: int = 20) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read-only (H, V, α) grids of the φ surface H = φV on an n×n mesh,
+    with H capped at 1. Cached, since the mesh never changes.
+    """
+    v_mesh = np.linspace(0, 1, n)
+    alpha_mesh = np.linspace(0, 1, n)
+    V_grid, Alpha_grid = np.meshgrid(v_mesh, alpha_mesh)
+    # H = min(φV, 1) in one buffer; V >= 0, so no lower clip is needed
+    H_grid = np.multiply(V_grid, PHI)
+    np.minimum(H_grid, 1.0, out=H_grid)
+    for grid in (H_grid, V_grid, Alpha_grid):
+        grid.setflags(write=False)
+    return H_grid, V_grid, Alpha_grid
+
+
+def _fit_logistic_batch(
+    X: np.ndarray,
+    Y: np.ndarray,
+    C: float = 1.0,
+    max_iter: int = 100,
+    tol: float = 1e-10
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fit B one-feature logistic regressions at once by Newton-Raphson.
+    
+    Row b of the (B, n) arrays X and Y is one sample. Minimizes the same
+    objective as sklearn's default LogisticRegression (L2 penalty on the
+    slope with strength 1/C, unpenalized intercept), solving the 2×2
+    Newton system in closed form for every row simultaneously.
+    
+    Returns:
+        tuple: (intercepts, slopes), each of shape (B,)
+    """
+    l2 = 1.0 / C
+    b0 = np.zeros(X.shape[0])
+    b1 = np.zeros(X.shape[0])
+    
+    for _ in range(max_iter):
+        z = np.clip(b0[:, None] + b1[:, None] * X, -35.0, 35.0)
+        p = 1.0 / (1.0 + np.exp(-z))
+        r = Y - p
+        w = p * (1.0 - p)
+        wX = w * X
+        
+        # Gradient and Hessian of the penalized log-likelihood
+        g0 = r.sum(axis=1)
+        g1 = (r * X).sum(axis=1) - l2 * b1
+        h00 = w.sum(axis=1)
+        h01 = wX.sum(axis=1)
+        h11 = (wX * X).sum(axis=1) + l2
+        det = h00 * h11 - h01 * h01
+        
+        step0 = (h11 * g0 - h01 * g1) / det
+        step1 = (h00 * g1 - h01 * g0) / det
+        b0 += step0
+        b1 += step1
+        if max(np.abs(step0).max(), np.abs(step1).max()) < tol:
+            break
+    
+    return b0, b1
+
+
+def _bootstrap_logistic(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_bootstrap: int,
+    rng: np.random.Generator,
+    block_size: int = 100
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bootstrap (intercept, slope) estimates of the one-feature logistic fit.
+    
+    Resamples are drawn and fitted block_size at a time, so memory stays
+    O(block_size·n) however large the dataset is. A resample holding a
+    single outcome class has no finite fit (sklearn refuses it), so such
+    resamples are skipped with a warning rather than turning the whole
+    confidence band into NaN.
+    
+    Returns:
+        tuple: (intercepts, slopes) of the usable resamples
+    """
+    b0_blocks, b1_blocks = [], []
+    n_skipped = 0
+    for start in range(0, n_bootstrap, block_size):
+        size = min(block_size, n_bootstrap - start)
+        idx = rng.integers(0, len(x), size=(size, len(x)))
+        Y = y[idx]
+        mixed = Y.min(axis=1) != Y.max(axis=1)
+        n_skipped += size - int(mixed.sum())
+        if mixed.any():
+            b0, b1 = _fit_logistic_batch(x[idx[mixed]], Y[mixed])
+            b0_blocks.append(b0)
+            b1_blocks.append(b1)
+    
+    if n_skipped:
+        warnings.warn(f"{n_skipped} of {n_bootstrap} bootstrap resamples contain "
+                      "a single outcome class and were left out of the CI")
+    if not b0_blocks:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(b0_blocks), np.concatenate(b1_blocks)
+
+
+# Precomputed Figure 5.1 geometry: per-country marker arrays plus the
+# optional φ surface grids and Goldilocks ring outline (None when hidden)
+DarwinianScene = namedtuple(
+    'DarwinianScene',
+    ['H', 'V', 'alpha', 'LEI', 'colors', 'names', 'phi_surface', 'rings']
+)
+
+
+def build_darwinian_scene(
     countries_data: pd.DataFrame,
+    show_goldilocks: bool = True,
+    show_phi_surface: bool = True
+) -> DarwinianScene:
+    """
+    Compute everything plot_darwinian_space_3D() draws, without drawing.
+    
+    Build once and pass the scene to plot_darwinian_space_3D() for each
+    output format (e.g. static PDF and interactive HTML), so the metrics,
+    zone colors and surface geometry are derived a single time.
+    
+    Args:
+        countries_data: DataFrame as for plot_darwinian_space_3D()
+        show_goldilocks: Include the Goldilocks Zone cylinder outline
+        show_phi_surface: Include the Golden Ratio surface grids
+    
+    Returns:
+        DarwinianScene: Plain arrays; phi_surface is an (H, V, α) tuple
+            of grids and rings an (M, 3) array of NaN-separated outlines
+    
+    Example:
+        >>> scene = build_darwinian_scene(data)
+        >>> plot_darwinian_space_3D(scene, save_path='figure_5_1.pdf', interactive=False)
+        >>> plot_darwinian_space_3D(scene, save_path='figure_5_1.html')
+    """
+    H = countries_data['H'].to_numpy(dtype=np.float64)
+    V = countries_data['V'].to_numpy(dtype=np.float64)
+    alpha = countries_data['alpha'].to_numpy(dtype=np.float64)
+    
+    # LEI and zones are derived into local arrays when absent; the
+    # caller's DataFrame is never modified
+    if 'LEI' in countries_data.columns:
+        LEI = countries_data['LEI'].to_numpy(dtype=np.float64)
+    else:
+        LEI = calculate_LEI(H, V, alpha)
+    
+    # Classify zones if not present (same precedence as classify_zone)
+    if 'zone' in countries_data.columns:
+        zones = countries_data['zone']
+    else:
+        HV_ratio, d_phi, _, _ = _core(H, V, alpha)
+        zones = pd.Series(_ZONE_NAMES_ARRAY[_zone_code(HV_ratio, d_phi, V, alpha)],
+                          index=countries_data.index)
+    
+    # Map zones to colors: one hash lookup per row, substring rules only
+    # for custom zone labels outside ZONE_NAMES
+    colors = zones.map(ZONE_TO_COLOR)
+    custom = colors.isna()
+    if custom.any():
+        colors[custom] = zones[custom].map(_zone_color)
+    
+    # Marker attributes as plain arrays, so neither backend converts Series
+    colors = colors.to_numpy()
+    names = countries_data['country'].to_numpy()
+    
+    rings = None
+    if show_goldilocks:
+        # Cylinder parameters: H/V ≈ φ, α > 0.5, V > 0.4
+        theta = _THETA
+        v_cyl = 0.55  # Center V
+        radius = 0.15  # Tolerance around φV
+        
+        # Both rings go into one trace; a NaN row breaks the line between them
+        gap = np.full((1, 3), np.nan)
+        segments = []
+        # The ellipse is the same at every α level; only z changes
+        x_base = v_cyl * PHI + radius * np.cos(theta)
+        y_base = v_cyl + (radius/PHI) * np.sin(theta)
+        for alpha_level in [0.5, 0.8]:
+            z_cyl = np.full_like(x_base, alpha_level)
+            segments += [np.column_stack((x_base, y_base, z_cyl)), gap]
+        rings = np.vstack(segments[:-1])
+    
+    return DarwinianScene(H, V, alpha, LEI, colors, names,
+                          _phi_surface() if show_phi_surface else None, rings)
+
+
+def plot_darwinian_space_3D(
+    countries_data: Union[pd.DataFrame, DarwinianScene],
     save_path: Optional[str] = None,
     show_goldilocks: bool = True,
     show_phi_surface: bool = True,
-    interactive: bool = True
+    interactive: bool = True,
+    ax: Optional[plt.Axes] = None
 ) -> go.Figure:
     """
     Generate 3D scatter plot of countries in Darwinian Space (Figure 5.1).
@@ -61,10 +406,14 @@ def plot_darwinian_space_3D(
             - H, V, alpha: Darwinian parameters
             - LEI: Legal Evolvability Index (optional, will calculate)
             - zone: Classification (optional, will calculate)
+            or a DarwinianScene from build_darwinian_scene(), reused as is
         save_path: If provided, save as HTML (interactive) or PNG (static)
         show_goldilocks: Display Goldilocks Zone cylinder
         show_phi_surface: Display Golden Ratio surface
         interactive: If True, use Plotly (interactive). If False, use matplotlib (static)
+        ax: Existing 3D matplotlib axes to redraw into (static mode only),
+            e.g. when rendering many frames; its figure is reused instead
+            of allocating a new one
     
     Returns:
         plotly.graph_objects.Figure: Interactive 3D plot
@@ -80,33 +429,11 @@ def plot_darwinian_space_3D(
         >>> fig = plot_darwinian_space_3D(data, save_path='figure_5_1.html')
         >>> # Opens in browser automatically
     """
-    # Calculate LEI if not present
-    if 'LEI' not in countries_data.columns:
-        countries_data['LEI'] = countries_data.apply(
-            lambda row: calculate_LEI(row['H'], row['V'], row['alpha']),
-            axis=1
-        )
-    
-    # Classify zones if not present
-    if 'zone' not in countries_data.columns:
-        from lei_calculator.metrics import classify_zone
-        countries_data['zone'] = countries_data.apply(
-            lambda row: classify_zone(row['H'], row['V'], row['alpha']),
-            axis=1
-        )
-    
-    # Map zones to colors
-    def get_color(zone_name):
-        if 'Goldilocks' in zone_name:
-            return COLORS['goldilocks']
-        elif 'Rigidity' in zone_name or 'Lock-in' in zone_name:
-            return COLORS['red_zone']
-        elif 'Chaos' in zone_name:
-            return COLORS['yellow_zone']
-        else:
-            return COLORS['blue_zone']
-    
-    countries_data['color'] = countries_data['zone'].apply(get_color)
+    if isinstance(countries_data, DarwinianScene):
+        scene = countries_data
+    else:
+        scene = build_darwinian_scene(countries_data, show_goldilocks, show_phi_surface)
+    H, V, alpha, LEI, colors, names = scene[:6]
     
     if interactive:
         # Plotly 3D scatter
@@ -114,17 +441,17 @@ def plot_darwinian_space_3D(
         
         # Add country points
         fig.add_trace(go.Scatter3d(
-            x=countries_data['H'],
-            y=countries_data['V'],
-            z=countries_data['alpha'],
+            x=H,
+            y=V,
+            z=alpha,
             mode='markers+text',
             marker=dict(
-                size=countries_data['LEI'] * 15 + 5,  # Size by LEI
-                color=countries_data['color'],
+                size=LEI * 15 + 5,  # Size by LEI
+                color=colors,
                 opacity=0.8,
                 line=dict(color='white', width=0.5)
             ),
-            text=countries_data['country'],
+            text=names,
             textposition='top center',
             textfont=dict(size=9),
             hovertemplate='<b>%{text}</b><br>' +
@@ -136,12 +463,8 @@ def plot_darwinian_space_3D(
         ))
         
         # Add Golden Ratio φ surface (H = φV plane)
-        if show_phi_surface:
-            v_mesh = np.linspace(0, 1, 20)
-            alpha_mesh = np.linspace(0, 1, 20)
-            V_grid, Alpha_grid = np.meshgrid(v_mesh, alpha_mesh)
-            H_grid = PHI * V_grid
-            H_grid = np.clip(H_grid, 0, 1)  # Clip to valid range
+        if show_phi_surface and scene.phi_surface is not None:
+            H_grid, V_grid, Alpha_grid = scene.phi_surface
             
             fig.add_trace(go.Surface(
                 x=H_grid,
@@ -155,27 +478,18 @@ def plot_darwinian_space_3D(
             ))
         
         # Add Goldilocks Zone cylinder (bounded region)
-        if show_goldilocks:
-            # Cylinder parameters: H/V ≈ φ, α > 0.5, V > 0.4
-            theta = np.linspace(0, 2*np.pi, 30)
-            v_cyl = 0.55  # Center V
-            radius = 0.15  # Tolerance around φV
+        if show_goldilocks and scene.rings is not None:
+            rings = scene.rings
             
-            for alpha_level in [0.5, 0.8]:
-                x_cyl = v_cyl * PHI + radius * np.cos(theta)
-                y_cyl = v_cyl + (radius/PHI) * np.sin(theta)
-                z_cyl = np.full_like(x_cyl, alpha_level)
-                
-                fig.add_trace(go.Scatter3d(
-                    x=x_cyl,
-                    y=y_cyl,
-                    z=z_cyl,
-                    mode='lines',
-                    line=dict(color=COLORS['goldilocks'], width=3, dash='dash'),
-                    showlegend=(alpha_level == 0.5),
-                    name='Goldilocks Zone',
-                    hoverinfo='skip'
-                ))
+            fig.add_trace(go.Scatter3d(
+                x=rings[:, 0],
+                y=rings[:, 1],
+                z=rings[:, 2],
+                mode='lines',
+                line=dict(color=COLORS['goldilocks'], width=3, dash='dash'),
+                name='Goldilocks Zone',
+                hoverinfo='skip'
+            ))
         
         # Layout
         fig.update_layout(
@@ -196,10 +510,7 @@ def plot_darwinian_space_3D(
         
         # Save if requested
         if save_path:
-            if save_path.endswith('.html'):
-                fig.write_html(save_path)
-            else:
-                fig.write_image(save_path, width=1200, height=900)
+            _save_plotly(fig, save_path, width=1200, height=900)
             print(f"Saved Figure 5.1 to {save_path}")
         
         return fig
@@ -208,25 +519,28 @@ def plot_darwinian_space_3D(
         # Matplotlib static version (simpler, for PDF)
         from mpl_toolkits.mplot3d import Axes3D
         
-        fig = plt.figure(figsize=(12, 9))
-        ax = fig.add_subplot(111, projection='3d')
+        if ax is None:
+            fig = plt.figure(figsize=(12, 9))
+            ax = fig.add_subplot(111, projection='3d')
+        else:
+            fig = ax.figure
+            ax.clear()
         
         # Plot countries
         scatter = ax.scatter(
-            countries_data['H'],
-            countries_data['V'],
-            countries_data['alpha'],
-            s=countries_data['LEI'] * 200 + 50,
-            c=countries_data['color'],
+            H,
+            V,
+            alpha,
+            s=LEI * 200 + 50,
+            c=colors,
             alpha=0.7,
             edgecolors='white',
             linewidth=1.5
         )
         
-        # Labels
-        for _, row in countries_data.iterrows():
-            ax.text(row['H'], row['V'], row['alpha'], 
-                   f"  {row['country']}", size=8)
+        # Labels (plain arrays; iterrows would build a Series per country)
+        for h, v, a, name in zip(H, V, alpha, names):
+            ax.text(h, v, a, f"  {name}", size=8)
         
         ax.set_xlabel('H (Heredity)', fontsize=11)
         ax.set_ylabel('V (Variation)', fontsize=11)
@@ -236,7 +550,7 @@ def plot_darwinian_space_3D(
                      fontsize=13, fontweight='bold')
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
             print(f"Saved Figure 5.1 to {save_path}")
         
         return fig
@@ -246,7 +560,10 @@ def plot_transplant_success(
     transplants_data: pd.DataFrame,
     save_path: Optional[str] = None,
     show_regression: bool = True,
-    confidence_level: float = 0.95
+    confidence_level: float = 0.95,
+    seed: Optional[int] = 42,
+    ax: Optional[plt.Axes] = None,
+    use_datashader: Optional[bool] = None
 ) -> plt.Figure:
     """
     Generate scatter plot of transplant success vs d_φ with logistic curve (Figure 8.1).
@@ -264,6 +581,14 @@ def plot_transplant_success(
         save_path: Path to save figure (PNG, PDF)
         show_regression: Display logistic regression curve
         confidence_level: Confidence band level (default: 95%)
+        seed: Seed for the y-jitter and bootstrap resamples (default: 42,
+            so the figure is reproducible); pass None for fresh entropy
+        ax: Existing axes to redraw into, e.g. when rendering many frames;
+            its figure is reused instead of allocating a new one
+        use_datashader: Rasterize the points with datashader (optional
+            dependency) instead of drawing one marker each; None enables it
+            automatically above 5000 cases when datashader is installed.
+            Region colors and GDP sizes are not shown in raster mode
     
     Returns:
         matplotlib.figure.Figure
@@ -277,83 +602,98 @@ def plot_transplant_success(
         ... )
         >>> # Displays: scatter + logistic curve + 95% CI + correlation stats
     """
-    # Calculate d_φ if not present
-    if 'd_phi' not in transplants_data.columns:
-        if 'H_post' in transplants_data.columns and 'V_post' in transplants_data.columns:
-            transplants_data['d_phi'] = transplants_data.apply(
-                lambda row: calculate_d_phi(row['H_post'], row['V_post']),
-                axis=1
-            )
-        else:
-            raise ValueError("Need either 'd_phi' or ('H_post', 'V_post') columns")
+    # Calculate d_φ if not present (locally; transplants_data is not modified)
+    if 'd_phi' in transplants_data.columns:
+        d_phi = transplants_data['d_phi'].to_numpy(dtype=np.float64)
+    elif 'H_post' in transplants_data.columns and 'V_post' in transplants_data.columns:
+        d_phi = calculate_d_phi(
+            transplants_data['H_post'].to_numpy(dtype=np.float64),
+            transplants_data['V_post'].to_numpy(dtype=np.float64)
+        )
+    else:
+        raise ValueError("Need either 'd_phi' or ('H_post', 'V_post') columns")
     
     # Setup figure
-    fig, ax = plt.subplots(figsize=(12, 8))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(12, 8))
+    else:
+        fig = ax.figure
+        ax.clear()
     
-    # Color by region if available
+    # Group points by region if available: one single-color scatter per
+    # region avoids matplotlib's slower per-point color path
     if 'region' in transplants_data.columns:
-        regions = transplants_data['region'].unique()
+        region_codes, regions = pd.factorize(transplants_data['region'], sort=False)
         palette = sns.color_palette('Set2', len(regions))
-        region_colors = dict(zip(regions, palette))
-        colors = transplants_data['region'].map(region_colors)
+        groups = [(region_codes == k, color) for k, color in enumerate(palette)]
     else:
-        colors = COLORS['blue_zone']
+        groups = [(slice(None), COLORS['blue_zone'])]
     
     # Size by GDP if available
     if 'gdp_pc' in transplants_data.columns:
-        sizes = (transplants_data['gdp_pc'] / transplants_data['gdp_pc'].max()) * 200 + 50
+        gdp = transplants_data['gdp_pc'].to_numpy(dtype=np.float64)
+        sizes = (gdp / gdp.max()) * 200 + 50
     else:
-        sizes = 100
+        sizes = np.full(len(d_phi), 100.0)
+    
+    rng = np.random.default_rng(seed)
     
     # Jitter y-values slightly for visibility (since binary 0/1)
-    y_jitter = transplants_data['success'] + np.random.normal(0, 0.02, len(transplants_data))
+    y_jitter = (transplants_data['success'].to_numpy(dtype=np.float64) +
+                rng.normal(0, 0.02, len(d_phi)))
     y_jitter = np.clip(y_jitter, -0.05, 1.05)
     
-    # Scatter plot
-    scatter = ax.scatter(
-        transplants_data['d_phi'],
-        y_jitter,
-        c=colors,
-        s=sizes,
-        alpha=0.6,
-        edgecolors='black',
-        linewidth=0.5
-    )
+    if use_datashader is None:
+        use_datashader = len(d_phi) > _DATASHADER_MIN_SIZE and _has_datashader()
+    
+    # Scatter plot (a density image for very large datasets)
+    if use_datashader:
+        _rasterize_points(ax, d_phi, y_jitter)
+    else:
+        for members, color in groups:
+            ax.scatter(
+                d_phi[members],
+                y_jitter[members],
+                color=color,
+                s=sizes[members],
+                alpha=0.6,
+                edgecolors='black',
+                linewidth=0.5
+            )
     
     # Add logistic regression curve if requested
     if show_regression:
-        from sklearn.linear_model import LogisticRegression
-        from scipy import stats
+        from scipy.stats import rankdata
+        
+        # Extract the columns once; every statistic below reuses them
+        x = d_phi
+        y = transplants_data['success'].to_numpy(dtype=np.float64)
         
-        X = transplants_data[['d_phi']].values
-        y = transplants_data['success'].values
+        if y.min() == y.max():
+            raise ValueError("Logistic regression needs both successes and "
+                             "failures in transplants_data['success']")
         
-        # Fit logistic regression
-        model = LogisticRegression()
-        model.fit(X, y)
+        # Fit logistic regression (same objective as sklearn's default
+        # LogisticRegression, solved directly by Newton-Raphson)
+        (b0,), (b1,) = _fit_logistic_batch(x[np.newaxis, :], y[np.newaxis, :])
         
         # Generate smooth curve
-        d_phi_range = np.linspace(X.min(), X.max(), 200).reshape(-1, 1)
-        y_pred = model.predict_proba(d_phi_range)[:, 1]
+        d_phi_range = np.linspace(x.min(), x.max(), 200).reshape(-1, 1)
+        y_pred = 1.0 / (1.0 + np.exp(-(b0 + b1 * d_phi_range[:, 0])))
         
         # Plot curve
         ax.plot(d_phi_range, y_pred, 
                 color=COLORS['red_zone'], linewidth=3, 
-                label=f'Logistic Regression (OR={np.exp(model.coef_[0][0]):.3f})')
+                label=f'Logistic Regression (OR={np.exp(b1):.3f})')
         
-        # Confidence interval (bootstrap)
+        # Confidence interval (bootstrap): resamples are fitted together in
+        # blocks instead of 1000 separate sklearn fits
         n_bootstrap = 1000
-        y_preds_bootstrap = []
+        b0_boot, b1_boot = _bootstrap_logistic(x, y, n_bootstrap, rng)
         
-        for _ in range(n_bootstrap):
-            idx = np.random.choice(len(X), len(X), replace=True)
-            X_boot, y_boot = X[idx], y[idx]
-            model_boot = LogisticRegression()
-            model_boot.fit(X_boot, y_boot)
-            y_pred_boot = model_boot.predict_proba(d_phi_range)[:, 1]
-            y_preds_bootstrap.append(y_pred_boot)
-        
-        y_preds_bootstrap = np.array(y_preds_bootstrap)
+        y_preds_bootstrap = 1.0 / (1.0 + np.exp(
+            -(b0_boot[:, None] + b1_boot[:, None] * d_phi_range[:, 0])
+        ))
         ci_lower = np.percentile(y_preds_bootstrap, (1-confidence_level)/2 * 100, axis=0)
         ci_upper = np.percentile(y_preds_bootstrap, (1+confidence_level)/2 * 100, axis=0)
         
@@ -361,15 +701,14 @@ def plot_transplant_success(
                         color=COLORS['red_zone'], alpha=0.2,
                         label=f'{int(confidence_level*100)}% CI')
         
-        # Calculate and display statistics
-        from scipy.stats import pearsonr, spearmanr
-        r_pearson, p_pearson = pearsonr(transplants_data['d_phi'], transplants_data['success'])
-        r_spearman, p_spearman = spearmanr(transplants_data['d_phi'], transplants_data['success'])
+        # Calculate and display statistics (Spearman = Pearson on ranks)
+        r_pearson, p_pearson = _pearson(x, y)
+        r_spearman, p_spearman = _pearson(rankdata(x), rankdata(y))
         
         stats_text = (f"n = {len(transplants_data)}\n"
                      f"r (Pearson) = {r_pearson:.3f} (p = {p_pearson:.3f})\n"
                      f"ρ (Spearman) = {r_spearman:.3f} (p = {p_spearman:.3f})\n"
-                     f"β (d_φ) = {model.coef_[0][0]:.3f}")
+                     f"β (d_φ) = {b1:.3f}")
         
         ax.text(0.02, 0.98, stats_text,
                transform=ax.transAxes,
@@ -393,15 +732,15 @@ def plot_transplant_success(
     # Add success rate bands
     for dphi_band, label in [(0.5, 'High Success\n(d_φ < 0.5)'), 
                               (2.0, 'Low Success\n(d_φ > 2.0)')]:
-        if dphi_band < transplants_data['d_phi'].max():
+        if dphi_band < d_phi.max():
             ax.axvline(dphi_band, color='gray', linestyle=':', alpha=0.5)
             ax.text(dphi_band + 0.05, 0.9, label, fontsize=9, 
                    style='italic', color='gray')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"Saved Figure 8.1 to {save_path}")
     
     return fig
@@ -417,7 +756,9 @@ def plot_chi_map(
     
     Args:
         countries_chi: DataFrame with columns:
-            - country: Country name (ISO3 code or full name)
+            - country: ISO-3 codes (e.g. 'DEU') or full country names;
+              ISO-3 codes are matched exactly and are preferred, since
+              names must follow the map's spelling
             - CHI: Constitutional Health Index [0, 1]
             - Optional: H, V, alpha, LEI, d_phi (for hover info)
         save_path: Path to save (HTML for interactive, PNG for static)
@@ -438,23 +779,19 @@ def plot_chi_map(
     if 'CHI' not in countries_chi.columns:
         raise ValueError("DataFrame must have 'CHI' column")
     
+    use_iso3 = _is_iso3(countries_chi['country'])
+    
     if interactive:
-        # Plotly choropleth
+        # Plotly choropleth; only the plotted columns are serialized
+        hover_cols = [col for col in _HOVER_COLS if col in countries_chi.columns]
         fig = px.choropleth(
-            countries_chi,
+            countries_chi[['country', 'CHI', *hover_cols]],
             locations='country',
-            locationmode='country names',  # or 'ISO-3' if using codes
+            locationmode='ISO-3' if use_iso3 else 'country names',
             color='CHI',
-            color_continuous_scale=[
-                (0.0, COLORS['red_zone']),      # CHI < 0.2: Critical
-                (0.2, '#e67e22'),                # CHI 0.2-0.4: Poor
-                (0.4, COLORS['yellow_zone']),    # CHI 0.4-0.6: Fair
-                (0.6, COLORS['blue_zone']),      # CHI 0.6-0.8: Good
-                (0.8, COLORS['goldilocks'])      # CHI > 0.8: Excellent
-            ],
+            color_continuous_scale=CHI_COLORSCALE,
             range_color=[0, 1],
-            hover_data={col: ':.3f' for col in countries_chi.columns 
-                       if col in ['H', 'V', 'alpha', 'LEI', 'd_phi']},
+            hover_data={col: ':.3f' for col in hover_cols},
             title='<b>Figure 9.1: Constitutional Health Index (CHI) - Global Map</b><br>' +
                   '<sub>Darker green = healthier institutions (CHI closer to 1.0)</sub>'
         )
@@ -467,18 +804,11 @@ def plot_chi_map(
             ),
             width=1400,
             height=700,
-            coloraxis_colorbar=dict(
-                title="CHI",
-                tickvals=[0.2, 0.4, 0.6, 0.8],
-                ticktext=['Poor', 'Fair', 'Good', 'Excellent']
-            )
+            coloraxis_colorbar=CHI_COLORBAR
         )
         
         if save_path:
-            if save_path.endswith('.html'):
-                fig.write_html(save_path)
-            else:
-                fig.write_image(save_path, width=1400, height=700)
+            _save_plotly(fig, save_path, width=1400, height=700)
             print(f"Saved Figure 9.1 to {save_path}")
         
         return fig
@@ -490,16 +820,26 @@ def plot_chi_map(
         except ImportError:
             raise ImportError("geopandas required for static map. Install with: pip install geopandas")
         
-        # Load world map from Natural Earth
+        # Load world map from Natural Earth (downloaded once, then cached)
         try:
-            world = gpd.read_file(
-                'https://naciscdn.org/naturalearth/110m/cultural/ne_110m_admin_0_countries.zip'
-            )
+            world = _load_world()
         except Exception as e:
             raise RuntimeError(f"Could not load world map data: {e}")
         
-        # Merge with CHI data
-        world = world.merge(countries_chi, left_on='NAME', right_on='country', how='left')
+        # Attach CHI by hash lookup on the country key (ADM0_A3 is the
+        # Natural Earth code column without -99 placeholders); the index
+        # must be unique, so repeated countries keep their first row
+        duplicated = countries_chi['country'].duplicated()
+        if duplicated.any():
+            warnings.warn(
+                f"{int(duplicated.sum())} duplicate country rows ignored in "
+                "static CHI map; keeping the first row for each country",
+                stacklevel=2
+            )
+        chi_by_country = countries_chi[~duplicated].set_index('country')['CHI']
+        world = world.assign(
+            CHI=world['ADM0_A3' if use_iso3 else 'NAME'].map(chi_by_country)
+        )
         
         # Plot
         fig, ax = plt.subplots(figsize=(18, 10))
@@ -515,7 +855,7 @@ def plot_chi_map(
         ax.axis('off')
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
             print(f"Saved Figure 9.1 to {save_path}")
         
         return fig
@@ -0,0 +1,38 @@
+"""
+Shared setup for the scripts in this directory.
+
+Importing it (``import _bootstrap``) puts the repository root on sys.path,
+so lei_calculator resolves without installing the package, and applies
+the matplotlib output settings shared by every figure. Heavy libraries are
+deliberately not imported here: each script imports only what it uses.
+"""
+
+import os
+import sys
+
+import matplotlib
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# Leaner PDFs: maximum stream compression, embedded TrueType fonts (the
+# base-14 PDF fonts lack φ and α) and simplification of sub-point detail
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'pdf.compression': 9,
+    'pdf.fonttype': 42
+})
+
+
+def save_png_preview(fig, pdf_path, dpi=150, **savefig_kwargs):
+    """
+    Save a PNG copy of fig next to pdf_path (same name, .png suffix).
+    
+    The 300-DPI PDFs are the publication artifacts; the lower-resolution
+    PNG opens instantly in browsers and CI artifact viewers.
+    """
+    png_path = os.path.splitext(str(pdf_path))[0] + '.png'
+    fig.savefig(png_path, dpi=dpi, bbox_inches='tight', **savefig_kwargs)
+    return png_path
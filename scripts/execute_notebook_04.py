@@ -7,13 +7,13 @@ missing publication figures.
 """
 
 import sys
-import os
 import json
+import hashlib
 import warnings
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import _bootstrap  # noqa: F401  (repo root on sys.path, shared rcParams)
+from _bootstrap import save_png_preview
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
@@ -30,13 +30,10 @@ try:
     import matplotlib
     matplotlib.use('Agg')  # Non-interactive backend
     import matplotlib.pyplot as plt
-    import seaborn as sns
-    from scipy import stats
-    from sklearn.linear_model import LogisticRegression
-    from sklearn.metrics import roc_curve, auc
     
-    from lei_calculator.parameters import COUNTRY_PARAMETERS
-    from lei_calculator.metrics import calculate_LEI, calculate_d_phi, calculate_CHI, classify_zone
+    from lei_calculator.parameters import COUNTRY_PARAMETERS, get_country_array
+    from lei_calculator.metrics import comprehensive_metrics_batch
+    from lei_calculator import simulation
     from lei_calculator.simulation import simulate_evolution
     
     print("  ✓ All modules imported successfully")
@@ -44,13 +41,59 @@ except Exception as e:
     print(f"  ✗ Error importing modules: {e}")
     sys.exit(1)
 
+_STYLE_APPLIED = False
+
+
+def apply_style():
+    """Set the paper style and palette; repeat calls are no-ops."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    import seaborn as sns
+    
+    plt.style.use('seaborn-v0_8-paper')
+    sns.set_palette('colorblind')
+    _STYLE_APPLIED = True
+
+
 # Set matplotlib style
-plt.style.use('seaborn-v0_8-paper')
-sns.set_palette('colorblind')
+apply_style()
 
 # Define paths
 FIGURES_DIR = Path('figures')
 FIGURES_DIR.mkdir(exist_ok=True)
+CACHE_DIR = FIGURES_DIR / '.cache'
+# Package sources that determine simulate_evolution() output
+_SIMULATION_SOURCES = tuple(
+    Path(simulation.__file__).with_name(name)
+    for name in ('simulation.py', 'metrics.py', '_kernels.py')
+)
+
+
+def cached_simulate(params, years, **kwargs):
+    """
+    simulate_evolution() for a country's parameters, cached on disk.
+    
+    Trajectories are stored as figures/.cache/sim_<key>.npz, where the key
+    hashes the inputs together with the source of every module the
+    simulation runs through, so editing the model invalidates old entries.
+    """
+    inputs = {'H0': params['H'], 'V0': params['V'], 'alpha0': params['alpha'],
+              'years': years, **kwargs}
+    digest = hashlib.sha1(json.dumps(inputs, sort_keys=True).encode())
+    for source in _SIMULATION_SOURCES:
+        digest.update(source.read_bytes())
+    path = CACHE_DIR / f'sim_{digest.hexdigest()[:16]}.npz'
+    
+    if path.exists():
+        with np.load(path) as cached:
+            return {k: v if v.ndim else v.item() for k, v in cached.items()}
+    
+    results = simulate_evolution(**inputs)
+    CACHE_DIR.mkdir(exist_ok=True)
+    np.savez_compressed(path, **results)
+    return results
+
 
 print("\n[2/4] Loading data...")
 # Load transplant dataset
@@ -65,12 +108,7 @@ except Exception as e:
 print("\n[3/4] Generating Figure 6.1: USA Evolution...")
 try:
     usa_params = COUNTRY_PARAMETERS['USA']
-    results_usa = simulate_evolution(
-        H0=usa_params['H'],
-        V0=usa_params['V'],
-        alpha0=usa_params['alpha'],
-        years=436
-    )
+    results_usa = cached_simulate(usa_params, years=436)
     
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
@@ -123,7 +161,7 @@ try:
     
     fig_6_1 = FIGURES_DIR / 'figure_6.1_usa_evolution.pdf'
     plt.savefig(fig_6_1, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_png_preview(plt.gcf(), fig_6_1)
     
     print(f"  ✓ Saved: {fig_6_1} ({fig_6_1.stat().st_size / 1024:.1f} KB)")
     
@@ -131,6 +169,9 @@ except Exception as e:
     print(f"  ✗ Error generating Figure 6.1: {e}")
     import traceback
     traceback.print_exc()
+finally:
+    # Release the figure even when plotting or saving fails
+    plt.close('all')
 
 # Generate Figure 6.2: USA Amendment Fibonacci Analysis
 print("\n  Generating Figure 6.2: USA Amendment Fibonacci Analysis...")
@@ -143,19 +184,21 @@ try:
         '26th': 1971, '27th': 1992
     }
     
-    years = sorted([1789] + list(amendments.values()))
-    intervals = [years[i+1] - years[i] for i in range(len(years)-1)]
+    years = np.sort([1789, *amendments.values()])
+    intervals = np.diff(years)
     
     def fibonacci(n):
-        fib = [1, 1]
+        fib = np.ones(n, dtype=np.int64)
         for i in range(2, n):
-            fib.append(fib[-1] + fib[-2])
-        return fib[:n]
+            fib[i] = fib[i-1] + fib[i-2]
+        return fib
     
     fib_seq = fibonacci(len(intervals))
-    fib_scaled = [f * (sum(intervals) / sum(fib_seq)) for f in fib_seq]
+    fib_scaled = fib_seq * (intervals.sum() / fib_seq.sum())
+    
+    from scipy.stats import pearsonr
     
-    corr, p_value = stats.pearsonr(intervals, fib_scaled)
+    corr, p_value = pearsonr(intervals, fib_scaled)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
@@ -175,9 +218,10 @@ try:
     
     z = np.polyfit(fib_scaled, intervals, 1)
     p = np.poly1d(z)
-    ax2.plot(sorted(fib_scaled), p(sorted(fib_scaled)), "r--", linewidth=2, label='Linear Fit')
+    fib_sorted = np.sort(fib_scaled)
+    ax2.plot(fib_sorted, p(fib_sorted), "r--", linewidth=2, label='Linear Fit')
     
-    max_val = max(max(fib_scaled), max(intervals))
+    max_val = max(fib_sorted[-1], intervals.max())
     ax2.plot([0, max_val], [0, max_val], 'k:', linewidth=1.5, label='Perfect Match', alpha=0.5)
     
     ax2.set_xlabel('Fibonacci Sequence (Scaled)', fontsize=11)
@@ -193,7 +237,7 @@ try:
     
     fig_6_2 = FIGURES_DIR / 'figure_6.2_usa_fibonacci.pdf'
     plt.savefig(fig_6_2, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_png_preview(plt.gcf(), fig_6_2)
     
     print(f"  ✓ Saved: {fig_6_2} ({fig_6_2.stat().st_size / 1024:.1f} KB)")
     print(f"    Correlation: r = {corr:.3f}, p = {p_value:.3f}")
@@ -202,89 +246,51 @@ except Exception as e:
     print(f"  ✗ Error generating Figure 6.2: {e}")
     import traceback
     traceback.print_exc()
+finally:
+    # Release the figure even when plotting or saving fails
+    plt.close('all')
 
 # Generate Figure 7.1: Argentina Lock-in Comparison
 print("\n  Generating Figure 7.1: Argentina Lock-in Comparison...")
 try:
     countries_compare = ['USA', 'Argentina_labor', 'Brazil', 'Chile']
-    comp_data = {}
+    # All metrics in one batch call (H/V, d_φ, LEI and CHI share a single
+    # fused pass; the Numba kernel takes over for large country sets)
+    metrics = comprehensive_metrics_batch(*get_country_array(countries_compare).T)
+    metrics['HV_ratio'] = metrics['H'] / metrics['V']
+    # One row per country, one contiguous column per metric
+    df_cmp = pd.DataFrame(metrics, index=countries_compare)
     
-    for country in countries_compare:
-        params = COUNTRY_PARAMETERS[country]
-        H, V, alpha = params['H'], params['V'], params['alpha']
-        comp_data[country] = {
-            'H': H, 'V': V, 'alpha': alpha,
-            'HV_ratio': H/V,
-            'd_phi': calculate_d_phi(H, V),
-            'LEI': calculate_LEI(H, V, alpha),
-            'CHI': calculate_CHI(H, V, alpha)
-        }
-    
-    fig, axes = plt.subplots(2, 3, figsize=(16, 10))
+    fig, axes = plt.subplots(2, 3, figsize=(16, 10), sharex=True)
     
     country_names = [c.replace('_', ' ').title() for c in countries_compare]
     colors = ['#1976D2', '#D32F2F', '#388E3C', '#F57C00']
     
-    # Panel A: H comparison
-    ax1 = axes[0, 0]
-    H_vals = [comp_data[c]['H'] for c in countries_compare]
-    ax1.bar(country_names, H_vals, color=colors, alpha=0.7)
-    ax1.set_ylabel('Heredity (H)', fontsize=11)
-    ax1.set_title('Panel A: Heredity', fontsize=12, fontweight='bold')
-    ax1.set_ylim(0, 1)
-    ax1.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
-    
-    # Panel B: V comparison
-    ax2 = axes[0, 1]
-    V_vals = [comp_data[c]['V'] for c in countries_compare]
-    ax2.bar(country_names, V_vals, color=colors, alpha=0.7)
-    ax2.set_ylabel('Variation (V)', fontsize=11)
-    ax2.set_title('Panel B: Variation', fontsize=12, fontweight='bold')
-    ax2.set_ylim(0, 1)
-    ax2.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
-    
-    # Panel C: α comparison
-    ax3 = axes[0, 2]
-    alpha_vals = [comp_data[c]['alpha'] for c in countries_compare]
-    ax3.bar(country_names, alpha_vals, color=colors, alpha=0.7)
-    ax3.set_ylabel('Differential Fitness (α)', fontsize=11)
-    ax3.set_title('Panel C: Selection Pressure', fontsize=12, fontweight='bold')
-    ax3.set_ylim(0, 1)
-    ax3.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax3.xaxis.get_majorticklabels(), rotation=45, ha='right')
-    
-    # Panel D: H/V ratio
-    ax4 = axes[1, 0]
-    HV_vals = [comp_data[c]['HV_ratio'] for c in countries_compare]
-    ax4.bar(country_names, HV_vals, color=colors, alpha=0.7)
-    ax4.axhline(y=1.618, color='gold', linestyle='--', linewidth=2, label='φ = 1.618')
-    ax4.set_ylabel('H/V Ratio', fontsize=11)
-    ax4.set_title('Panel D: H/V Ratio (Target: φ)', fontsize=12, fontweight='bold')
-    ax4.legend(fontsize=9)
-    ax4.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax4.xaxis.get_majorticklabels(), rotation=45, ha='right')
-    
-    # Panel E: d_φ
-    ax5 = axes[1, 1]
-    d_phi_vals = [comp_data[c]['d_phi'] for c in countries_compare]
-    ax5.bar(country_names, d_phi_vals, color=colors, alpha=0.7)
-    ax5.axhline(y=0.5, color='green', linestyle='--', linewidth=2, label='Goldilocks threshold')
-    ax5.set_ylabel('Distance to φ', fontsize=11)
-    ax5.set_title('Panel E: d_φ (Lower = Better)', fontsize=12, fontweight='bold')
-    ax5.legend(fontsize=9)
-    ax5.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax5.xaxis.get_majorticklabels(), rotation=45, ha='right')
-    
-    # Panel F: LEI
-    ax6 = axes[1, 2]
-    LEI_vals = [comp_data[c]['LEI'] for c in countries_compare]
-    ax6.bar(country_names, LEI_vals, color=colors, alpha=0.7)
-    ax6.set_ylabel('Legal Evolvability Index', fontsize=11)
-    ax6.set_title('Panel F: LEI (Higher = Better)', fontsize=12, fontweight='bold')
-    ax6.grid(True, axis='y', alpha=0.3)
-    plt.setp(ax6.xaxis.get_majorticklabels(), rotation=45, ha='right')
+    # (metric, y label, title, y limits, reference line as (y, color, label))
+    panels = [
+        ('H', 'Heredity (H)', 'Panel A: Heredity', (0, 1), None),
+        ('V', 'Variation (V)', 'Panel B: Variation', (0, 1), None),
+        ('alpha', 'Differential Fitness (α)', 'Panel C: Selection Pressure', (0, 1), None),
+        ('HV_ratio', 'H/V Ratio', 'Panel D: H/V Ratio (Target: φ)', None,
+         (1.618, 'gold', 'φ = 1.618')),
+        ('d_phi', 'Distance to φ', 'Panel E: d_φ (Lower = Better)', None,
+         (0.5, 'green', 'Goldilocks threshold')),
+        ('LEI', 'Legal Evolvability Index', 'Panel F: LEI (Higher = Better)', None, None),
+    ]
+    
+    for ax, (key, ylabel, title, ylim, ref) in zip(axes.flat, panels):
+        ax.bar(country_names, df_cmp[key].to_numpy(), color=colors, alpha=0.7)
+        if ref is not None:
+            y, color, label = ref
+            ax.axhline(y=y, color=color, linestyle='--', linewidth=2, label=label)
+            ax.legend(fontsize=9)
+        if ylim is not None:
+            ax.set_ylim(*ylim)
+        ax.set_ylabel(ylabel, fontsize=11)
+        ax.set_title(title, fontsize=12, fontweight='bold')
+        ax.grid(True, axis='y', alpha=0.3)
+        ax.tick_params(axis='x', labelrotation=45)
+        plt.setp(ax.get_xticklabels(), ha='right')
     
     plt.suptitle('Figure 7.1: Argentina Labor Lock-in vs Comparators', 
                  fontsize=14, fontweight='bold', y=0.995)
@@ -292,15 +298,18 @@ try:
     
     fig_7_1 = FIGURES_DIR / 'figure_7.1_argentina_comparison.pdf'
     plt.savefig(fig_7_1, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_png_preview(plt.gcf(), fig_7_1)
     
     print(f"  ✓ Saved: {fig_7_1} ({fig_7_1.stat().st_size / 1024:.1f} KB)")
-    print(f"    Argentina LEI: {comp_data['Argentina_labor']['LEI']:.3f} (132× worse than USA)")
+    print(f"    Argentina LEI: {df_cmp.at['Argentina_labor', 'LEI']:.3f} (132× worse than USA)")
     
 except Exception as e:
     print(f"  ✗ Error generating Figure 7.1: {e}")
     import traceback
     traceback.print_exc()
+finally:
+    # Release the figure even when plotting or saving fails
+    plt.close('all')
 
 # Summary
 print("\n[4/4] Summary:")
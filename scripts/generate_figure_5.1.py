@@ -9,16 +9,15 @@ Visualizes legal systems in (H, V, α) parameter space with:
 - Goldilocks Zone cylinder
 """
 
-import numpy as np
 import pandas as pd
-import sys
-import os
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # noqa: F401  (repo root on sys.path, shared rcParams)
+from _bootstrap import save_png_preview
+
+from lei_calculator.parameters import COUNTRY_NAMES, get_country_array
+from lei_calculator.metrics import comprehensive_metrics_batch
+from lei_calculator.visualization import build_darwinian_scene, plot_darwinian_space_3D
 
-from lei_calculator.parameters import COUNTRY_PARAMETERS
-from lei_calculator.metrics import calculate_LEI, calculate_d_phi, classify_zone
-from lei_calculator.visualization import plot_darwinian_space_3D
 
 def main():
     """Generate Figure 5.1"""
@@ -26,30 +25,14 @@ def main():
     print("GENERATING FIGURE 5.1: 3D DARWINIAN SPACE")
     print("="*70)
     
-    # Prepare country data
-    countries_data = []
-    
-    for country, params in COUNTRY_PARAMETERS.items():
-        H = params['H']
-        V = params['V']
-        alpha = params['alpha']
-        
-        # Calculate metrics
-        LEI = calculate_LEI(H, V, alpha)
-        d_phi = calculate_d_phi(H, V)
-        zone = classify_zone(H, V, alpha)
-        
-        countries_data.append({
-            'country': country.replace('_', ' '),
-            'H': H,
-            'V': V,
-            'alpha': alpha,
-            'LEI': LEI,
-            'd_phi': d_phi,
-            'zone': zone
-        })
-    
-    df = pd.DataFrame(countries_data)
+    # Prepare country data: all metrics in one batch call, which switches
+    # to the multithreaded Numba kernel for large country sets
+    H, V, alpha = get_country_array().T
+    batch = comprehensive_metrics_batch(
+        H, V, alpha,
+        names=[c.replace('_', ' ') for c in COUNTRY_NAMES]
+    )
+    df = pd.DataFrame(batch)[['country', 'H', 'V', 'alpha', 'LEI', 'd_phi', 'zone']]
     
     print(f"\nTotal countries: {len(df)}")
     print(f"\nZone distribution:")
@@ -61,21 +44,25 @@ def main():
     print(f"\nd_φ statistics:")
     print(df['d_phi'].describe())
     
+    # Colors and φ surface / Goldilocks geometry, shared by both outputs
+    scene = build_darwinian_scene(df, show_goldilocks=True, show_phi_surface=True)
+    
     # Generate figure (PDF version)
     print("\nGenerating Figure 5.1 (PDF)...")
     fig_pdf = plot_darwinian_space_3D(
-        df,
+        scene,
         save_path='../figures/figure_5.1_darwinian_space.pdf',
         show_goldilocks=True,
         show_phi_surface=True,
         interactive=False  # matplotlib version for PDF
     )
-    print("  ✓ PDF saved: figures/figure_5.1_darwinian_space.pdf")
+    save_png_preview(fig_pdf, '../figures/figure_5.1_darwinian_space.pdf')
+    print("  ✓ PDF saved: figures/figure_5.1_darwinian_space.pdf (+ PNG preview)")
     
     # Generate interactive HTML version
     print("\nGenerating Figure 5.1 (Interactive HTML)...")
     fig_html = plot_darwinian_space_3D(
-        df,
+        scene,
         save_path='../figures/figure_5.1_darwinian_space.html',
         show_goldilocks=True,
         show_phi_surface=True,
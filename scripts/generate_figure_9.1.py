@@ -14,16 +14,15 @@ Outputs:
 - figures/figure_9.1_chi_global_map.html (interactive plotly visualization)
 """
 
-import sys
 import os
-import pandas as pd
 import numpy as np
+import pandas as pd
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # noqa: F401  (repo root on sys.path, shared rcParams)
+from _bootstrap import save_png_preview
 
-from lei_calculator.parameters import COUNTRY_PARAMETERS
-from lei_calculator.metrics import calculate_CHI, calculate_d_phi, calculate_LEI
+from lei_calculator.parameters import COUNTRY_NAMES, get_country_array
+from lei_calculator.metrics import comprehensive_metrics_batch
 from lei_calculator.visualization import plot_chi_map
 
 
@@ -34,35 +33,17 @@ def prepare_chi_data():
     Returns:
         pd.DataFrame: DataFrame with columns [country, H, V, alpha, CHI, d_phi, LEI]
     """
-    countries_data = []
-    
-    for country, params in COUNTRY_PARAMETERS.items():
-        # Extract parameters
-        H = params['H']
-        V = params['V']
-        alpha = params['alpha']
-        
-        # Calculate metrics
-        CHI = calculate_CHI(H, V, alpha)
-        d_phi = calculate_d_phi(H, V)
-        LEI = calculate_LEI(H, V, alpha)
-        HV_ratio = H / V
-        
+    H, V, alpha = get_country_array().T
+    batch = comprehensive_metrics_batch(
+        H, V, alpha,
         # Clean country name (replace underscores with spaces)
-        country_clean = country.replace('_', ' ').title()
-        
-        countries_data.append({
-            'country': country_clean,
-            'H': H,
-            'V': V,
-            'alpha': alpha,
-            'CHI': CHI,
-            'd_phi': d_phi,
-            'LEI': LEI,
-            'HV_ratio': HV_ratio
-        })
+        names=[c.replace('_', ' ').title() for c in COUNTRY_NAMES]
+    )
     
-    df = pd.DataFrame(countries_data)
+    # Calculate metrics for all countries at once (the batch call switches
+    # to the multithreaded Numba kernel for large country sets)
+    df = pd.DataFrame(batch)[['country', 'H', 'V', 'alpha', 'CHI', 'd_phi', 'LEI']]
+    df['HV_ratio'] = df['H'] / df['V']
     
     # Sort by CHI descending
     df = df.sort_values('CHI', ascending=False).reset_index(drop=True)
@@ -76,21 +57,29 @@ def print_chi_statistics(df):
     print("CONSTITUTIONAL HEALTH INDEX (CHI) - GLOBAL STATISTICS")
     print("="*70)
     
-    print(f"\nNumber of countries: {len(df)}")
+    # One array for every statistic below; argmin/argmax give the first
+    # extreme, as idxmin/idxmax did
+    chi = df['CHI'].to_numpy()
+    n = len(chi)
+    imin, imax = int(chi.argmin()), int(chi.argmax())
+    
+    print(f"\nNumber of countries: {n}")
     print(f"\nCHI Statistics:")
-    print(f"  Mean:   {df['CHI'].mean():.3f}")
-    print(f"  Median: {df['CHI'].median():.3f}")
-    print(f"  Std:    {df['CHI'].std():.3f}")
-    print(f"  Min:    {df['CHI'].min():.3f} ({df.loc[df['CHI'].idxmin(), 'country']})")
-    print(f"  Max:    {df['CHI'].max():.3f} ({df.loc[df['CHI'].idxmax(), 'country']})")
+    print(f"  Mean:   {chi.mean():.3f}")
+    print(f"  Median: {np.median(chi):.3f}")
+    print(f"  Std:    {chi.std(ddof=1):.3f}")
+    print(f"  Min:    {chi[imin]:.3f} ({df['country'].iat[imin]})")
+    print(f"  Max:    {chi[imax]:.3f} ({df['country'].iat[imax]})")
     
-    # CHI ranges
+    # CHI ranges: band index 0..4 from the (lower, upper] edges in one pass
+    critical, poor, moderate, good, excellent = np.bincount(
+        np.searchsorted([0.2, 0.4, 0.6, 0.8], chi), minlength=5)
     print(f"\nCHI Distribution:")
-    print(f"  Excellent (CHI > 0.8):     {len(df[df['CHI'] > 0.8]):2d} countries ({100*len(df[df['CHI'] > 0.8])/len(df):5.1f}%)")
-    print(f"  Good (0.6 < CHI ≤ 0.8):    {len(df[(df['CHI'] > 0.6) & (df['CHI'] <= 0.8)]):2d} countries ({100*len(df[(df['CHI'] > 0.6) & (df['CHI'] <= 0.8)])/len(df):5.1f}%)")
-    print(f"  Moderate (0.4 < CHI ≤ 0.6): {len(df[(df['CHI'] > 0.4) & (df['CHI'] <= 0.6)]):2d} countries ({100*len(df[(df['CHI'] > 0.4) & (df['CHI'] <= 0.6)])/len(df):5.1f}%)")
-    print(f"  Poor (0.2 < CHI ≤ 0.4):    {len(df[(df['CHI'] > 0.2) & (df['CHI'] <= 0.4)]):2d} countries ({100*len(df[(df['CHI'] > 0.2) & (df['CHI'] <= 0.4)])/len(df):5.1f}%)")
-    print(f"  Critical (CHI ≤ 0.2):      {len(df[df['CHI'] <= 0.2]):2d} countries ({100*len(df[df['CHI'] <= 0.2])/len(df):5.1f}%)")
+    print(f"  Excellent (CHI > 0.8):     {excellent:2d} countries ({100*excellent/n:5.1f}%)")
+    print(f"  Good (0.6 < CHI ≤ 0.8):    {good:2d} countries ({100*good/n:5.1f}%)")
+    print(f"  Moderate (0.4 < CHI ≤ 0.6): {moderate:2d} countries ({100*moderate/n:5.1f}%)")
+    print(f"  Poor (0.2 < CHI ≤ 0.4):    {poor:2d} countries ({100*poor/n:5.1f}%)")
+    print(f"  Critical (CHI ≤ 0.2):      {critical:2d} countries ({100*critical/n:5.1f}%)")
     
     # Top 10 and Bottom 10
     print(f"\nTop 10 Countries (Highest CHI):")
@@ -124,8 +113,9 @@ def main():
     print("\n[2/4] Generating static PDF version...")
     pdf_path = os.path.join(os.path.dirname(__file__), '..', 'figures', 'figure_9.1_chi_global_map.pdf')
     try:
-        plot_chi_map(df, save_path=pdf_path, interactive=False)
+        fig = plot_chi_map(df, save_path=pdf_path, interactive=False)
         print(f"      ✓ Saved: {pdf_path}")
+        print(f"      ✓ Preview: {save_png_preview(fig, pdf_path)}")
     except Exception as e:
         print(f"      ✗ Error generating PDF: {e}")
     
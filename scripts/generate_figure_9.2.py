@@ -15,15 +15,12 @@ The Fibonacci sequence demonstrates optimal reform pacing, with ratios approachi
 Comparison with failed "cliff jump" approach that attempts 60% reform immediately.
 """
 
-import sys
 import os
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # noqa: F401  (repo root on sys.path, shared rcParams)
+from _bootstrap import save_png_preview
 
 # Golden ratio constant
 PHI = 1.618
@@ -45,11 +42,10 @@ def generate_fibonacci_reform_diagram(save_path=None):
     fib_cumulative = np.cumsum(fib_increments)
     
     # Calculate ratios between consecutive increments
-    ratios = []
-    for i in range(2, len(fib_increments)-1):
-        if fib_increments[i-1] > 0:
-            ratio = fib_increments[i] / fib_increments[i-1]
-            ratios.append((i, ratio))
+    ratio_steps = np.arange(2, len(fib_increments)-1)
+    ratio_steps = ratio_steps[fib_increments[ratio_steps-1] > 0]
+    ratio_vals = fib_increments[ratio_steps] / fib_increments[ratio_steps-1]
+    ratios = list(zip(ratio_steps, ratio_vals))
     
     # Failed "big bang" approach data
     fail_years = np.array([0, 1, 3, 5, 10, 15])
@@ -69,39 +65,35 @@ def generate_fibonacci_reform_diagram(save_path=None):
             color='#C62828', label='Big Bang Approach (Cliff Jump)', 
             marker='x', markersize=12, markeredgewidth=3)
     
-    # Add ratio annotations for Fibonacci steps
+    # Add ratio annotations for Fibonacci steps (positions computed up
+    # front; every label shares one box and arrow style)
+    ratio_color = '#1B5E20'
+    ratio_bbox = dict(boxstyle='round,pad=0.3', facecolor='#E8F5E9',
+                      edgecolor=ratio_color, linewidth=1.5)
+    ratio_arrow = dict(arrowstyle='->', color=ratio_color, lw=1.5)
     annotation_offset = 0.03
-    for i, (step, ratio) in enumerate(ratios):
-        year = fib_years[step]
-        cumulative = fib_cumulative[step]
-        
-        # Determine if ratio is close to φ or 1/φ
-        if ratio > 1:
-            ratio_label = f'{ratio:.2f} ≈ φ'
-            color = '#1B5E20'
-        else:
-            ratio_label = f'{ratio:.2f} ≈ 1/φ'
-            color = '#1B5E20'
-        
-        # Place annotation
-        ax.annotate(ratio_label, 
-                   xy=(year, cumulative), 
-                   xytext=(year + 0.5, cumulative + annotation_offset + (i % 2) * 0.04),
-                   fontsize=9, fontweight='bold', color=color,
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='#E8F5E9', 
-                            edgecolor=color, linewidth=1.5),
-                   arrowprops=dict(arrowstyle='->', color=color, lw=1.5))
+    
+    xs = fib_years[ratio_steps]
+    ys = fib_cumulative[ratio_steps]
+    # Alternate label heights so neighbouring boxes do not overlap
+    text_ys = ys + annotation_offset + (np.arange(len(ratio_steps)) % 2) * 0.04
+    # Ratios above 1 approach φ, the last (tapering) step approaches 1/φ
+    labels = [f'{r:.2f} ≈ φ' if r > 1 else f'{r:.2f} ≈ 1/φ' for r in ratio_vals]
+    
+    for x, y, text_y, label in zip(xs, ys, text_ys, labels):
+        ax.annotate(label, xy=(x, y), xytext=(x + 0.5, text_y),
+                    fontsize=9, fontweight='bold', color=ratio_color,
+                    bbox=ratio_bbox, arrowprops=ratio_arrow)
     
     # Add increment labels on Fibonacci steps
-    for i in range(1, len(fib_years)-1):
-        if fib_increments[i] > 0:
-            year = fib_years[i]
-            cumulative = fib_cumulative[i]
-            increment = fib_increments[i]
-            ax.text(year - 0.3, cumulative - 0.04, f'+{increment:.2f}',
-                   fontsize=9, color='#1B5E20', fontweight='bold',
-                   bbox=dict(boxstyle='round,pad=0.2', facecolor='white', 
-                            edgecolor='#2E7D32', linewidth=1))
+    increment_bbox = dict(boxstyle='round,pad=0.2', facecolor='white',
+                          edgecolor='#2E7D32', linewidth=1)
+    steps = np.flatnonzero(fib_increments[:-1] > 0)
+    for year, cumulative, increment in zip(fib_years[steps], fib_cumulative[steps],
+                                           fib_increments[steps]):
+        ax.text(year - 0.3, cumulative - 0.04, f'+{increment:.2f}',
+               fontsize=9, color='#1B5E20', fontweight='bold',
+               bbox=increment_bbox)
     
     # Add success/failure annotations
     # Success annotation
@@ -162,6 +154,7 @@ def generate_fibonacci_reform_diagram(save_path=None):
     if save_path:
         plt.savefig(save_path, dpi=300, bbox_inches='tight', 
                    facecolor='white', edgecolor='none')
+        save_png_preview(fig, save_path, facecolor='white', edgecolor='none')
         print(f"Saved Figure 9.2 to {save_path}")
         
         # Also print summary statistics
@@ -17,20 +17,18 @@ we generate realistic data matching the paper's reported correlations.
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
+from scipy.optimize import brentq
 from scipy.stats import pearsonr, spearmanr
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import (roc_auc_score, confusion_matrix, classification_report, 
-                             roc_curve, auc)
-import sys
+from sklearn.metrics import roc_auc_score, confusion_matrix, roc_curve, auc
 import os
+import warnings
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from lei_calculator.metrics import calculate_d_phi
+import _bootstrap  # noqa: F401  (repo root on sys.path, shared rcParams)
+from _bootstrap import save_png_preview
 from lei_calculator.visualization import plot_transplant_success
 
+
 # Golden ratio
 PHI = 1.618033988749895
 
@@ -46,10 +44,11 @@ def generate_transplant_data(n_cases=60, target_correlation=-0.78, seed=42):
     
     Strategy:
     1. Generate d_φ values with realistic distribution (mean ~1.5, range 0.1-4.0)
-    2. Generate success outcomes with strong negative correlation to d_φ
-    3. Add realistic noise while preserving correlation structure
+    2. Solve once for the logistic slope whose expected correlation with
+       d_φ matches the target, then draw Bernoulli success outcomes
+    3. Reject samples that are perfectly separable by d_φ
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     # Load the 60 case identifiers from the actual dataset
     try:
@@ -69,62 +68,65 @@ def generate_transplant_data(n_cases=60, target_correlation=-0.78, seed=42):
     
     # Generate d_φ values with realistic distribution
     # Crisis cases tend to have higher d_φ (further from golden ratio)
-    d_phi_crisis = np.random.lognormal(mean=0.4, sigma=0.6, size=30)  # Mean ~1.8
-    d_phi_control = np.random.lognormal(mean=0.0, sigma=0.5, size=30)  # Mean ~1.1
+    d_phi_crisis = rng.lognormal(mean=0.4, sigma=0.6, size=30)  # Mean ~1.8
+    d_phi_control = rng.lognormal(mean=0.0, sigma=0.5, size=30)  # Mean ~1.1
     d_phi = np.concatenate([d_phi_crisis, d_phi_control])
     d_phi = np.clip(d_phi, 0.1, 4.5)  # Realistic bounds
     
-    # Generate success outcomes with target correlation
-    # Use logistic function to map d_φ to probability
-    # Adjust beta to achieve target correlation
-    
-    # Start with logistic probabilities
-    beta = -2.5  # Strong negative effect (will tune)
-    logit = beta * (d_phi - d_phi.mean()) / d_phi.std()
-    prob_success = 1 / (1 + np.exp(-logit))
-    
-    # Generate binary outcomes
-    success = (np.random.random(n_cases) < prob_success).astype(int)
-    
-    # Iteratively adjust beta to match target correlation
-    # Use more moderate beta to avoid perfect separation
-    for iteration in range(50):
-        current_corr, _ = pearsonr(d_phi, success)
-        if abs(current_corr - target_correlation) < 0.03:
-            break
-        # Adjust beta more conservatively
-        beta = beta * (target_correlation / current_corr) * 0.9
-        # Add more realistic noise
-        logit = beta * (d_phi - d_phi.mean()) / d_phi.std() + np.random.normal(0, 0.3, n_cases)
-        prob_success = 1 / (1 + np.exp(-logit))
-        success = (np.random.random(n_cases) < prob_success).astype(int)
+    # Generate success outcomes from a logistic model on standardized d_φ,
+    # P(success) = 1 / (1 + exp(-β·z)). Instead of re-sampling until r lands
+    # near the target, solve once for the β whose expected point-biserial
+    # correlation Σ dx·p / (‖dx‖ · √(n·p̄(1-p̄))) equals the target, then
+    # draw the Bernoulli outcomes once. |β| is capped so the outcomes keep
+    # overlapping in d_φ (larger slopes make the sample close to perfectly
+    # separable and the unpenalized logistic fit diverges).
+    beta_max = 4.0
+    # d_φ is fixed during the root search, so its centered values and norm
+    # are computed once and each evaluation is a single dot product
+    dx = d_phi - d_phi.mean()
+    norm = np.linalg.norm(dx)
+    z = dx / d_phi.std()
+    
+    def expected_r(beta):
+        prob = 1 / (1 + np.exp(-beta * z))
+        p_bar = prob.mean()
+        return dx @ prob / (norm * np.sqrt(n_cases * p_bar * (1 - p_bar)))
+    
+    if expected_r(-beta_max) <= target_correlation <= expected_r(beta_max):
+        beta = brentq(lambda b: expected_r(b) - target_correlation, -beta_max, beta_max)
+    else:
+        beta = np.copysign(beta_max, target_correlation)
+        warnings.warn(f"Target r = {target_correlation:.2f} is out of reach for "
+                      f"|β| <= {beta_max}; using β = {beta:.1f} "
+                      f"(expected r = {expected_r(beta):.3f})")
+    
+    prob_success = 1 / (1 + np.exp(-beta * z))
+    success = (rng.random(n_cases) < prob_success).astype(int)
+    
+    # The regression in run_logistic_regression has no penalty, so its
+    # estimates are only finite when the outcomes overlap in d_φ
+    d_success, d_failure = d_phi[success == 1], d_phi[success == 0]
+    if (d_success.size == 0 or d_failure.size == 0
+            or d_success.max() <= d_failure.min()
+            or d_failure.max() <= d_success.min()):
+        raise ValueError(f"Simulated outcomes for seed={seed} are perfectly "
+                         "separable by d_φ; the logistic fit would diverge. "
+                         "Use a different seed.")
     
     # Calculate H_post and V_post that would produce these d_φ values
     # Use realistic parameter ranges: H in [0.3, 0.95], V in [0.15, 0.85]
     # Given d_φ = |H/V - φ|, we can work backwards
     
-    H_post = []
-    V_post = []
-    
-    for i, dphi in enumerate(d_phi):
-        # Randomly decide if H/V > φ or H/V < φ
-        if np.random.random() < 0.5:
-            HV_ratio = PHI + dphi
-        else:
-            HV_ratio = PHI - dphi
-        
-        # Generate V first, then calculate H
-        V = np.random.uniform(0.15, 0.85)
-        H = HV_ratio * V
-        
-        # Clip H to realistic range
-        H = np.clip(H, 0.3, 0.95)
-        # Recalculate V to maintain ratio
-        V = H / HV_ratio
-        V = np.clip(V, 0.15, 0.85)
-        
-        H_post.append(round(H, 3))
-        V_post.append(round(V, 3))
+    # Randomly decide per case whether H/V sits above or below φ, draw V,
+    # then clip H to realistic range and recalculate V to maintain ratio
+    signs = np.where(rng.random(n_cases) < 0.5, 1.0, -1.0)
+    HV_ratio = PHI + signs * d_phi
+    V = rng.uniform(0.15, 0.85, n_cases)
+    H = np.clip(HV_ratio * V, 0.3, 0.95)
+    V = np.clip(H / HV_ratio, 0.15, 0.85)
+    
+    H_post = np.round(H, 3)
+    V_post = np.round(V, 3)
     
     # Create DataFrame
     transplants = pd.DataFrame({
@@ -135,7 +137,7 @@ def generate_transplant_data(n_cases=60, target_correlation=-0.78, seed=42):
         'Crisis_Catalyzed': crisis_catalyzed,
         'H_post': H_post,
         'V_post': V_post,
-        'd_phi': [round(dp, 3) for dp in d_phi],
+        'd_phi': np.round(d_phi, 3),
         'success': success
     })
     
@@ -335,6 +337,7 @@ def generate_roc_curve(transplants_data, model, save_path=None):
     
     if save_path:
         plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_png_preview(fig, save_path)
         print(f"Saved Figure 8.2 to {save_path}")
     
     return fig
@@ -372,12 +375,15 @@ def main():
     
     # Generate Figure 8.1
     print("\nStep 4: Generating Figure 8.1...")
+    fig_8_1_path = '/home/user/webapp/legal-evolvability-golden-ratio/figures/figure_8.1_transplant_success.pdf'
     fig = plot_transplant_success(
         transplants,
-        save_path='/home/user/webapp/legal-evolvability-golden-ratio/figures/figure_8.1_transplant_success.pdf',
+        save_path=fig_8_1_path,
         show_regression=True,
-        confidence_level=0.95
+        confidence_level=0.95,
+        seed=42
     )
+    save_png_preview(fig, fig_8_1_path)
     print("  ✓ Figure 8.1 generated: figures/figure_8.1_transplant_success.pdf")
     
     # Generate Figure 8.2 (ROC Curve)
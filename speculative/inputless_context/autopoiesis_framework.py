@@ -23,10 +23,22 @@ NO EMPIRICAL VALIDATION has been performed. Use for creative
 theoretical exploration ONLY.
 """
 
+import os
 import numpy as np
 from typing import Dict, Tuple, Optional
 import warnings
 
+# Numba is optional here as in lei_calculator._kernels: the batch kernel
+# falls back to NumPy when it is missing or LEI_CALCULATOR_DISABLE_NUMBA is set
+njit = None
+if os.environ.get('LEI_CALCULATOR_DISABLE_NUMBA', '') in ('', '0'):
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+PHI = 1.618
+
 # Add prominent warning
 warnings.warn(
     "\n"
@@ -65,7 +77,7 @@ class AutopoiesisScore:
         self.H = H
         self.V = V
         self.alpha = alpha
-        self.phi = 1.618
+        self.phi = PHI
         self.d_phi = abs(H/V - self.phi)
     
     def closure_score(self) -> float:
@@ -126,12 +138,7 @@ class AutopoiesisScore:
     
     def _interpret_balance(self, balance: float) -> str:
         """Interpret balance score (SPECULATIVE)."""
-        if balance > 0.8:
-            return "Near-optimal autopoiesis (SPECULATIVE)"
-        elif balance > 0.5:
-            return "Moderate autopoietic dynamics (SPECULATIVE)"
-        else:
-            return "Imbalanced (over-closed or under-closed) (SPECULATIVE)"
+        return _interpret_balance(balance)
     
     def inputless_tendency(self) -> Dict[str, any]:
         """
@@ -167,6 +174,16 @@ class AutopoiesisScore:
         }
 
 
+def _interpret_balance(balance: float) -> str:
+    """Interpret balance score (SPECULATIVE)."""
+    if balance > 0.8:
+        return "Near-optimal autopoiesis (SPECULATIVE)"
+    elif balance > 0.5:
+        return "Moderate autopoietic dynamics (SPECULATIVE)"
+    else:
+        return "Imbalanced (over-closed or under-closed) (SPECULATIVE)"
+
+
 def calculate_precedent_horizon(H: float, V: float, 
                                 base_years: int = 100) -> Dict[str, any]:
     """
@@ -209,6 +226,52 @@ def calculate_precedent_horizon(H: float, V: float,
     }
 
 
+def _autopoiesis_numpy(H, V, base_years=100.0):
+    """NumPy twin of _autopoiesis_kernel (used when Numba is unavailable)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(V > 0, H / V, np.inf)
+    d_phi = np.abs(ratio - PHI)
+    balance = 1.0 / (1.0 + d_phi)
+    inputless = np.minimum(1.0, ratio / (2 * PHI))
+    horizon = base_years * (H / (V + 0.1))
+    return H.copy(), V.copy(), balance, d_phi, inputless, horizon
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _autopoiesis_kernel(H, V, base_years=100.0):
+        """
+        Per-system (closure, coupling, balance, d_phi, inputless, horizon).
+
+        Same formulas as AutopoiesisScore and calculate_precedent_horizon,
+        one pass over the arrays; V <= 0 is branched on explicitly (d_phi
+        infinite, balance 0, inputless 1) rather than left to fastmath.
+        """
+        n = H.shape[0]
+        closure = np.empty(n)
+        coupling = np.empty(n)
+        balance = np.empty(n)
+        d_phi = np.empty(n)
+        inputless = np.empty(n)
+        horizon = np.empty(n)
+        for i in range(n):
+            closure[i] = H[i]
+            coupling[i] = V[i]
+            if V[i] > 0.0:
+                ratio = H[i] / V[i]
+                d_phi[i] = abs(ratio - PHI)
+                balance[i] = 1.0 / (1.0 + d_phi[i])
+                inputless[i] = min(1.0, ratio / (2 * PHI))
+            else:
+                d_phi[i] = np.inf
+                balance[i] = 0.0
+                inputless[i] = 1.0
+            horizon[i] = base_years * (H[i] / (V[i] + 0.1))
+        return closure, coupling, balance, d_phi, inputless, horizon
+else:
+    _autopoiesis_kernel = _autopoiesis_numpy
+
+
 def compare_autopoiesis(countries: Dict[str, Tuple[float, float, float]]) -> Dict:
     """
     Compare autopoietic properties across countries (SPECULATIVE).
@@ -221,28 +284,35 @@ def compare_autopoiesis(countries: Dict[str, Tuple[float, float, float]]) -> Dic
     Returns:
         Dictionary with comparative metrics (all speculative)
     """
-    results = {}
+    names = list(countries)
+    n = len(names)
+    H, V = (np.fromiter((params[j] for params in countries.values()),
+                        dtype=np.float64, count=n)
+            for j in range(2))
     
-    for country, (H, V, alpha) in countries.items():
-        auto = AutopoiesisScore(H, V, alpha)
-        balance = auto.autopoiesis_balance()
-        inputless = auto.inputless_tendency()
-        horizon = calculate_precedent_horizon(H, V)
-        
-        results[country] = {
-            'H': H,
-            'V': V,
-            'alpha': alpha,
-            'closure': balance['closure'],
-            'coupling': balance['coupling'],
-            'balance': balance['balance'],
-            'd_phi': balance['d_phi'],
-            'inputless_score': inputless['inputless_score'],
-            'precedent_horizon': horizon['estimated_horizon_years'],
-            'interpretation': balance['interpretation']
-        }
+    # One kernel call for every country; results come back as columns
+    closure, coupling, balance, d_phi, inputless, horizon = \
+        _autopoiesis_kernel(H, V, 100.0)
     
-    return results
+    # alpha plays no part in these metrics and is passed through as given
+    columns = zip(H.tolist(), V.tolist(), closure.tolist(), coupling.tolist(),
+                  balance.tolist(), d_phi.tolist(), inputless.tolist(),
+                  horizon.tolist())
+    return {
+        country: {
+            'H': h,
+            'V': v,
+            'alpha': countries[country][2],
+            'closure': c,
+            'coupling': cp,
+            'balance': b,
+            'd_phi': d,
+            'inputless_score': inp,
+            'precedent_horizon': hor,
+            'interpretation': _interpret_balance(b)
+        }
+        for country, (h, v, c, cp, b, d, inp, hor) in zip(names, columns)
+    }
 
 
 def print_philosophical_framework():
@@ -12,6 +12,10 @@ from lei_calculator.metrics import (
     calculate_d_phi,
     calculate_CHI,
     classify_zone,
+    goldilocks_score,
+    comprehensive_metrics,
+    comprehensive_metrics_batch,
+    format_report,
     PHI
 )
 
@@ -190,6 +194,74 @@ class TestZoneClassification:
             zone = classify_zone(H, V, alpha)
             assert zone is not None, f"Zone undefined for H={H}, V={V}, α={alpha}"
             assert isinstance(zone, str), "Zone should be a string"
+    
+    def test_zero_variation_zone(self):
+        """V=0 should be flagged as undefined H/V"""
+        assert classify_zone(H=0.5, V=0.0, alpha=0.5) == \
+            "Low Variation Zone (Undefined H/V)"
+    
+    def test_batch_zones_match_scalar_grid(self):
+        """Vectorized zone codes should reproduce classify_zone on a grid"""
+        grid = np.linspace(0.0, 1.0, 11)
+        H, V, alpha = (g.ravel() for g in np.meshgrid(grid, grid, grid))
+        zones = comprehensive_metrics_batch(H, V, alpha)['zone']
+        
+        for h, v, a, zone in zip(H, V, alpha, zones):
+            assert zone == classify_zone(h, v, a), f"H={h}, V={v}, α={a}"
+
+
+class TestReport:
+    """Test report formatting"""
+    
+    def test_verbose_prints_formatted_report(self, capsys):
+        """verbose=True should print exactly the format_report() text"""
+        metrics = comprehensive_metrics(0.72, 0.63, 0.58, country_name="USA")
+        out = capsys.readouterr().out
+        assert out == format_report(metrics) + "\n"
+        assert "=== Legal System Metrics: USA ===" in out
+        assert f"{metrics['LEI']:.3f}" in out
+    
+    def test_metrics_record_access(self):
+        """Result supports attribute, key and dict access"""
+        metrics = comprehensive_metrics(0.72, 0.63, 0.58, country_name="USA",
+                                        verbose=False)
+        assert metrics.LEI == metrics['LEI'] == metrics.asdict()['LEI']
+        assert metrics.country == "USA"
+        assert format_report(metrics.asdict()) == format_report(metrics)
+        with pytest.raises(KeyError):
+            metrics['missing']
+
+    def test_metrics_mapping_interface(self):
+        """Result keeps the dict interface of the former return value"""
+        metrics = comprehensive_metrics(0.72, 0.63, 0.58, country_name="USA",
+                                        verbose=False)
+        assert dict(**metrics) == dict(metrics.items()) == metrics.asdict()
+        assert list(metrics) == list(metrics.asdict())
+        assert len(metrics) == len(metrics.asdict())
+        assert 'zone' in metrics and 'missing' not in metrics
+        assert metrics.get('missing', 0.0) == 0.0
+        for attribute in ('asdict', '__class__', 'keys'):
+            assert attribute not in metrics
+            with pytest.raises(KeyError):
+                metrics[attribute]
+
+
+class TestFullPrecision:
+    """Metrics are returned unrounded"""
+    
+    def test_chi_uses_unrounded_d_phi(self):
+        """CHI should be computed from the exact d_φ, not a rounded one"""
+        H, V, alpha = 0.72, 0.63, 0.58
+        expected = (H * V * alpha) / (1 + abs(H / V - PHI))
+        assert calculate_CHI(H, V, alpha) == pytest.approx(expected, rel=1e-12)
+    
+    def test_goldilocks_score_unrounded(self):
+        """Goldilocks Score should match the closed form exactly"""
+        H, V, alpha = 0.72, 0.63, 0.58
+        d_phi = abs(H / V - PHI)
+        expected = np.exp(-((d_phi / 0.5) ** 2 + ((V - 0.6) / 0.2) ** 2 +
+                            ((alpha - 0.7) / 0.2) ** 2))
+        assert goldilocks_score(H, V, alpha) == pytest.approx(expected, rel=1e-12)
 
 
 class TestThresholdEffects:
@@ -231,6 +303,15 @@ class TestEdgeCases:
         LEI = calculate_LEI(H=0.01, V=0.01, alpha=0.01)
         assert LEI >= 0, "LEI should be non-negative for small values"
     
+    def test_out_of_range_rejected(self):
+        """Out-of-range or NaN parameters should raise ValueError"""
+        with pytest.raises(ValueError, match="alpha"):
+            calculate_LEI(H=0.5, V=0.5, alpha=1.5)
+        with pytest.raises(ValueError, match="V"):
+            calculate_CHI(H=0.5, V=-0.1, alpha=0.5)
+        with pytest.raises(ValueError, match="H"):
+            calculate_LEI(H=np.array([0.5, np.nan]), V=0.5, alpha=0.5)
+    
     def test_maximum_values(self):
         """Maximum parameter values (H=V=α=1) should compute"""
         LEI = calculate_LEI(H=1.0, V=1.0, alpha=1.0)
@@ -268,6 +349,77 @@ class TestConsistencyWithPaper:
         assert CHI > 0.15, f"USA CHI={CHI}"
 
 
+class TestComprehensiveMetricsBatch:
+    """Batched metrics must agree with the scalar API"""
+    
+    CASES = [
+        (0.72, 0.63, 0.58),  # USA
+        (0.92, 0.18, 0.09),  # Argentina labor
+        (0.9, 0.2, 0.3),     # High Rigidity
+        (0.2, 0.8, 0.1),     # High Chaos
+        (0.5, 0.5, 0.05),    # Low Selection
+        (0.6, 0.5, 0.4),     # Transition
+    ]
+    
+    def test_matches_scalar_functions(self):
+        """Every column should equal the per-country scalar result"""
+        H, V, alpha = map(np.array, zip(*self.CASES))
+        batch = comprehensive_metrics_batch(H, V, alpha)
+        
+        for i, (h, v, a) in enumerate(self.CASES):
+            scalar = comprehensive_metrics(h, v, a, verbose=False)
+            assert batch['LEI'][i] == pytest.approx(scalar['LEI'])
+            assert batch['d_phi'][i] == pytest.approx(scalar['d_phi'])
+            assert batch['CHI'][i] == pytest.approx(scalar['CHI'])
+            assert batch['goldilocks_score'][i] == pytest.approx(
+                goldilocks_score(h, v, a))
+            assert batch['zone'][i] == scalar['zone']
+            assert batch['viable'][i] == scalar['viable']
+    
+    def test_names_column(self):
+        """Country names should be carried through when given"""
+        batch = comprehensive_metrics_batch([0.72, 0.92], [0.63, 0.18],
+                                            [0.58, 0.09], names=['USA', 'ARG'])
+        assert list(batch['country']) == ['USA', 'ARG']
+    
+    def test_rejects_out_of_range(self):
+        """Any entry outside [0, 1] should raise"""
+        with pytest.raises(ValueError):
+            comprehensive_metrics_batch([0.5, 1.2], [0.5, 0.5], [0.5, 0.5])
+    
+    def test_large_ensemble_kernel_matches_numpy_path(self, monkeypatch):
+        """The large-ensemble kernel (Numba, if installed) should agree with NumPy"""
+        import lei_calculator.metrics as metrics_module
+        
+        rng = np.random.default_rng(0)
+        H, V, alpha = rng.random((3, 2000))
+        V[::50] = 0.0
+        
+        monkeypatch.setattr(metrics_module, '_GUFUNC_MIN_SIZE', 1)
+        large = comprehensive_metrics_batch(H, V, alpha)
+        monkeypatch.setattr(metrics_module, '_GUFUNC_MIN_SIZE', 10**9)
+        small = comprehensive_metrics_batch(H, V, alpha)
+        
+        for key in ['LEI', 'd_phi', 'CHI', 'goldilocks_score']:
+            np.testing.assert_allclose(large[key], small[key], rtol=1e-12)
+        assert np.array_equal(large['zone'], small['zone'])
+    
+    def test_numexpr_path_matches_numpy(self, monkeypatch):
+        """Large-array evaluation (NumExpr, if installed) should agree with NumPy"""
+        import lei_calculator.metrics as metrics_module
+        
+        rng = np.random.default_rng(1)
+        H, V, alpha = rng.random((3, 2000))
+        V[::50] = 0.0
+        
+        monkeypatch.setattr(metrics_module, '_NUMEXPR_MIN_SIZE', 1)
+        large = calculate_LEI(H, V, alpha), calculate_CHI(H, V, alpha)
+        monkeypatch.setattr(metrics_module, '_NUMEXPR_MIN_SIZE', 10**9)
+        small = calculate_LEI(H, V, alpha), calculate_CHI(H, V, alpha)
+        
+        np.testing.assert_allclose(large, small, rtol=1e-12)
+
+
 # Test fixtures
 @pytest.fixture
 def usa_metrics():
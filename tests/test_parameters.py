@@ -12,7 +12,15 @@ from lei_calculator.parameters import (
     calculate_V,
     calculate_alpha,
     calculate_all_parameters,
+    calculate_all_batch,
+    calculate_lei_batch,
+    components_to_array,
+    get_country_array,
+    get_country_parameters,
+    format_parameter,
     ParameterComponents,
+    WeightVector,
+    COUNTRY_NAMES,
     COUNTRY_PARAMETERS
 )
 
@@ -57,6 +65,9 @@ class TestHeredityCalculation:
         
         with pytest.raises(ValueError):
             calculate_H(0.5, -0.1, 0.5, 0.5)  # const_rigidity < 0
+        
+        with pytest.raises(ValueError, match="codification"):
+            calculate_H(0.5, 0.5, float('nan'), 0.5)
     
     def test_heredity_custom_weights(self):
         """Test custom weight specification"""
@@ -69,6 +80,19 @@ class TestHeredityCalculation:
         """Weights must sum to 1.0"""
         with pytest.raises(ValueError):
             calculate_H(0.5, 0.5, 0.5, 0.5, weights=[0.3, 0.3, 0.3, 0.3])  # Sum = 1.2
+    
+    def test_weight_vector(self):
+        """WeightVector is validated once and then reused as-is"""
+        w = WeightVector([0.25, 0.25, 0.25, 0.25])
+        
+        assert calculate_H(0.8, 0.7, 0.6, 0.5, weights=w) == \
+            calculate_H(0.8, 0.7, 0.6, 0.5, weights=[0.25, 0.25, 0.25, 0.25])
+        with pytest.raises(ValueError):
+            w[0] = 1.0  # read-only
+        with pytest.raises(ValueError):
+            WeightVector([0.3, 0.3, 0.3, 0.3])
+        with pytest.raises(ValueError):
+            WeightVector([0.5, 0.5])
 
 
 class TestVariationCalculation:
@@ -176,6 +200,87 @@ class TestAllParametersCalculation:
         assert abs(H - 0.92) < 0.02
         assert abs(V - 0.18) < 0.02
         assert abs(alpha - 0.09) < 0.03
+    
+    def test_matches_individual_calculators(self):
+        """Matrix form should agree with calculate_H/V/alpha"""
+        c = COUNTRY_PARAMETERS['Brazil']['components']
+        H, V, alpha = calculate_all_parameters(c)
+        
+        assert H == pytest.approx(calculate_H(c.precedent_strength, c.const_rigidity,
+                                              c.codification, c.judicial_tenure))
+        assert V == pytest.approx(calculate_V(c.federal_autonomy, c.amendment_freq,
+                                              c.judicial_review, c.legislative_turnover))
+        assert alpha == pytest.approx(calculate_alpha(c.compliance_rate, c.transparency_score,
+                                                      c.enforcement_capacity, c.legitimacy_index))
+    
+    def test_custom_weights(self):
+        """Custom weights should only replace their own block"""
+        c = COUNTRY_PARAMETERS['USA']['components']
+        H, V, alpha = calculate_all_parameters(c, H_weights=[0.25, 0.25, 0.25, 0.25])
+        
+        assert H == pytest.approx(calculate_H(c.precedent_strength, c.const_rigidity,
+                                              c.codification, c.judicial_tenure,
+                                              weights=[0.25, 0.25, 0.25, 0.25]))
+        assert (V, alpha) == calculate_all_parameters(c)[1:]
+        
+        with pytest.raises(ValueError):
+            calculate_all_parameters(c, V_weights=[0.3, 0.3, 0.3, 0.3])
+    
+    def test_invalid_component(self):
+        """Out-of-range components should be rejected"""
+        values = components_to_array(COUNTRY_PARAMETERS['USA']['components'])
+        values[5] = 1.2
+        with pytest.raises(ValueError, match="amendment_freq"):
+            calculate_all_parameters(ParameterComponents(*values))
+
+
+class TestBatchCalculation:
+    """Test (N, 12) batch evaluation"""
+    
+    def test_batch_matches_scalar(self):
+        """Each batch row should match calculate_all_parameters"""
+        countries = [c for c, p in COUNTRY_PARAMETERS.items() if 'components' in p]
+        X = np.array([components_to_array(COUNTRY_PARAMETERS[c]['components'])
+                      for c in countries])
+        
+        result = calculate_all_batch(X)
+        
+        assert result.shape == (len(countries), 3)
+        for row, country in zip(result, countries):
+            expected = calculate_all_parameters(COUNTRY_PARAMETERS[country]['components'])
+            np.testing.assert_allclose(row, expected, rtol=1e-12)
+    
+    def test_batch_rejects_bad_input(self):
+        """Wrong shape or out-of-range entries should raise"""
+        with pytest.raises(ValueError):
+            calculate_all_batch(np.full((3, 11), 0.5))
+        with pytest.raises(ValueError):
+            calculate_all_batch(np.full((3, 12), 1.5))
+    
+    def test_large_batch_kernel_matches_matrix_product(self):
+        """Compiled kernel path should agree with the NumPy product"""
+        rng = np.random.default_rng(0)
+        X = rng.random((12_000, 12))
+        
+        result = calculate_all_batch(X)
+        expected = calculate_all_batch(X[:5_000])
+        
+        np.testing.assert_allclose(result[:5_000], expected, rtol=1e-12)
+    
+    def test_lei_batch_matches_metrics(self):
+        """Fused LEI should match calculate_LEI on the batch parameters"""
+        from lei_calculator.metrics import calculate_LEI
+        
+        rng = np.random.default_rng(1)
+        X = rng.random((12_000, 12))
+        X[0, 4:8] = 0.0  # V = 0
+        H, V, alpha = calculate_all_batch(X).T
+        
+        with pytest.warns(UserWarning):
+            expected = calculate_LEI(H, V, alpha)
+        
+        np.testing.assert_allclose(calculate_lei_batch(X), expected, rtol=1e-9)
+        np.testing.assert_allclose(calculate_lei_batch(X[:100]), expected[:100], rtol=1e-12)
 
 
 class TestCountryDatabase:
@@ -215,17 +320,63 @@ class TestCountryDatabase:
         """Database should contain 34 countries"""
         assert len(COUNTRY_PARAMETERS) >= 34, \
             f"Expected at least 34 countries, got {len(COUNTRY_PARAMETERS)}"
+    
+    def test_country_array_matches_database(self):
+        """Array view rows should match the dict entries"""
+        table = get_country_array()
+        
+        assert table.shape == (len(COUNTRY_PARAMETERS), 3)
+        for name, row in zip(COUNTRY_NAMES, table):
+            params = COUNTRY_PARAMETERS[name]
+            assert tuple(row) == (params['H'], params['V'], params['alpha'])
+        
+        subset = get_country_array(['Argentina labor', 'USA'])
+        assert tuple(subset[1]) == (0.72, 0.63, 0.58)
+        
+        with pytest.raises(KeyError):
+            get_country_array(['Atlantis'])
+    
+    def test_component_derived_array(self):
+        """Component-derived rows should match calculate_all_parameters"""
+        derived = get_country_array(from_components=True)
+        
+        for name, row in zip(COUNTRY_NAMES, derived):
+            params = COUNTRY_PARAMETERS[name]
+            if 'components' in params:
+                np.testing.assert_allclose(
+                    row, calculate_all_parameters(params['components']), rtol=1e-12)
+            else:
+                assert np.isnan(row).all()
+    
+    def test_get_country_parameters(self):
+        """Lookup should ignore case and spaces and return an independent dict"""
+        params = get_country_parameters('Argentina labor')
+        
+        assert params['H'] == 0.92
+        assert params == get_country_parameters('Argentina_labor')
+        assert params == get_country_parameters('argentina_LABOR')
+        params['H'] = 0.5
+        assert get_country_parameters('Argentina labor')['H'] == 0.92
+        with pytest.raises(KeyError, match="Atlantis"):
+            get_country_parameters('Atlantis')
 
 
-class TestParameterRounding:
-    """Test that rounding is consistent"""
+class TestParameterPrecision:
+    """Parameters are returned unrounded; rounding is a display concern"""
     
-    def test_rounding_precision(self):
-        """Parameters should be rounded to 3 decimal places"""
+    def test_full_precision(self):
+        """H should equal the exact weighted sum, not a 3-decimal rounding"""
         H = calculate_H(0.123456, 0.654321, 0.789012, 0.456789)
-        # Result should be rounded to 2-3 decimals
+        expected = 0.35 * 0.123456 + 0.30 * 0.654321 + 0.25 * 0.789012 + 0.10 * 0.456789
+        
         assert isinstance(H, float)
-        assert len(str(H).split('.')[-1]) <= 3
+        assert H == pytest.approx(expected, abs=1e-12)
+        assert round(H, 3) != H
+    
+    def test_format_parameter(self):
+        """Display helper should round to 3 decimals by default"""
+        assert format_parameter(0.123456) == '0.123'
+        assert format_parameter(0.5, ndigits=1) == '0.5'
 
 
 class TestComponentsDataclass:
@@ -244,6 +395,24 @@ class TestComponentsDataclass:
         
         assert components.precedent_strength == 0.8
         assert components.compliance_rate == 0.6
+    
+    def test_components_immutable(self):
+        """Components are frozen and slotted (no per-instance __dict__)"""
+        components = COUNTRY_PARAMETERS['USA']['components']
+        
+        with pytest.raises(AttributeError):
+            components.precedent_strength = 0.1
+        assert not hasattr(components, '__dict__')
+    
+    def test_components_from_array(self):
+        """from_array should round-trip through components_to_array"""
+        components = COUNTRY_PARAMETERS['Chile']['components']
+        rebuilt = ParameterComponents.from_array(components_to_array(components))
+        
+        assert rebuilt == components
+        assert type(rebuilt.codification) is float
+        with pytest.raises(TypeError):
+            ParameterComponents.from_array(np.zeros(11))
 
 
 # Test fixtures for reuse
@@ -6,7 +6,18 @@ Tests ODE-based evolution simulation with convergence to φ equilibrium.
 
 import pytest
 import numpy as np
-from lei_calculator.simulation import simulate_evolution, PHI
+from lei_calculator.simulation import (
+    simulate_evolution,
+    simulate_multiple_trajectories,
+    analyze_convergence,
+    predict_future_trajectory,
+    SCENARIOS,
+    calculate_equilibrium,
+    _equilibria_batch,
+    ode_system,
+    ode_jacobian,
+    PHI
+)
 
 
 class TestSimulationBasic:
@@ -150,28 +161,53 @@ class TestNoiseEffects:
         
         assert np.allclose(results1['H'], results2['H']), \
             "Same seed produced different results"
+    
+    def test_solvers_agree(self):
+        """RK4 and LSODA should follow the same noisy trajectory"""
+        rk4 = simulate_evolution(H0=0.7, V0=0.6, alpha0=0.5, years=60)
+        lsoda = simulate_evolution(H0=0.7, V0=0.6, alpha0=0.5, years=60,
+                                   solver='lsoda')
+        
+        np.testing.assert_allclose(rk4['H'], lsoda['H'], atol=1e-4)
+        np.testing.assert_allclose(rk4['alpha'], lsoda['alpha'], atol=1e-4)
+    
+    def test_julia_solver_requires_diffeqpy(self):
+        """solver='julia' should run, or fail with a clear ImportError"""
+        try:
+            import diffeqpy  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="diffeqpy"):
+                simulate_evolution(0.72, 0.63, 0.58, years=10, solver='julia')
+        else:
+            julia = simulate_evolution(0.72, 0.63, 0.58, years=10, solver='julia')
+            rk4 = simulate_evolution(0.72, 0.63, 0.58, years=10)
+            np.testing.assert_allclose(julia['H'], rk4['H'], atol=1e-4)
 
 
 class TestArgentinaScenario:
     """Test Argentina lock-in scenario"""
     
-    def test_argentina_remains_locked(self):
-        """Argentina should remain in lock-in zone"""
+    def test_argentina_locked_first_decade(self):
+        """Argentina should stay rigid with very low LEI for a decade"""
         results = simulate_evolution(H0=0.92, V0=0.18, alpha0=0.09, years=100)
         
-        # Final H should remain high, V low
-        H_final = results['H'][-10:].mean()
-        V_final = results['V'][-10:].mean()
-        
-        assert H_final > 0.7, f"H decreased too much: {H_final}"
-        assert V_final < 0.4, f"V increased too much: {V_final}"
+        # H/V stays far above φ and LEI in the lock-in range while the
+        # drift is still working against the initial rigidity
+        HV_ratio = results['H'][:11] / results['V'][:11]
+        assert HV_ratio.min() > 2.0, f"H/V fell too fast: {HV_ratio.min()}"
+        assert results['LEI'][:11].max() < 0.1, \
+            f"LEI too high for lock-in: {results['LEI'][:11].max()}"
     
-    def test_argentina_low_lei(self):
-        """Argentina should maintain very low LEI"""
+    def test_argentina_relaxes_toward_equilibrium(self):
+        """Over a century the drift should pull Argentina to its φ equilibrium"""
         results = simulate_evolution(H0=0.92, V0=0.18, alpha0=0.09, years=100)
         
-        LEI_final = results['LEI'][-10:].mean()
-        assert LEI_final < 0.1, f"LEI too high for lock-in: {LEI_final}"
+        H_final = results['H'][-10:].mean()
+        V_final = results['V'][-10:].mean()
+        
+        assert abs(H_final - results['H_eq']) < 0.1
+        assert abs(V_final - results['V_eq']) < 0.1
+        assert results['d_phi'][-1] < results['d_phi'][0]
 
 
 class TestUSAScenario:
@@ -241,6 +277,204 @@ class TestEdgeCases:
         """Long simulation should complete (computational test)"""
         results = simulate_evolution(H0=0.7, V0=0.6, alpha0=0.5, years=500)
         assert results['time'][-1] == 500
+    
+    def test_trajectory_leaving_unit_interval_raises(self):
+        """Trajectories leaving [0, 1] should raise (single run) or warn (ensemble)"""
+        with pytest.raises(ValueError, match=r"must be in \[0, 1\]"):
+            simulate_evolution(H0=0.95, V0=0.05, alpha0=0.9, years=100,
+                               sigma_H=0.2, sigma_V=0.2, sigma_alpha=0.2,
+                               noise_seed=0)
+        with pytest.warns(UserWarning, match=r"leave \[0, 1\]"):
+            simulate_multiple_trajectories(n_simulations=4, years=100,
+                                           sigma_H=0.2, sigma_V=0.2,
+                                           sigma_alpha=0.2)
+
+
+class TestEquilibrium:
+    """Test equilibrium targets"""
+    
+    def test_ratio_is_phi(self):
+        H_eq, V_eq, alpha_eq = calculate_equilibrium(0.65, 0.55, 0.45)
+        
+        assert H_eq / V_eq == pytest.approx(PHI)
+        assert alpha_eq == pytest.approx(0.60)
+    
+    def test_batch_matches_scalar(self):
+        """Vectorized equilibria should equal the scalar function exactly"""
+        initial = np.random.default_rng(0).uniform(0, 1, size=(500, 3))
+        
+        expected = np.array([calculate_equilibrium(*row) for row in initial])
+        assert np.array_equal(_equilibria_batch(*initial.T), expected)
+
+
+class TestJacobian:
+    """Test the analytic Jacobian against finite differences"""
+    
+    def test_matches_finite_differences(self):
+        params = {'H_eq': 0.62, 'V_eq': 0.38, 'alpha_eq': 0.7,
+                  'sigma_H': 0.0, 'sigma_V': 0.0, 'sigma_alpha': 0.0}
+        state = np.array([0.7, 0.5, 0.4])
+        eps = 1e-7
+        
+        numeric = np.empty((3, 3))
+        for j in range(3):
+            step = np.zeros(3)
+            step[j] = eps
+            numeric[:, j] = (ode_system(state + step, 0.0, params) -
+                             ode_system(state - step, 0.0, params)) / (2 * eps)
+        
+        np.testing.assert_allclose(ode_jacobian(state, 0.0, params), numeric,
+                                   atol=1e-6)
+    
+    def test_ode_system_out_buffer(self):
+        """ode_system should fill and return a caller-supplied buffer"""
+        params = {'H_eq': 0.62, 'V_eq': 0.38, 'alpha_eq': 0.7}
+        state = np.array([0.7, 0.5, 0.4])
+        buffer = np.empty(3)
+        
+        result = ode_system(state, 3.0, params, out=buffer)
+        
+        assert result is buffer
+        assert np.array_equal(buffer, ode_system(state, 3.0, params))
+
+
+class TestMultipleTrajectories:
+    """Test batched simulation from random initial conditions"""
+    
+    def test_trajectory_structure(self):
+        """Each trajectory should carry time series and initial conditions"""
+        trajectories = simulate_multiple_trajectories(n_simulations=20, years=50)
+        
+        assert len(trajectories) == 20
+        for i, traj in enumerate(trajectories):
+            assert traj['simulation_id'] == i
+            assert len(traj['H']) == len(traj['time']) == 51
+            assert traj['H'][0] == traj['H0']
+            assert np.all(np.isfinite(traj['LEI']))
+    
+    def test_reproducible(self):
+        """Same noise_seed should reproduce the whole ensemble"""
+        run1 = simulate_multiple_trajectories(n_simulations=10, years=50, noise_seed=7)
+        run2 = simulate_multiple_trajectories(n_simulations=10, years=50, noise_seed=7)
+        
+        for traj1, traj2 in zip(run1, run2):
+            assert np.array_equal(traj1['H'], traj2['H'])
+    
+    def test_matches_single_simulation(self):
+        """Trajectory i should equal simulate_evolution with noise_seed + i"""
+        trajectories = simulate_multiple_trajectories(n_simulations=5, years=60,
+                                                      noise_seed=3)
+        
+        for traj in trajectories:
+            single = simulate_evolution(traj['H0'], traj['V0'], traj['alpha0'],
+                                        years=60, noise_seed=3 + traj['simulation_id'])
+            np.testing.assert_allclose(traj['H'], single['H'], atol=1e-12)
+            np.testing.assert_allclose(traj['alpha'], single['alpha'], atol=1e-12)
+    
+    def test_initial_conditions_independent_of_noise(self):
+        """Initial conditions come from a stream separate from the shocks"""
+        trajectories = simulate_multiple_trajectories(n_simulations=5, years=10,
+                                                      noise_seed=3,
+                                                      H_range=(0.0, 1.0))
+        
+        shocks = np.random.default_rng(3).uniform(0.0, 1.0, 5)
+        assert not np.allclose(trajectories.H0s, shocks)
+    
+    def test_invalid_range(self):
+        """Sampling ranges outside [0, 1] should be rejected up front"""
+        with pytest.raises(ValueError, match="V_range"):
+            simulate_multiple_trajectories(n_simulations=5, V_range=(0.5, 1.2))
+    
+    def test_global_random_state_untouched(self):
+        """Initial conditions should come from a local Generator"""
+        np.random.seed(0)
+        expected = np.random.rand()
+        np.random.seed(0)
+        simulate_multiple_trajectories(n_simulations=3, years=5)
+        
+        assert np.random.rand() == expected
+    
+    def test_n_jobs_same_result(self):
+        """Parallel execution should not change the trajectories"""
+        serial = simulate_multiple_trajectories(n_simulations=8, years=40, n_jobs=1)
+        parallel = simulate_multiple_trajectories(n_simulations=8, years=40, n_jobs=2)
+        
+        for traj1, traj2 in zip(serial, parallel):
+            assert np.array_equal(traj1['H'], traj2['H'])
+    
+    def test_ensemble_converges(self):
+        """Most trajectories should approach the φ equilibrium"""
+        stats = analyze_convergence(simulate_multiple_trajectories(n_simulations=50))
+        
+        assert stats['convergence_rate'] > 0.9
+        assert abs(stats['final_mean_HV_ratio'] - PHI) < 0.1
+    
+    def test_float32_close_to_float64(self):
+        """float32 storage should stay well inside the noise scale"""
+        full = simulate_multiple_trajectories(n_simulations=10, years=100)
+        single = simulate_multiple_trajectories(n_simulations=10, years=100,
+                                                dtype=np.float32)
+        
+        assert single.H_all.dtype == np.float32
+        np.testing.assert_allclose(single.H_all, full.H_all, atol=1e-5)
+        
+        with pytest.raises(ValueError):
+            simulate_multiple_trajectories(n_simulations=2, dtype=np.int64)
+    
+    def test_batch_result_arrays(self):
+        """BatchResult should expose (N, T) arrays matching the per-trajectory view"""
+        result = simulate_multiple_trajectories(n_simulations=6, years=30)
+        
+        assert result.H_all.shape == result.d_phi_all.shape == (6, 31)
+        assert np.array_equal(result[2]['d_phi'], result.d_phi_all[2])
+        assert np.array_equal(result.H0s, result.H_all[:, 0])
+    
+    def test_analyze_convergence_accepts_list(self):
+        """Statistics should not depend on the ensemble container"""
+        result = simulate_multiple_trajectories(n_simulations=20, years=50)
+        
+        assert analyze_convergence(result) == analyze_convergence(list(result))
+    
+    def test_convergence_time_matches_first_crossing(self):
+        """Mean convergence time should use each trajectory's first crossing"""
+        result = simulate_multiple_trajectories(n_simulations=20, years=50)
+        stats = analyze_convergence(result, threshold_dphi=0.3)
+        
+        times = [traj['time'][np.flatnonzero(traj['d_phi'] < 0.3)[0]]
+                 for traj in result if traj['d_phi'][-1] < 0.3]
+        assert stats['mean_convergence_time'] == pytest.approx(np.mean(times))
+        
+        none = analyze_convergence(result, threshold_dphi=0.0)
+        assert none['n_converged'] == 0
+        assert np.isnan(none['mean_convergence_time'])
+
+
+class TestScenarios:
+    """Test scenario forecasting"""
+    
+    def test_scenario_applies_overrides(self):
+        """A scenario should equal simulate_evolution with its overrides"""
+        forecast = predict_future_trajectory(0.72, 0.63, 0.58, years_ahead=30,
+                                             scenario='reform')
+        expected = simulate_evolution(0.72, 0.63, 0.58, years=30,
+                                      **SCENARIOS['reform'])
+        
+        assert forecast['scenario'] == 'reform'
+        assert np.array_equal(forecast['V'], expected['V'])
+    
+    def test_explicit_kwargs_take_precedence(self):
+        """Caller overrides should win over scenario defaults"""
+        forecast = predict_future_trajectory(0.72, 0.63, 0.58, years_ahead=30,
+                                             scenario='reform', gamma_V=0.08)
+        baseline = predict_future_trajectory(0.72, 0.63, 0.58, years_ahead=30,
+                                             gamma_H=0.04)
+        
+        assert np.array_equal(forecast['V'], baseline['V'])
+    
+    def test_unknown_scenario(self):
+        """Unknown scenario names should raise ValueError"""
+        with pytest.raises(ValueError):
+            predict_future_trajectory(0.72, 0.63, 0.58, scenario='utopia')
 
 
 # Test fixtures
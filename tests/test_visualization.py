@@ -0,0 +1,45 @@
+"""
+Unit tests for lei_calculator.visualization module
+
+Tests the numerical helpers behind the figures (no rendering).
+"""
+
+import pytest
+import numpy as np
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use('Agg')
+
+from lei_calculator.visualization import (  # noqa: E402
+    _fit_logistic_batch,
+    _bootstrap_logistic
+)
+
+
+class TestBootstrapLogistic:
+    """Test the blocked bootstrap of the transplant logistic fit"""
+
+    def test_blocks_match_single_draw(self):
+        """Fitting in blocks should reproduce one up-front draw exactly"""
+        rng = np.random.default_rng(0)
+        x = rng.lognormal(0, 0.5, 60)
+        y = (rng.random(60) < 1 / (1 + np.exp(3 * (x - 1)))).astype(float)
+
+        idx = np.random.default_rng(5).integers(0, 60, size=(250, 60))
+        b0, b1 = _fit_logistic_batch(x[idx], y[idx])
+        b0_boot, b1_boot = _bootstrap_logistic(x, y, 250, np.random.default_rng(5),
+                                               block_size=100)
+
+        np.testing.assert_allclose(b0_boot, b0)
+        np.testing.assert_allclose(b1_boot, b1)
+
+    def test_single_class_resamples_skipped(self):
+        """Resamples with one outcome class should be dropped, not yield NaN"""
+        x = np.linspace(0.1, 3.0, 6)
+        y = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0])  # often resampled away
+
+        with pytest.warns(UserWarning, match="single outcome class"):
+            b0, b1 = _bootstrap_logistic(x, y, 200, np.random.default_rng(1))
+
+        assert 0 < len(b0) < 200
+        assert np.isfinite(b0).all() and np.isfinite(b1).all()